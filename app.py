@@ -6,47 +6,52 @@ import os
 import sys
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse, HTMLResponse, FileResponse
+from fastapi.responses import RedirectResponse, HTMLResponse
 
 # Import l'application depuis le module backend
 from backend.main import app as backend_app
+from backend.config import get_settings
+from backend.services.static_assets import StaticAssets
 
 # Configuration de l'application
 app = backend_app
 
-# Monter les fichiers statiques du frontend
-app.mount("/css", StaticFiles(directory="frontend/css"), name="css")
-app.mount("/js", StaticFiles(directory="frontend/js"), name="js")
+# Fichiers du frontend chargés une fois en mémoire (page, styles, scripts)
+static_assets = StaticAssets("frontend", reload=get_settings().static_reload)
+
+# Feuilles de style et scripts du frontend
+@app.get("/css/{path:path}", include_in_schema=False)
+@app.get("/js/{path:path}", include_in_schema=False)
+async def read_asset(request: Request, path: str):
+    await static_assets.refresh()
+    asset = static_assets.get(request.url.path.lstrip("/"))
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return static_assets.versioned_response(request, asset)
 
 # Route racine qui sert index.html
 @app.get("/", response_class=HTMLResponse)
-async def read_root():
-    with open("frontend/index.html", "r", encoding="utf-8") as f:
-        return HTMLResponse(content=f.read())
+async def read_root(request: Request):
+    await static_assets.refresh()
+    return static_assets.response(request, static_assets.get("index.html"))
 
 # Route catch-all pour servir index.html pour toutes les routes qui ne correspondent pas aux API
 # Cela permet de gérer les routes côté frontend (SPA)
 @app.get("/{path:path}", response_class=HTMLResponse)
-async def catch_all(path: str):
+async def catch_all(request: Request, path: str):
     # Ne pas interférer avec les routes API
     if path.startswith("api/"):
         raise HTTPException(status_code=404, detail="Not Found")
     
-    # Vérifier si le chemin demandé est un fichier HTML existant
-    requested_file = f"frontend/{path}"
-    if os.path.exists(requested_file) and os.path.isfile(requested_file):
-        with open(requested_file, "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
+    await static_assets.refresh()
+    
+    # Servir le fichier du frontend demandé s'il existe (favicon, autre page HTML...)
+    asset = static_assets.get(path)
+    if asset is not None:
+        return static_assets.response(request, asset)
     
     # Par défaut, renvoyer index.html pour le routing côté client
-    with open("frontend/index.html", "r", encoding="utf-8") as f:
-        return HTMLResponse(content=f.read())
-
-# Favicon
-@app.get("/favicon.ico", include_in_schema=False)
-async def get_favicon():
-    return FileResponse("frontend/favicon.ico")
+    return static_assets.response(request, static_assets.get("index.html"))
 
 # Si ce fichier est exécuté directement, démarrer le serveur
 if __name__ == "__main__":
@@ -20,6 +20,56 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60 * 24 * 7  # 7 jours
     
+    # Configuration de la correspondance entre objets perdus et trouvés
+    # "scored" : pertinence BM25 avec seuil et top-K, "legacy" : au moins 2 mots clés communs
+    match_mode: str = os.getenv("MATCH_MODE", "scored")
+    match_min_score: float = float(os.getenv("MATCH_MIN_SCORE", "0"))
+    match_top_k: int = int(os.getenv("MATCH_TOP_K", "10"))
+    # Tolérance aux fautes de frappe : les mots clés dont la similarité de trigrammes
+    # dépasse ce seuil sont considérés comme proches (ignorée en mode "legacy")
+    match_fuzzy: bool = os.getenv("MATCH_FUZZY", "True").lower() in ("true", "1", "t")
+    match_fuzzy_min_similarity: float = float(os.getenv("MATCH_FUZZY_MIN_SIMILARITY", "0.3"))
+    # Fenêtre de dates : un objet est comparé aux objets trouvés entre N jours avant
+    # et M jours après sa perte (ignorée en mode "legacy")
+    match_window_days_before: int = int(os.getenv("MATCH_WINDOW_DAYS_BEFORE", "1"))
+    match_window_days_after: int = int(os.getenv("MATCH_WINDOW_DAYS_AFTER", "7"))
+    # Délai de regroupement des recalculs successifs d'un même objet (en secondes)
+    match_debounce_seconds: float = float(os.getenv("MATCH_DEBOUNCE_SECONDS", "0.5"))
+    
+    # Cache en mémoire des objets et des pages de listes formatés
+    cache_enabled: bool = os.getenv("CACHE_ENABLED", "True").lower() in ("true", "1", "t")
+    cache_max_items: int = int(os.getenv("CACHE_MAX_ITEMS", "5000"))
+    cache_max_pages: int = int(os.getenv("CACHE_MAX_PAGES", "500"))
+    cache_ttl_seconds: float = float(os.getenv("CACHE_TTL_SECONDS", "60"))
+    
+    # Encodage direct des listes en JSON (orjson s'il est installé), sans revalidation pydantic
+    fast_serialization: bool = os.getenv("FAST_SERIALIZATION", "True").lower() in ("true", "1", "t")
+    
+    # Durée de conservation du journal des modifications (synchronisation incrémentale)
+    # et intervalle de la purge périodique faite par le worker de correspondance (en secondes)
+    changes_retention_days: int = int(os.getenv("CHANGES_RETENTION_DAYS", "7"))
+    changes_prune_interval_seconds: float = float(os.getenv("CHANGES_PRUNE_INTERVAL_SECONDS", "3600"))
+    
+    # Notifications en temps réel (Server-Sent Events) : connexions simultanées maximales,
+    # événements en attente par client et intervalle des messages de maintien de connexion
+    events_max_connections: int = int(os.getenv("EVENTS_MAX_CONNECTIONS", "200"))
+    events_queue_size: int = int(os.getenv("EVENTS_QUEUE_SIZE", "256"))
+    events_heartbeat_seconds: float = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", "15"))
+    
+    # Compression des réponses de l'API : encodages par ordre de préférence (zstd et br
+    # nécessitent les paquets zstandard et brotli), taille minimale, taille à partir de
+    # laquelle la compression est faite hors de la boucle d'événements, et niveaux
+    compression_enabled: bool = os.getenv("COMPRESSION_ENABLED", "True").lower() in ("true", "1", "t")
+    compression_encodings: str = os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip")
+    compression_min_size: int = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    compression_offload_min_size: int = int(os.getenv("COMPRESSION_OFFLOAD_MIN_SIZE", "65536"))
+    compression_gzip_level: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    compression_brotli_level: int = int(os.getenv("COMPRESSION_BROTLI_LEVEL", "4"))
+    compression_zstd_level: int = int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3"))
+    
+    # Rechargement des fichiers du frontend servis depuis la mémoire lorsqu'ils changent (développement)
+    static_reload: bool = os.getenv("STATIC_RELOAD", "False").lower() in ("true", "1", "t")
+    
     # Mode debug
     debug: bool = os.getenv("DEBUG", "True").lower() in ("true", "1", "t")
     
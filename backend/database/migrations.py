@@ -0,0 +1,117 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from ..services.date_parsing import parse_item_date
+from ..services.text_processing import tokenize, serialize_tokens
+
+# Colonnes ajoutées après la création initiale des tables.
+# Base.metadata.create_all ne modifie pas les tables existantes : ces colonnes
+# sont donc ajoutées ici si elles sont absentes.
+ADDED_COLUMNS = [
+    ("possible_matches", "score", "FLOAT DEFAULT 0"),
+    ("found_items", "match_status", "VARCHAR DEFAULT 'ready'"),
+    ("lost_items", "match_status", "VARCHAR DEFAULT 'ready'"),
+    ("found_items", "tokens", "TEXT"),
+    ("lost_items", "tokens", "TEXT"),
+    ("found_items", "found_on", "DATE"),
+    ("lost_items", "lost_on", "DATE"),
+    ("found_items", "updated_at", "TIMESTAMP"),
+    ("lost_items", "updated_at", "TIMESTAMP"),
+]
+
+# Index ajoutés après la création initiale (create_all ne les crée pas sur une table existante)
+ADDED_INDEXES = [
+    ("ix_found_items_found_on", "found_items", "found_on"),
+    ("ix_lost_items_lost_on", "lost_items", "lost_on"),
+    ("ix_found_items_created_at_id", "found_items", "created_at, id"),
+    ("ix_lost_items_created_at_id", "lost_items", "created_at, id"),
+    ("ix_possible_matches_found_item_id", "possible_matches", "found_item_id"),
+    ("ix_possible_matches_lost_item_id", "possible_matches", "lost_item_id"),
+]
+
+
+def _backfill_tokens(connection: Connection, table: str):
+    """
+    Calcule les mots clés normalisés des objets créés avant leur introduction
+    """
+    rows = connection.execute(
+        text(f"SELECT id, description FROM {table} WHERE tokens IS NULL")
+    ).fetchall()
+    if rows:
+        connection.execute(
+            text(f"UPDATE {table} SET tokens = :tokens WHERE id = :id"),
+            [{"id": item_id, "tokens": serialize_tokens(tokenize(description))} for item_id, description in rows]
+        )
+
+
+def _backfill_dates(connection: Connection, table: str, date_column: str, parsed_column: str):
+    """
+    Convertit les dates saisies (texte libre) des objets existants
+    """
+    rows = connection.execute(
+        text(f"SELECT id, {date_column} FROM {table} WHERE {parsed_column} IS NULL AND {date_column} IS NOT NULL")
+    ).fetchall()
+    parsed_rows = [
+        {"id": item_id, "parsed": parse_item_date(value)} for item_id, value in rows
+    ]
+    parsed_rows = [row for row in parsed_rows if row["parsed"] is not None]
+    if parsed_rows:
+        connection.execute(
+            text(f"UPDATE {table} SET {parsed_column} = :parsed WHERE id = :id"),
+            parsed_rows
+        )
+
+
+def run_migrations(engine: Engine):
+    """
+    Applique les migrations de schéma manquantes (idempotent)
+    """
+    inspector = inspect(engine)
+    added_columns = set()
+    
+    with engine.begin() as connection:
+        for table, column, definition in ADDED_COLUMNS:
+            existing_columns = {c["name"] for c in inspector.get_columns(table)}
+            if column not in existing_columns:
+                connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {definition}"))
+                added_columns.add((table, column))
+        
+        for index_name, table, column in ADDED_INDEXES:
+            connection.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({column})"))
+        
+        for table in ("found_items", "lost_items"):
+            _backfill_tokens(connection, table)
+        
+        for table in ("found_items", "lost_items"):
+            if (table, "updated_at") in added_columns:
+                connection.execute(text(f"UPDATE {table} SET updated_at = created_at"))
+        
+        if ("found_items", "found_on") in added_columns:
+            _backfill_dates(connection, "found_items", "found_date", "found_on")
+        if ("lost_items", "lost_on") in added_columns:
+            _backfill_dates(connection, "lost_items", "lost_date", "lost_on")
+        
+        # L'index des mots clés construit avant la normalisation sera reconstruit au démarrage
+        if ("found_items", "tokens") in added_columns or ("lost_items", "tokens") in added_columns:
+            connection.execute(text("DELETE FROM keyword_index"))
+
+
+def setup_pg_trgm(engine: Engine) -> bool:
+    """
+    Active l'extension PostgreSQL pg_trgm et son index sur les mots clés.
+    Renvoie False si elle n'est pas disponible (autre base, droits insuffisants).
+    """
+    if engine.dialect.name != "postgresql":
+        return False
+    
+    try:
+        with engine.begin() as connection:
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            connection.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_keyword_index_token_trgm "
+                "ON keyword_index USING gin (token gin_trgm_ops)"
+            ))
+        return True
+    except Exception as e:
+        print(f"Extension pg_trgm indisponible, index de trigrammes intégré utilisé: {e}")
+        return False
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Table, Text, Boolean
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Table, Text, Boolean, Float, Index, BigInteger
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -6,12 +6,20 @@ import uuid
 
 Base = declarative_base()
 
+# États du calcul des correspondances d'un objet
+MATCH_STATUS_PENDING = "pending"
+MATCH_STATUS_READY = "ready"
+
 # Table d'association pour les correspondances possibles entre objets perdus et trouvés
 possible_matches = Table(
     'possible_matches',
     Base.metadata,
     Column('found_item_id', String, ForeignKey('found_items.id')),
-    Column('lost_item_id', String, ForeignKey('lost_items.id'))
+    Column('lost_item_id', String, ForeignKey('lost_items.id')),
+    Column('score', Float, default=0.0),  # Pertinence de la correspondance
+    # Correspondances d'un objet (listes, nombre de correspondances)
+    Index('ix_possible_matches_found_item_id', 'found_item_id'),
+    Index('ix_possible_matches_lost_item_id', 'lost_item_id')
 )
 
 class User(Base):
@@ -28,22 +36,33 @@ class User(Base):
 
 class FoundItem(Base):
     __tablename__ = 'found_items'
+    __table_args__ = (
+        # Pagination par curseur sur (created_at, id)
+        Index("ix_found_items_created_at_id", "created_at", "id"),
+    )
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     description = Column(String, index=True)
+    tokens = Column(Text, nullable=True)  # Mots clés normalisés de la description
     found_date = Column(String)
+    found_on = Column(Date, nullable=True, index=True)  # found_date convertie en date
     found_time = Column(String)
     location = Column(String)
     content_info = Column(Text, nullable=True)
     image_filename = Column(String, nullable=True)
     image_url = Column(String, nullable=True)  # URL de l'image sur S3
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    match_status = Column(String, default=MATCH_STATUS_READY)
     
-    # Relation avec les objets perdus qui pourraient correspondre
+    # Relation avec les objets perdus qui pourraient correspondre, par pertinence décroissante
+    # (en lecture seule : les correspondances sont écrites par MatchRepository)
     possible_lost_items = relationship(
         "LostItem",
         secondary=possible_matches,
-        back_populates="possible_found_items"
+        back_populates="possible_found_items",
+        order_by=possible_matches.c.score.desc(),
+        viewonly=True
     )
     
     def __repr__(self):
@@ -51,21 +70,110 @@ class FoundItem(Base):
 
 class LostItem(Base):
     __tablename__ = 'lost_items'
+    __table_args__ = (
+        # Pagination par curseur sur (created_at, id)
+        Index("ix_lost_items_created_at_id", "created_at", "id"),
+    )
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     description = Column(String, index=True)
+    tokens = Column(Text, nullable=True)  # Mots clés normalisés de la description
     lost_date = Column(String)
+    lost_on = Column(Date, nullable=True, index=True)  # lost_date convertie en date
     lost_time = Column(String)
     location = Column(String)
     content_info = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    match_status = Column(String, default=MATCH_STATUS_READY)
     
-    # Relation avec les objets trouvés qui pourraient correspondre
+    # Relation avec les objets trouvés qui pourraient correspondre, par pertinence décroissante
+    # (en lecture seule : les correspondances sont écrites par MatchRepository)
     possible_found_items = relationship(
         "FoundItem",
         secondary=possible_matches,
-        back_populates="possible_lost_items"
+        back_populates="possible_lost_items",
+        order_by=possible_matches.c.score.desc(),
+        viewonly=True
     )
     
     def __repr__(self):
         return f"<LostItem {self.description}>"
+
+class KeywordIndex(Base):
+    """
+    Index inversé des mots clés : associe chaque mot clé normalisé aux objets
+    (trouvés ou perdus) dont la description le contient
+    """
+    __tablename__ = 'keyword_index'
+    
+    token = Column(String, primary_key=True)
+    item_type = Column(String, primary_key=True)  # "found" ou "lost"
+    item_id = Column(String, primary_key=True, index=True)
+    
+    def __repr__(self):
+        return f"<KeywordIndex {self.token} -> {self.item_type}:{self.item_id}>"
+
+class TokenTrigram(Base):
+    """
+    Trigrammes de caractères du vocabulaire des mots clés, pour retrouver les mots
+    proches d'un mot mal orthographié (utilisé lorsque pg_trgm n'est pas disponible)
+    """
+    __tablename__ = 'token_trigrams'
+    
+    trigram = Column(String, primary_key=True)
+    token = Column(String, primary_key=True, index=True)
+    
+    def __repr__(self):
+        return f"<TokenTrigram {self.trigram} -> {self.token}>"
+
+class CollectionVersion(Base):
+    """
+    Version de chaque collection d'objets ("found", "lost"), incrémentée à chaque
+    écriture, pour répondre aux requêtes conditionnelles sans lire les tables d'objets
+    """
+    __tablename__ = 'collection_versions'
+    
+    name = Column(String, primary_key=True)
+    version = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<CollectionVersion {self.name} v{self.version}>"
+
+class ChangeLog(Base):
+    """
+    Journal des modifications d'objets et de correspondances, pour la synchronisation
+    incrémentale des clients. Les suppressions y restent sous forme de marqueurs.
+    """
+    __tablename__ = 'change_log'
+    __table_args__ = (
+        # Lecture des modifications après un curseur (version, id)
+        Index("ix_change_log_version_id", "version", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    version = Column(Integer, nullable=False)  # Version du journal lors de la modification
+    entity = Column(String, nullable=False)  # "found", "lost" ou "match"
+    item_id = Column(String, nullable=False)  # Objet modifié (objet trouvé pour une correspondance)
+    other_id = Column(String, nullable=True)  # Objet perdu d'une correspondance
+    deleted = Column(Boolean, default=False, nullable=False)
+    changed_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    
+    def __repr__(self):
+        return f"<ChangeLog v{self.version} {self.entity}:{self.item_id}>"
+
+class ItemStat(Base):
+    """
+    Compteurs agrégés des objets (par type, jour, lieu, correspondances, restitutions),
+    incrémentés à chaque écriture pour servir les statistiques sans parcourir les objets
+    """
+    __tablename__ = 'item_stats'
+    
+    item_type = Column(String, primary_key=True)  # "found" ou "lost"
+    metric = Column(String, primary_key=True)  # "total", "day", "location", "matched", "returned", "return_seconds"
+    key = Column(String, primary_key=True, default="")  # Jour ou lieu ("" pour les totaux)
+    value = Column(BigInteger, default=0, nullable=False)
+    
+    def __repr__(self):
+        return f"<ItemStat {self.item_type}:{self.metric}:{self.key}={self.value}>"
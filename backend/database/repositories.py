@@ -1,14 +1,50 @@
+from sqlalchemy import bindparam, case, func, or_, select, tuple_, union_all
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from backend.database.models import User, FoundItem, LostItem
+from sqlalchemy.dialects import postgresql, sqlite
+from typing import Dict, Iterable, List, Optional, Tuple
+from collections import defaultdict
+from backend.database.models import (
+    User, FoundItem, LostItem, KeywordIndex, TokenTrigram, CollectionVersion, ChangeLog, ItemStat, possible_matches,
+    MATCH_STATUS_PENDING, MATCH_STATUS_READY
+)
 from passlib.context import CryptContext
+import math
 import uuid
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from ..config import get_settings
 from ..services.cloud_storage import cloud_storage_service
+from ..services.cache import item_cache, invalidate_items_after_commit, invalidate_lists_after_commit, invalidate_after_commit
+from ..services.events import publish_after_commit
+from ..services.matching import inverse_document_frequency, compute_batch_matches, top_k_ids
+from ..services.text_processing import tokenize, serialize_tokens, parse_tokens, trigrams
+from ..services.date_parsing import parse_item_date
+
+settings = get_settings()
 
 # Configuration du hachage de mot de passe
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Longueur des descriptions dans les résumés d'objets (listes en view=summary)
+SUMMARY_DESCRIPTION_LENGTH = 120
+
+
+def insert_ignoring_duplicates(db: Session, table, rows: List[dict]):
+    """
+    Insère des lignes en ignorant celles dont la clé primaire existe déjà
+    (écritures concurrentes de plusieurs requêtes ou processus)
+    """
+    if not rows:
+        return
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        statement = postgresql.insert(table).on_conflict_do_nothing()
+    elif dialect == "sqlite":
+        statement = sqlite.insert(table).on_conflict_do_nothing()
+    else:
+        statement = table.insert()
+    db.execute(statement, rows)
+
+
 class UserRepository:
     def __init__(self, db: Session):
         self.db = db
@@ -53,26 +89,921 @@ class UserRepository:
             self.create_user("admin", "admin123", True)
 
 
+class TrigramIndexRepository:
+    """
+    Retrouve les mots clés du vocabulaire proches d'un mot mal orthographié
+    ("portefeuile" -> "portefeuill"), par similarité de trigrammes
+    """
+    # Activé au démarrage si l'extension PostgreSQL pg_trgm est disponible
+    # (voir migrations.setup_pg_trgm) ; sinon la table token_trigrams est utilisée
+    use_pg_trgm = False
+    
+    # Les mots plus courts ont trop peu de trigrammes pour être comparés de façon fiable
+    MIN_TOKEN_LENGTH = 4
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def add_tokens(self, tokens: Iterable[str]):
+        """
+        Ajoute au vocabulaire les trigrammes des mots clés encore inconnus
+        """
+        if self.use_pg_trgm:
+            return
+        tokens = [token for token in set(tokens) if len(token) >= self.MIN_TOKEN_LENGTH]
+        if not tokens:
+            return
+        
+        known_tokens = {
+            token for (token,) in
+            self.db.query(TokenTrigram.token).filter(TokenTrigram.token.in_(tokens)).distinct()
+        }
+        insert_ignoring_duplicates(self.db, TokenTrigram.__table__, [
+            {"trigram": trigram, "token": token}
+            for token in tokens if token not in known_tokens
+            for trigram in trigrams(token)
+        ])
+    
+    def find_similar_tokens(self, token: str, min_similarity: float) -> Dict[str, float]:
+        """
+        Mots clés du vocabulaire dont la similarité avec `token` atteint `min_similarity`
+        """
+        if len(token) < self.MIN_TOKEN_LENGTH:
+            return {}
+        
+        if self.use_pg_trgm:
+            # L'opérateur % (servi par l'index GIN) applique le seuil de la session, 0.3 par défaut :
+            # il est aligné sur `min_similarity` pour que les seuils plus bas soient respectés
+            self.db.execute(select(func.set_limit(min_similarity)))
+            similarity = func.similarity(KeywordIndex.token, token)
+            rows = self.db.query(KeywordIndex.token, similarity).filter(
+                KeywordIndex.token.op("%")(token),
+                similarity >= min_similarity,
+                func.length(KeywordIndex.token) >= self.MIN_TOKEN_LENGTH
+            ).distinct().all()
+            return {other_token: float(score) for other_token, score in rows}
+        
+        # Une similarité s / (a + b - s) >= seuil impose au moins seuil * a trigrammes communs
+        token_trigrams = trigrams(token)
+        rows = self.db.query(TokenTrigram.token, func.count()).filter(
+            TokenTrigram.trigram.in_(token_trigrams)
+        ).group_by(TokenTrigram.token).having(
+            func.count() >= math.ceil(min_similarity * len(token_trigrams))
+        ).all()
+        
+        similar_tokens = {}
+        for other_token, shared in rows:
+            score = shared / (len(token_trigrams) + len(trigrams(other_token)) - shared)
+            if score >= min_similarity:
+                similar_tokens[other_token] = score
+        return similar_tokens
+    
+    def expand(self, tokens: Iterable[str], min_similarity: float) -> Dict[str, float]:
+        """
+        Mots clés et mots proches du vocabulaire, avec leur meilleure similarité (1 pour les mots exacts)
+        """
+        expanded = {token: 1.0 for token in tokens}
+        if self.use_pg_trgm:
+            similar_tokens = [self.find_similar_tokens(token, min_similarity) for token in list(expanded)]
+        else:
+            similar_tokens = self._find_similar_tokens_many(list(expanded), min_similarity).values()
+        for token_similar_tokens in similar_tokens:
+            for other_token, score in token_similar_tokens.items():
+                expanded[other_token] = max(expanded.get(other_token, 0.0), score)
+        return expanded
+    
+    def _find_similar_tokens_many(self, tokens: List[str], min_similarity: float) -> Dict[str, Dict[str, float]]:
+        """
+        Équivalent de `find_similar_tokens` pour plusieurs mots clés, avec la table
+        token_trigrams : une requête par lot de trigrammes au lieu d'une par mot
+        """
+        tokens_by_trigram = defaultdict(list)
+        for token in tokens:
+            if len(token) >= self.MIN_TOKEN_LENGTH:
+                for trigram in trigrams(token):
+                    tokens_by_trigram[trigram].append(token)
+        
+        # Nombre de trigrammes communs de chaque paire (mot clé, mot du vocabulaire)
+        shared = defaultdict(int)
+        trigram_list = list(tokens_by_trigram)
+        for start in range(0, len(trigram_list), MatchRepository.LOAD_BATCH_SIZE):
+            rows = self.db.query(TokenTrigram.token, TokenTrigram.trigram).filter(
+                TokenTrigram.trigram.in_(trigram_list[start:start + MatchRepository.LOAD_BATCH_SIZE])
+            )
+            for other_token, trigram in rows:
+                for token in tokens_by_trigram[trigram]:
+                    shared[(token, other_token)] += 1
+        
+        similar_tokens = defaultdict(dict)
+        trigram_counts = {}
+        for (token, other_token), count in shared.items():
+            if other_token not in trigram_counts:
+                trigram_counts[other_token] = len(trigrams(other_token))
+            if token not in trigram_counts:
+                trigram_counts[token] = len(trigrams(token))
+            score = count / (trigram_counts[token] + trigram_counts[other_token] - count)
+            if score >= min_similarity:
+                similar_tokens[token][other_token] = score
+        return similar_tokens
+    
+    def needs_rebuild(self) -> bool:
+        if self.use_pg_trgm or self.db.query(TokenTrigram.token).first() is not None:
+            return False
+        return self.db.query(KeywordIndex.token).first() is not None
+    
+    def rebuild(self):
+        """
+        Reconstruit les trigrammes à partir du vocabulaire de l'index des mots clés
+        """
+        if self.use_pg_trgm:
+            return
+        self.db.query(TokenTrigram).delete(synchronize_session=False)
+        self.add_tokens(token for (token,) in self.db.query(KeywordIndex.token).distinct())
+        self.db.commit()
+
+
+class KeywordIndexRepository:
+    def __init__(self, db: Session):
+        self.db = db
+        self.trigram_index = TrigramIndexRepository(db)
+    
+    def index_item(self, item_type: str, item_id: str, tokens: Iterable[str]):
+        """
+        (Ré)indexe les mots clés d'un objet. Ne commit pas : l'appelant valide
+        la transaction avec l'écriture de l'objet lui-même.
+        """
+        tokens = list(tokens)
+        self.remove_item(item_type, item_id)
+        self._insert_rows([
+            {"token": token, "item_type": item_type, "item_id": item_id}
+            for token in tokens
+        ])
+        self.trigram_index.add_tokens(tokens)
+    
+    def index_new_items(self, item_type: str, tokens_by_id: Dict[str, Iterable[str]]):
+        """
+        Indexe des objets qui viennent d'être créés (import en masse), en une seule
+        insertion. Ne commit pas.
+        """
+        rows = [
+            {"token": token, "item_type": item_type, "item_id": item_id}
+            for item_id, tokens in tokens_by_id.items()
+            for token in tokens
+        ]
+        self._insert_rows(rows)
+        self.trigram_index.add_tokens(row["token"] for row in rows)
+    
+    def _insert_rows(self, rows: List[dict]):
+        if rows:
+            self.db.execute(KeywordIndex.__table__.insert(), rows)
+    
+    def remove_item(self, item_type: str, item_id: str):
+        self.db.query(KeywordIndex).filter(
+            KeywordIndex.item_type == item_type,
+            KeywordIndex.item_id == item_id
+        ).delete(synchronize_session=False)
+    
+    def find_shared_tokens(
+        self,
+        item_type: str,
+        tokens: Iterable[str],
+        min_common: int = 1,
+        date_range: Optional[Tuple[date, date]] = None
+    ) -> Dict[str, set]:
+        """
+        Renvoie, pour chaque objet du type donné partageant au moins `min_common`
+        mots clés avec `tokens`, l'ensemble des mots clés partagés.
+        Avec `date_range`, seuls les objets datés dans cette période (ou sans date lisible) sont retenus.
+        """
+        tokens = list(tokens)
+        if not tokens:
+            return {}
+        
+        candidate_ids = self.db.query(KeywordIndex.item_id).filter(
+            KeywordIndex.item_type == item_type,
+            KeywordIndex.token.in_(tokens)
+        )
+        if date_range:
+            model, date_column = (FoundItem, FoundItem.found_on) if item_type == "found" else (LostItem, LostItem.lost_on)
+            candidate_ids = candidate_ids.join(model, model.id == KeywordIndex.item_id).filter(
+                or_(date_column.is_(None), date_column.between(*date_range))
+            )
+        candidate_ids = candidate_ids.group_by(KeywordIndex.item_id).having(
+            func.count(KeywordIndex.token) >= min_common
+        )
+        
+        rows = self.db.query(KeywordIndex.item_id, KeywordIndex.token).filter(
+            KeywordIndex.item_type == item_type,
+            KeywordIndex.token.in_(tokens),
+            KeywordIndex.item_id.in_(candidate_ids)
+        ).all()
+        
+        shared_tokens = defaultdict(set)
+        for item_id, token in rows:
+            shared_tokens[item_id].add(token)
+        return dict(shared_tokens)
+    
+    def get_document_frequencies(self, tokens: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Nombre d'objets (trouvés et perdus) contenant chacun des mots clés
+        (tous les mots clés de l'index si `tokens` n'est pas précisé)
+        """
+        query = self.db.query(KeywordIndex.token, func.count())
+        if tokens is not None:
+            tokens = list(tokens)
+            if not tokens:
+                return {}
+            query = query.filter(KeywordIndex.token.in_(tokens))
+        
+        rows = query.group_by(KeywordIndex.token).all()
+        return {token: count for token, count in rows}
+    
+    def needs_rebuild(self) -> bool:
+        """
+        Indique si l'index est vide alors que des objets existent déjà
+        """
+        if self.db.query(KeywordIndex.token).first() is not None:
+            return False
+        return (
+            self.db.query(FoundItem.id).first() is not None
+            or self.db.query(LostItem.id).first() is not None
+        )
+    
+    def rebuild(self):
+        """
+        Reconstruit entièrement l'index à partir des objets existants
+        """
+        self.db.query(KeywordIndex).delete(synchronize_session=False)
+        for item_type, model in (("found", FoundItem), ("lost", LostItem)):
+            self._insert_rows([
+                {"token": token, "item_type": item_type, "item_id": item_id}
+                for item_id, stored_tokens in self.db.query(model.id, model.tokens)
+                for token in parse_tokens(stored_tokens)
+            ])
+        self.db.commit()
+        self.trigram_index.rebuild()
+
+
+class MatchRepository:
+    """
+    Écrit les correspondances (et leur score) dans la table d'association possible_matches.
+    
+    Seules les différences avec les correspondances déjà enregistrées sont écrites :
+    paires ajoutées, paires retirées et scores modifiés.
+    """
+    # Nombre de paires supprimées par requête DELETE
+    DELETE_BATCH_SIZE = 500
+    # Nombre d'objets par requête lors du chargement des correspondances d'une liste
+    LOAD_BATCH_SIZE = 500
+    
+    def __init__(self, db: Session):
+        self.db = db
+        self.versions = CollectionVersionRepository(db)
+        self.changes = ChangeLogRepository(db)
+        self.stats = StatsRepository(db)
+    
+    def _item_column(self, item_type: str):
+        return possible_matches.c.found_item_id if item_type == "found" else possible_matches.c.lost_item_id
+    
+    def remove_item(self, item_type: str, item_id: str):
+        other_type = "lost" if item_type == "found" else "found"
+        other_ids = list(dict.fromkeys(self.get_match_ids(item_type, [item_id])[item_id]))
+        if other_ids:
+            self.db.execute(possible_matches.delete().where(self._item_column(item_type) == item_id))
+            # L'objet n'a plus de correspondance, ni les objets dont c'était la seule
+            self.stats.record_matched(item_type, -1)
+            self.stats.record_matched(other_type, len(self.matched_ids(other_type, other_ids)) - len(other_ids))
+            # Les correspondances apparaissent dans les deux collections
+            self.versions.bump(*CollectionVersionRepository.COLLECTIONS)
+            invalidate_items_after_commit(self.db, other_type, other_ids)
+            if item_type == "found":
+                self.changes.record_edges([(item_id, other_id) for other_id in other_ids], deleted=True)
+            else:
+                self.changes.record_edges([(other_id, item_id) for other_id in other_ids], deleted=True)
+    
+    def get_edges(self, item_type: Optional[str] = None, item_id: Optional[str] = None) -> Dict[Tuple[str, str], float]:
+        """
+        Correspondances enregistrées, pour un objet ou pour toute la table
+        """
+        query = select(possible_matches.c.found_item_id, possible_matches.c.lost_item_id, possible_matches.c.score)
+        if item_type is not None:
+            query = query.where(self._item_column(item_type) == item_id)
+        return {(found_id, lost_id): score for found_id, lost_id, score in self.db.execute(query)}
+    
+    def get_items_edges(self, item_type: str, item_ids: List[str]) -> Dict[Tuple[str, str], float]:
+        """
+        Correspondances enregistrées de plusieurs objets d'un même type (une requête par lot)
+        """
+        item_column = self._item_column(item_type)
+        edges = {}
+        for start in range(0, len(item_ids), self.LOAD_BATCH_SIZE):
+            query = select(
+                possible_matches.c.found_item_id, possible_matches.c.lost_item_id, possible_matches.c.score
+            ).where(item_column.in_(item_ids[start:start + self.LOAD_BATCH_SIZE]))
+            edges.update({(found_id, lost_id): score for found_id, lost_id, score in self.db.execute(query)})
+        return edges
+    
+    def get_match_ids(self, item_type: str, item_ids: List[str]) -> Dict[str, List[str]]:
+        """
+        Identifiants des correspondances de plusieurs objets, par pertinence décroissante,
+        lus directement dans la table d'association (une requête par lot d'objets)
+        """
+        item_column = self._item_column(item_type)
+        other_column = self._item_column("lost" if item_type == "found" else "found")
+        match_ids = {item_id: [] for item_id in item_ids}
+        for start in range(0, len(item_ids), self.LOAD_BATCH_SIZE):
+            batch = item_ids[start:start + self.LOAD_BATCH_SIZE]
+            rows = self.db.execute(
+                select(item_column, other_column)
+                .where(item_column.in_(batch))
+                .order_by(item_column, possible_matches.c.score.desc(), other_column)
+            )
+            for item_id, other_id in rows:
+                match_ids[item_id].append(other_id)
+        return match_ids
+    
+    def matched_ids(self, item_type: str, item_ids: Iterable[str]) -> set:
+        """
+        Objets parmi `item_ids` ayant au moins une correspondance
+        """
+        item_ids = list(item_ids)
+        item_column = self._item_column(item_type)
+        matched = set()
+        for start in range(0, len(item_ids), self.LOAD_BATCH_SIZE):
+            rows = self.db.execute(
+                select(item_column).where(item_column.in_(item_ids[start:start + self.LOAD_BATCH_SIZE])).distinct()
+            )
+            matched.update(item_id for item_id, in rows)
+        return matched
+    
+    def get_scores(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], float]:
+        """
+        Scores actuels de paires (trouvé, perdu) ; les paires absentes de la table sont ignorées
+        """
+        pair_columns = tuple_(possible_matches.c.found_item_id, possible_matches.c.lost_item_id)
+        scores = {}
+        for start in range(0, len(pairs), self.LOAD_BATCH_SIZE):
+            rows = self.db.execute(
+                select(possible_matches.c.found_item_id, possible_matches.c.lost_item_id, possible_matches.c.score)
+                .where(pair_columns.in_(pairs[start:start + self.LOAD_BATCH_SIZE]))
+            )
+            scores.update({(found_id, lost_id): score for found_id, lost_id, score in rows})
+        return scores
+    
+    def replace_all(self, edges: Dict[Tuple[str, str], float]):
+        """
+        Remplace l'ensemble des correspondances (reconstruction complète)
+        """
+        self.apply_changes(self.get_edges(), edges)
+    
+    def apply_changes(self, old_edges: Dict[Tuple[str, str], float], new_edges: Dict[Tuple[str, str], float]):
+        """
+        Passe de `old_edges` à `new_edges` en n'écrivant que les paires qui diffèrent
+        (et incrémente les versions des collections si quelque chose a changé)
+        """
+        removed = [pair for pair in old_edges if pair not in new_edges]
+        added = {pair: score for pair, score in new_edges.items() if pair not in old_edges}
+        rescored = {
+            pair: score for pair, score in new_edges.items()
+            if pair in old_edges and not _same_score(old_edges[pair], score)
+        }
+        
+        # Objets pouvant gagner leur première correspondance ou perdre la dernière
+        touched = {
+            "found": {found_id for found_id, _ in removed + list(added)},
+            "lost": {lost_id for _, lost_id in removed + list(added)},
+        }
+        matched_before = {item_type: self.matched_ids(item_type, ids) for item_type, ids in touched.items()}
+        
+        self.delete_edges(removed)
+        self.insert_edges(added)
+        self.update_scores(rescored)
+        
+        for item_type, ids in touched.items():
+            if ids:
+                self.stats.record_matched(item_type, len(self.matched_ids(item_type, ids)) - len(matched_before[item_type]))
+        
+        # Les correspondances (ordonnées par score) apparaissent dans les deux collections
+        changed_pairs = removed + list(added) + list(rescored)
+        if changed_pairs:
+            self.versions.bump(*CollectionVersionRepository.COLLECTIONS)
+            invalidate_items_after_commit(self.db, "found", {found_id for found_id, _ in changed_pairs})
+            invalidate_items_after_commit(self.db, "lost", {lost_id for _, lost_id in changed_pairs})
+            self.changes.record_edges(removed, deleted=True)
+            self.changes.record_edges(list(added), created=True)
+            self.changes.record_edges(list(rescored))
+    
+    def insert_edges(self, edges: Dict[Tuple[str, str], float]):
+        if edges:
+            self.db.execute(possible_matches.insert(), [
+                {"found_item_id": found_id, "lost_item_id": lost_id, "score": score}
+                for (found_id, lost_id), score in edges.items()
+            ])
+    
+    def delete_edges(self, pairs: List[Tuple[str, str]]):
+        pair_columns = tuple_(possible_matches.c.found_item_id, possible_matches.c.lost_item_id)
+        for start in range(0, len(pairs), self.DELETE_BATCH_SIZE):
+            batch = pairs[start:start + self.DELETE_BATCH_SIZE]
+            self.db.execute(possible_matches.delete().where(pair_columns.in_(batch)))
+    
+    def update_scores(self, edges: Dict[Tuple[str, str], float]):
+        if edges:
+            statement = (
+                possible_matches.update()
+                .where(possible_matches.c.found_item_id == bindparam("edge_found_id"))
+                .where(possible_matches.c.lost_item_id == bindparam("edge_lost_id"))
+                .values(score=bindparam("edge_score"))
+            )
+            self.db.execute(statement, [
+                {"edge_found_id": found_id, "edge_lost_id": lost_id, "edge_score": score}
+                for (found_id, lost_id), score in edges.items()
+            ])
+
+
+def _same_score(score: Optional[float], other_score: Optional[float]) -> bool:
+    """
+    Deux scores égaux aux erreurs d'arrondi près (évite de réécrire des paires inchangées)
+    """
+    if score is None or other_score is None:
+        return score is other_score
+    return math.isclose(score, other_score, rel_tol=1e-9, abs_tol=1e-12)
+
+
+class CollectionVersionRepository:
+    """
+    Versions des collections d'objets trouvés et perdus. Les écritures incrémentent la
+    version dans leur propre transaction ; les listes s'en servent comme validateurs HTTP.
+    """
+    COLLECTIONS = ("found", "lost")
+    # Compteur du journal des modifications (voir ChangeLogRepository)
+    CHANGE_LOG = "changes"
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def ensure_exists(self):
+        """
+        Crée les versions initiales des collections (idempotent)
+        """
+        now = datetime.utcnow()
+        insert_ignoring_duplicates(self.db, CollectionVersion.__table__, [
+            {"name": name, "version": 0, "updated_at": now} for name in self.COLLECTIONS + (self.CHANGE_LOG,)
+        ])
+        self.db.commit()
+    
+    def bump(self, *names: str):
+        """
+        Incrémente la version des collections modifiées (et invalide leurs pages en cache). Ne commit pas.
+        """
+        invalidate_lists_after_commit(self.db, names)
+        self.db.execute(
+            CollectionVersion.__table__.update()
+            .where(CollectionVersion.name.in_(names))
+            .values(version=CollectionVersion.version + 1, updated_at=datetime.utcnow())
+        )
+    
+    def increment(self, name: str) -> int:
+        """
+        Incrémente un compteur et renvoie sa nouvelle valeur. Ne commit pas : la ligne reste
+        verrouillée jusqu'à la fin de la transaction, les valeurs suivent donc l'ordre des commits.
+        """
+        self.db.execute(
+            CollectionVersion.__table__.update()
+            .where(CollectionVersion.name == name)
+            .values(version=CollectionVersion.version + 1, updated_at=datetime.utcnow())
+        )
+        return self.db.query(CollectionVersion.version).filter(CollectionVersion.name == name).scalar()
+    
+    def get_many(self, names: Iterable[str]) -> Dict[str, Tuple[int, datetime]]:
+        """
+        Version et date de dernière modification de chaque collection
+        """
+        names = list(names)
+        versions = {name: (0, datetime(1970, 1, 1)) for name in names}
+        rows = self.db.query(
+            CollectionVersion.name, CollectionVersion.version, CollectionVersion.updated_at
+        ).filter(CollectionVersion.name.in_(names))
+        for name, version, updated_at in rows:
+            versions[name] = (version, updated_at)
+        return versions
+
+
+class ChangeLogRepository:
+    """
+    Journal des modifications lu par la synchronisation incrémentale (GET /api/changes).
+    
+    Chaque écriture reçoit la version suivante du compteur "changes" : une position
+    (version, id) du journal ne peut donc pas être dépassée par une transaction plus ancienne
+    validée plus tard. Les modifications sont aussi diffusées en temps réel après le commit.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+        self.versions = CollectionVersionRepository(db)
+    
+    def record_items(self, item_type: str, item_ids: Iterable[str], deleted: bool = False, created: bool = False):
+        """
+        Note la création, la modification ou la suppression d'objets. Ne commit pas.
+        """
+        item_ids = list(item_ids)
+        self._insert([
+            {"entity": item_type, "item_id": item_id, "other_id": None, "deleted": deleted}
+            for item_id in item_ids
+        ])
+        event_type = _event_type("item", deleted, created)
+        publish_after_commit(self.db, [
+            {"type": event_type, "item_type": item_type, "id": item_id} for item_id in item_ids
+        ])
+    
+    def record_edges(self, pairs: Iterable[Tuple[str, str]], deleted: bool = False, created: bool = False):
+        """
+        Note l'ajout, le changement de score ou la suppression de correspondances. Ne commit pas.
+        """
+        pairs = list(pairs)
+        self._insert([
+            {"entity": "match", "item_id": found_id, "other_id": lost_id, "deleted": deleted}
+            for found_id, lost_id in pairs
+        ])
+        event_type = _event_type("match", deleted, created)
+        publish_after_commit(self.db, [
+            {"type": event_type, "found_id": found_id, "lost_id": lost_id} for found_id, lost_id in pairs
+        ])
+    
+    def _insert(self, rows: List[dict]):
+        if not rows:
+            return
+        version = self.versions.increment(CollectionVersionRepository.CHANGE_LOG)
+        now = datetime.utcnow()
+        for row in rows:
+            row.update(version=version, changed_at=now)
+        self.db.execute(ChangeLog.__table__.insert(), rows)
+    
+    def _current_version(self) -> int:
+        name = CollectionVersionRepository.CHANGE_LOG
+        return self.versions.get_many([name])[name][0]
+    
+    def current_position(self) -> Tuple[int, int]:
+        """
+        Position (version, id) de la dernière modification validée
+        """
+        version = self._current_version()
+        last_id = self.db.query(func.max(ChangeLog.id)).filter(ChangeLog.version <= version).scalar()
+        return version, last_id or 0
+    
+    def is_expired(self, since: Tuple[int, int]) -> bool:
+        """
+        Indique si des modifications postérieures à `since` ont déjà été purgées du journal
+        """
+        oldest_version = self.db.query(func.min(ChangeLog.version)).scalar()
+        if oldest_version is None:
+            oldest_version = self._current_version() + 1
+        return since[0] < oldest_version - 1
+    
+    def get_changes(self, since: Tuple[int, int], limit: int) -> Tuple[List[ChangeLog], Tuple[int, int], bool]:
+        """
+        Modifications validées après la position `since`, dans l'ordre, avec la position
+        atteinte et s'il en reste d'autres
+        """
+        # Les versions supérieures appartiennent à des transactions pas encore validées
+        version = self._current_version()
+        rows = self.db.query(
+            ChangeLog.id, ChangeLog.version, ChangeLog.entity, ChangeLog.item_id, ChangeLog.other_id, ChangeLog.deleted
+        ).filter(
+            ChangeLog.version <= version,
+            tuple_(ChangeLog.version, ChangeLog.id) > tuple_(*since)
+        ).order_by(ChangeLog.version, ChangeLog.id).limit(limit + 1).all()
+        
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        position = (rows[-1].version, rows[-1].id) if rows else since
+        return rows, position, has_more
+    
+    def prune(self, retention_days: int):
+        """
+        Supprime les modifications plus anciennes que `retention_days` jours (par versions entières)
+        """
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        last_version = self.db.query(func.max(ChangeLog.version)).filter(ChangeLog.changed_at < cutoff).scalar()
+        if last_version is not None:
+            self.db.query(ChangeLog).filter(ChangeLog.version <= last_version).delete(synchronize_session=False)
+            self.db.commit()
+
+
+def _event_type(entity: str, deleted: bool, created: bool) -> str:
+    if deleted:
+        return f"{entity}_deleted"
+    return f"{entity}_created" if created else f"{entity}_updated"
+
+
+def _day_key(day: Optional[date]) -> str:
+    return day.isoformat() if day else ""
+
+
+def _location_key(location: Optional[str]) -> str:
+    return (location or "").strip()
+
+
+class StatsRepository:
+    """
+    Statistiques des objets, tenues à jour dans la table item_stats : chaque écriture
+    ajoute ses écarts aux compteurs, la lecture ne dépend donc pas du nombre d'objets.
+    
+    Un objet supprimé est compté comme rendu (les objets sont supprimés une fois restitués),
+    avec le temps écoulé depuis sa déclaration.
+    """
+    # Compteurs conservés lors d'une reconstruction : ils ne peuvent pas être recalculés
+    HISTORY_METRICS = ("returned", "return_seconds")
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def add(self, deltas: Dict[Tuple[str, str, str], int]):
+        """
+        Ajoute des écarts aux compteurs (type d'objet, métrique, clé). Ne commit pas.
+        """
+        # Ordre fixe des lignes : deux transactions ne se bloquent pas mutuellement
+        rows = [
+            {"item_type": item_type, "metric": metric, "key": key, "value": value}
+            for (item_type, metric, key), value in sorted(deltas.items()) if value
+        ]
+        if not rows:
+            return
+        table = ItemStat.__table__
+        dialect = self.db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = (postgresql if dialect == "postgresql" else sqlite).insert(table)
+            self.db.execute(insert.on_conflict_do_update(
+                index_elements=[table.c.item_type, table.c.metric, table.c.key],
+                set_={"value": table.c.value + insert.excluded.value}
+            ), rows)
+            return
+        for row in rows:
+            updated = self.db.execute(
+                table.update()
+                .where(table.c.item_type == row["item_type"], table.c.metric == row["metric"], table.c.key == row["key"])
+                .values(value=table.c.value + row["value"])
+            )
+            if updated.rowcount == 0:
+                self.db.execute(table.insert(), [row])
+    
+    def record_created(self, item_type: str, items: Iterable[Tuple[Optional[date], Optional[str]]]):
+        """
+        Compte des objets créés, donnés par (date convertie, lieu). Ne commit pas.
+        """
+        deltas = defaultdict(int)
+        for day, location in items:
+            deltas[(item_type, "total", "")] += 1
+            deltas[(item_type, "day", _day_key(day))] += 1
+            deltas[(item_type, "location", _location_key(location))] += 1
+        self.add(deltas)
+    
+    def record_moved(
+        self,
+        item_type: str,
+        previous: Tuple[Optional[date], Optional[str]],
+        current: Tuple[Optional[date], Optional[str]]
+    ):
+        """
+        Déplace un objet modifié de son ancien jour et lieu vers les nouveaux. Ne commit pas.
+        """
+        deltas = defaultdict(int)
+        for sign, (day, location) in ((-1, previous), (1, current)):
+            deltas[(item_type, "day", _day_key(day))] += sign
+            deltas[(item_type, "location", _location_key(location))] += sign
+        self.add(deltas)
+    
+    def record_deleted(self, item_type: str, day: Optional[date], location: Optional[str], created_at: datetime):
+        """
+        Retire un objet supprimé des compteurs et le compte comme rendu. Ne commit pas.
+        """
+        return_seconds = max(int((datetime.utcnow() - created_at).total_seconds()), 0) if created_at else 0
+        self.add({
+            (item_type, "total", ""): -1,
+            (item_type, "day", _day_key(day)): -1,
+            (item_type, "location", _location_key(location)): -1,
+            (item_type, "returned", ""): 1,
+            (item_type, "return_seconds", ""): return_seconds,
+        })
+    
+    def record_matched(self, item_type: str, delta: int):
+        """
+        Ajuste le nombre d'objets ayant au moins une correspondance. Ne commit pas.
+        """
+        self.add({(item_type, "matched", ""): delta})
+    
+    def get_stats(self) -> dict:
+        """
+        Statistiques par type, jour et lieu, taux de correspondance et délai moyen de restitution
+        """
+        counters = defaultdict(dict)
+        rows = self.db.query(ItemStat.item_type, ItemStat.metric, ItemStat.key, ItemStat.value).filter(
+            ItemStat.value != 0
+        )
+        for item_type, metric, key, value in rows:
+            counters[metric].setdefault(key, {"found": 0, "lost": 0})[item_type] = value
+        
+        def per_type(metric: str) -> Dict[str, int]:
+            return counters[metric].get("", {"found": 0, "lost": 0})
+        
+        totals, matched, returned = per_type("total"), per_type("matched"), per_type("returned")
+        return_seconds = per_type("return_seconds")
+        item_types = CollectionVersionRepository.COLLECTIONS
+        return {
+            "totals": totals,
+            "per_day": [
+                {"day": day or None, **counts}
+                # Jours dans l'ordre, les dates illisibles en dernier
+                for day, counts in sorted(counters["day"].items(), key=lambda entry: (entry[0] == "", entry[0]))
+            ],
+            "per_location": [
+                {"location": location, **counts}
+                for location, counts in sorted(
+                    counters["location"].items(), key=lambda entry: (-sum(entry[1].values()), entry[0])
+                )
+            ],
+            "matched": matched,
+            "match_rate": {
+                item_type: round(matched[item_type] / totals[item_type], 4) if totals[item_type] else None
+                for item_type in item_types
+            },
+            "returned": returned,
+            "average_return_hours": {
+                item_type: round(return_seconds[item_type] / returned[item_type] / 3600, 2) if returned[item_type] else None
+                for item_type in item_types
+            },
+        }
+    
+    def needs_rebuild(self) -> bool:
+        """
+        Indique si les compteurs sont vides alors que des objets existent déjà
+        """
+        if self.db.query(ItemStat.item_type).filter(ItemStat.metric == "total").first() is not None:
+            return False
+        return (
+            self.db.query(FoundItem.id).first() is not None
+            or self.db.query(LostItem.id).first() is not None
+        )
+    
+    def rebuild(self):
+        """
+        Recalcule les compteurs à partir des objets et des correspondances existants
+        (l'historique des objets rendus est conservé)
+        """
+        self.db.query(ItemStat).filter(ItemStat.metric.notin_(self.HISTORY_METRICS)).delete(synchronize_session=False)
+        deltas = defaultdict(int)
+        for item_type, model, date_column, match_column in (
+            ("found", FoundItem, FoundItem.found_on, possible_matches.c.found_item_id),
+            ("lost", LostItem, LostItem.lost_on, possible_matches.c.lost_item_id),
+        ):
+            for day, location, count in self.db.query(date_column, model.location, func.count()).group_by(
+                date_column, model.location
+            ):
+                deltas[(item_type, "total", "")] += count
+                deltas[(item_type, "day", _day_key(day))] += count
+                deltas[(item_type, "location", _location_key(location))] += count
+            deltas[(item_type, "matched", "")] = self.db.execute(
+                select(func.count(func.distinct(match_column)))
+            ).scalar()
+        self.add(deltas)
+        self.db.commit()
+
+
 class FoundItemRepository:
     def __init__(self, db: Session):
         self.db = db
+        self.keyword_index = KeywordIndexRepository(db)
+        self.match_repo = MatchRepository(db)
+        self.versions = CollectionVersionRepository(db)
+        self.changes = ChangeLogRepository(db)
+        self.stats = StatsRepository(db)
     
     def get_all(self) -> List[FoundItem]:
-        return self.db.query(FoundItem).order_by(FoundItem.created_at.desc()).all()
+        return self.db.query(FoundItem).order_by(FoundItem.created_at.desc(), FoundItem.id.desc()).all()
+    
+    def get_page(self, limit: int, after: Optional[Tuple[datetime, str]] = None) -> Tuple[List[FoundItem], bool]:
+        """
+        Page d'objets du plus récent au plus ancien, après la position (created_at, id) `after`.
+        Renvoie aussi s'il reste des objets après cette page.
+        """
+        query = self.db.query(FoundItem)
+        if after is not None:
+            query = query.filter(tuple_(FoundItem.created_at, FoundItem.id) < tuple_(*after))
+        items = query.order_by(FoundItem.created_at.desc(), FoundItem.id.desc()).limit(limit + 1).all()
+        return items[:limit], len(items) > limit
+    
+    def get_summaries(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, str]] = None,
+        item_ids: Optional[List[str]] = None
+    ) -> Tuple[list, bool]:
+        """
+        Résumés des objets pour les listes, dans l'ordre de get_page (tous si `limit` est None,
+        seulement ceux de `item_ids` si précisé) : seules les colonnes affichées sont lues, et
+        la description tronquée et le nombre de correspondances sont calculés par la base
+        """
+        match_count = select(func.count()).where(
+            possible_matches.c.found_item_id == FoundItem.id
+        ).scalar_subquery()
+        query = self.db.query(
+            FoundItem.id,
+            func.substr(FoundItem.description, 1, SUMMARY_DESCRIPTION_LENGTH).label("description"),
+            (func.length(FoundItem.description) > SUMMARY_DESCRIPTION_LENGTH).label("truncated"),
+            FoundItem.found_date,
+            FoundItem.found_time,
+            FoundItem.location,
+            FoundItem.image_url,
+            FoundItem.created_at,
+            FoundItem.match_status,
+            match_count.label("match_count")
+        )
+        if after is not None:
+            query = query.filter(tuple_(FoundItem.created_at, FoundItem.id) < tuple_(*after))
+        if item_ids is not None:
+            query = query.filter(FoundItem.id.in_(item_ids))
+        query = query.order_by(FoundItem.created_at.desc(), FoundItem.id.desc())
+        if limit is None:
+            return query.all(), False
+        rows = query.limit(limit + 1).all()
+        return rows[:limit], len(rows) > limit
+    
+    def get_with_matches(self, item_id: str, limit: Optional[int] = None) -> Tuple[Optional[FoundItem], list]:
+        """
+        Objet et résumés de ses correspondances (au plus `limit`), par pertinence décroissante,
+        lus en une seule requête avec jointures externes ; (None, []) si l'objet n'existe pas
+        """
+        query = self.db.query(
+            FoundItem,
+            LostItem.id.label("match_id"),
+            func.substr(LostItem.description, 1, SUMMARY_DESCRIPTION_LENGTH).label("description"),
+            (func.length(LostItem.description) > SUMMARY_DESCRIPTION_LENGTH).label("truncated"),
+            LostItem.lost_date,
+            LostItem.location,
+            possible_matches.c.score
+        ).select_from(FoundItem).outerjoin(
+            possible_matches, possible_matches.c.found_item_id == FoundItem.id
+        ).outerjoin(
+            LostItem, LostItem.id == possible_matches.c.lost_item_id
+        ).filter(
+            FoundItem.id == item_id
+        ).order_by(possible_matches.c.score.desc(), LostItem.id)
+        if limit is not None:
+            query = query.limit(limit)
+        rows = query.all()
+        if not rows:
+            return None, []
+        return rows[0].FoundItem, [row for row in rows if row.match_id is not None]
     
     def get_by_id(self, item_id: str) -> Optional[FoundItem]:
-        return self.db.query(FoundItem).filter(FoundItem.id == item_id).first()
+        # Session.get évite de relire un objet déjà chargé dans la même requête
+        return self.db.get(FoundItem, item_id)
+    
+    def get_by_ids(self, item_ids: List[str]) -> List[FoundItem]:
+        if not item_ids:
+            return []
+        return self.db.query(FoundItem).filter(FoundItem.id.in_(item_ids)).all()
     
     def create(self, item_data: dict) -> FoundItem:
         item = FoundItem(
             id=str(uuid.uuid4()),
+            match_status=MATCH_STATUS_PENDING,
             **item_data
         )
+        item.tokens = serialize_tokens(tokenize(item.description))
+        item.found_on = parse_item_date(item.found_date)
         self.db.add(item)
+        self.keyword_index.index_item("found", item.id, parse_tokens(item.tokens))
+        self.versions.bump("found")
+        self.changes.record_items("found", [item.id], created=True)
+        self.stats.record_created("found", [(item.found_on, item.location)])
         self.db.commit()
         self.db.refresh(item)
         return item
     
+    def create_many(self, items_data: List[dict]) -> List[str]:
+        """
+        Crée plusieurs objets en une seule insertion (import en masse) et renvoie leurs
+        identifiants. Ne commit pas : l'import entier est validé en une transaction.
+        """
+        if not items_data:
+            return []
+        rows = []
+        for item_data in items_data:
+            rows.append(dict(
+                item_data,
+                id=str(uuid.uuid4()),
+                match_status=MATCH_STATUS_PENDING,
+                tokens=serialize_tokens(tokenize(item_data["description"])),
+                found_on=parse_item_date(item_data["found_date"])
+            ))
+        self.db.execute(FoundItem.__table__.insert(), rows)
+        self.keyword_index.index_new_items("found", {
+            row["id"]: parse_tokens(row["tokens"]) for row in rows
+        })
+        self.versions.bump("found")
+        self.changes.record_items("found", [row["id"] for row in rows], created=True)
+        self.stats.record_created("found", [(row["found_on"], row["location"]) for row in rows])
+        return [row["id"] for row in rows]
+    
     def update(self, item_id: str, item_data: dict) -> Optional[FoundItem]:
         item = self.get_by_id(item_id)
         if not item:
@@ -82,10 +1013,27 @@ class FoundItemRepository:
         if "image_url" in item_data and item.image_url and item.image_url != item_data["image_url"]:
             cloud_storage_service.delete_file(item.image_url)
         
+        # Jour et lieu comptés dans les statistiques avant la modification
+        previous = (item.found_on, item.location)
+        
         # Mettre à jour les champs
         for key, value in item_data.items():
             setattr(item, key, value)
         
+        # Les correspondances seront recalculées en arrière-plan
+        item.match_status = MATCH_STATUS_PENDING
+        
+        # Les mots clés normalisés ne sont recalculés que si la description change
+        if "description" in item_data:
+            item.tokens = serialize_tokens(tokenize(item.description))
+            self.keyword_index.index_item("found", item.id, parse_tokens(item.tokens))
+        if "found_date" in item_data:
+            item.found_on = parse_item_date(item.found_date)
+        
+        self.stats.record_moved("found", previous, (item.found_on, item.location))
+        self.versions.bump("found")
+        invalidate_items_after_commit(self.db, "found", [item.id])
+        self.changes.record_items("found", [item.id])
         self.db.commit()
         self.db.refresh(item)
         return item
@@ -99,7 +1047,13 @@ class FoundItemRepository:
         if item.image_url:
             cloud_storage_service.delete_file(item.image_url)
         
+        self.keyword_index.remove_item("found", item.id)
+        self.match_repo.remove_item("found", item.id)
+        self.stats.record_deleted("found", item.found_on, item.location, item.created_at)
         self.db.delete(item)
+        self.versions.bump("found")
+        invalidate_items_after_commit(self.db, "found", [item.id])
+        self.changes.record_items("found", [item.id], deleted=True)
         self.db.commit()
         return True
 
@@ -107,32 +1061,166 @@ class FoundItemRepository:
 class LostItemRepository:
     def __init__(self, db: Session):
         self.db = db
+        self.keyword_index = KeywordIndexRepository(db)
+        self.match_repo = MatchRepository(db)
+        self.versions = CollectionVersionRepository(db)
+        self.changes = ChangeLogRepository(db)
+        self.stats = StatsRepository(db)
     
     def get_all(self) -> List[LostItem]:
-        return self.db.query(LostItem).order_by(LostItem.created_at.desc()).all()
+        return self.db.query(LostItem).order_by(LostItem.created_at.desc(), LostItem.id.desc()).all()
+    
+    def get_page(self, limit: int, after: Optional[Tuple[datetime, str]] = None) -> Tuple[List[LostItem], bool]:
+        """
+        Page d'objets du plus récent au plus ancien, après la position (created_at, id) `after`.
+        Renvoie aussi s'il reste des objets après cette page.
+        """
+        query = self.db.query(LostItem)
+        if after is not None:
+            query = query.filter(tuple_(LostItem.created_at, LostItem.id) < tuple_(*after))
+        items = query.order_by(LostItem.created_at.desc(), LostItem.id.desc()).limit(limit + 1).all()
+        return items[:limit], len(items) > limit
+    
+    def get_summaries(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, str]] = None,
+        item_ids: Optional[List[str]] = None
+    ) -> Tuple[list, bool]:
+        """
+        Résumés des objets pour les listes, dans l'ordre de get_page (tous si `limit` est None,
+        seulement ceux de `item_ids` si précisé) : seules les colonnes affichées sont lues, et
+        la description tronquée et le nombre de correspondances sont calculés par la base
+        """
+        match_count = select(func.count()).where(
+            possible_matches.c.lost_item_id == LostItem.id
+        ).scalar_subquery()
+        query = self.db.query(
+            LostItem.id,
+            func.substr(LostItem.description, 1, SUMMARY_DESCRIPTION_LENGTH).label("description"),
+            (func.length(LostItem.description) > SUMMARY_DESCRIPTION_LENGTH).label("truncated"),
+            LostItem.lost_date,
+            LostItem.lost_time,
+            LostItem.location,
+            LostItem.created_at,
+            LostItem.match_status,
+            match_count.label("match_count")
+        )
+        if after is not None:
+            query = query.filter(tuple_(LostItem.created_at, LostItem.id) < tuple_(*after))
+        if item_ids is not None:
+            query = query.filter(LostItem.id.in_(item_ids))
+        query = query.order_by(LostItem.created_at.desc(), LostItem.id.desc())
+        if limit is None:
+            return query.all(), False
+        rows = query.limit(limit + 1).all()
+        return rows[:limit], len(rows) > limit
+    
+    def get_with_matches(self, item_id: str, limit: Optional[int] = None) -> Tuple[Optional[LostItem], list]:
+        """
+        Objet et résumés de ses correspondances (au plus `limit`), par pertinence décroissante,
+        lus en une seule requête avec jointures externes ; (None, []) si l'objet n'existe pas
+        """
+        query = self.db.query(
+            LostItem,
+            FoundItem.id.label("match_id"),
+            func.substr(FoundItem.description, 1, SUMMARY_DESCRIPTION_LENGTH).label("description"),
+            (func.length(FoundItem.description) > SUMMARY_DESCRIPTION_LENGTH).label("truncated"),
+            FoundItem.found_date,
+            FoundItem.location,
+            FoundItem.image_url,
+            possible_matches.c.score
+        ).select_from(LostItem).outerjoin(
+            possible_matches, possible_matches.c.lost_item_id == LostItem.id
+        ).outerjoin(
+            FoundItem, FoundItem.id == possible_matches.c.found_item_id
+        ).filter(
+            LostItem.id == item_id
+        ).order_by(possible_matches.c.score.desc(), FoundItem.id)
+        if limit is not None:
+            query = query.limit(limit)
+        rows = query.all()
+        if not rows:
+            return None, []
+        return rows[0].LostItem, [row for row in rows if row.match_id is not None]
     
     def get_by_id(self, item_id: str) -> Optional[LostItem]:
-        return self.db.query(LostItem).filter(LostItem.id == item_id).first()
+        # Session.get évite de relire un objet déjà chargé dans la même requête
+        return self.db.get(LostItem, item_id)
+    
+    def get_by_ids(self, item_ids: List[str]) -> List[LostItem]:
+        if not item_ids:
+            return []
+        return self.db.query(LostItem).filter(LostItem.id.in_(item_ids)).all()
     
     def create(self, item_data: dict) -> LostItem:
         item = LostItem(
             id=str(uuid.uuid4()),
+            match_status=MATCH_STATUS_PENDING,
             **item_data
         )
+        item.tokens = serialize_tokens(tokenize(item.description))
+        item.lost_on = parse_item_date(item.lost_date)
         self.db.add(item)
+        self.keyword_index.index_item("lost", item.id, parse_tokens(item.tokens))
+        self.versions.bump("lost")
+        self.changes.record_items("lost", [item.id], created=True)
+        self.stats.record_created("lost", [(item.lost_on, item.location)])
         self.db.commit()
         self.db.refresh(item)
         return item
     
+    def create_many(self, items_data: List[dict]) -> List[str]:
+        """
+        Crée plusieurs objets en une seule insertion (import en masse) et renvoie leurs
+        identifiants. Ne commit pas : l'import entier est validé en une transaction.
+        """
+        if not items_data:
+            return []
+        rows = []
+        for item_data in items_data:
+            rows.append(dict(
+                item_data,
+                id=str(uuid.uuid4()),
+                match_status=MATCH_STATUS_PENDING,
+                tokens=serialize_tokens(tokenize(item_data["description"])),
+                lost_on=parse_item_date(item_data["lost_date"])
+            ))
+        self.db.execute(LostItem.__table__.insert(), rows)
+        self.keyword_index.index_new_items("lost", {
+            row["id"]: parse_tokens(row["tokens"]) for row in rows
+        })
+        self.versions.bump("lost")
+        self.changes.record_items("lost", [row["id"] for row in rows], created=True)
+        self.stats.record_created("lost", [(row["lost_on"], row["location"]) for row in rows])
+        return [row["id"] for row in rows]
+    
     def update(self, item_id: str, item_data: dict) -> Optional[LostItem]:
         item = self.get_by_id(item_id)
         if not item:
             return None
         
+        # Jour et lieu comptés dans les statistiques avant la modification
+        previous = (item.lost_on, item.location)
+        
         # Mettre à jour les champs
         for key, value in item_data.items():
             setattr(item, key, value)
         
+        # Les correspondances seront recalculées en arrière-plan
+        item.match_status = MATCH_STATUS_PENDING
+        
+        # Les mots clés normalisés ne sont recalculés que si la description change
+        if "description" in item_data:
+            item.tokens = serialize_tokens(tokenize(item.description))
+            self.keyword_index.index_item("lost", item.id, parse_tokens(item.tokens))
+        if "lost_date" in item_data:
+            item.lost_on = parse_item_date(item.lost_date)
+        
+        self.stats.record_moved("lost", previous, (item.lost_on, item.location))
+        self.versions.bump("lost")
+        invalidate_items_after_commit(self.db, "lost", [item.id])
+        self.changes.record_items("lost", [item.id])
         self.db.commit()
         self.db.refresh(item)
         return item
@@ -142,76 +1230,571 @@ class LostItemRepository:
         if not item:
             return False
         
+        self.keyword_index.remove_item("lost", item.id)
+        self.match_repo.remove_item("lost", item.id)
+        self.stats.record_deleted("lost", item.lost_on, item.location, item.created_at)
         self.db.delete(item)
+        self.versions.bump("lost")
+        invalidate_items_after_commit(self.db, "lost", [item.id])
+        self.changes.record_items("lost", [item.id], deleted=True)
         self.db.commit()
         return True
 
 
+class ExportRepository:
+    """
+    Lecture en flux de tables complètes pour les exports : curseur côté serveur
+    (yield_per) et lignes simples, sans objets ORM, pour une mémoire constante
+    """
+    # Colonnes exportées pour chaque type d'export
+    COLUMNS = {
+        "found": [
+            FoundItem.id, FoundItem.description, FoundItem.found_date, FoundItem.found_time,
+            FoundItem.location, FoundItem.content_info, FoundItem.image_url, FoundItem.created_at,
+            FoundItem.match_status
+        ],
+        "lost": [
+            LostItem.id, LostItem.description, LostItem.lost_date, LostItem.lost_time,
+            LostItem.location, LostItem.content_info, LostItem.created_at, LostItem.match_status
+        ],
+        "matches": [
+            possible_matches.c.found_item_id, FoundItem.description.label("found_description"),
+            possible_matches.c.lost_item_id, LostItem.description.label("lost_description"),
+            possible_matches.c.score
+        ],
+    }
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def field_names(self, kind: str) -> List[str]:
+        return [str(column.key) for column in self.COLUMNS[kind]]
+    
+    def stream(self, kind: str, batch_size: int = 1000) -> Iterable[List[dict]]:
+        """
+        Lignes de l'export `kind` ("found", "lost" ou "matches"), par lots de `batch_size`
+        """
+        query = select(*self.COLUMNS[kind])
+        if kind == "matches":
+            query = query.join(FoundItem, FoundItem.id == possible_matches.c.found_item_id).join(
+                LostItem, LostItem.id == possible_matches.c.lost_item_id
+            ).order_by(possible_matches.c.found_item_id, possible_matches.c.score.desc())
+        else:
+            model = FoundItem if kind == "found" else LostItem
+            query = query.order_by(model.created_at, model.id)
+        
+        field_names = self.field_names(kind)
+        result = self.db.execute(query.execution_options(yield_per=batch_size))
+        for rows in result.partitions():
+            yield [dict(zip(field_names, row)) for row in rows]
+
+
 class MatchingService:
+    # Nombre minimal de mots clés communs pour considérer une correspondance
+    MIN_COMMON_KEYWORDS = 2
+    # Au-delà de ce nombre d'objets, les candidats sont tous les objets opposés
+    # plutôt que ceux trouvés dans l'index inversé
+    INDEX_LOOKUP_MAX_ITEMS = 50
+
     def __init__(self, db: Session):
         self.db = db
         self.found_repo = FoundItemRepository(db)
         self.lost_repo = LostItemRepository(db)
+        self.keyword_index = KeywordIndexRepository(db)
+        self.trigram_index = TrigramIndexRepository(db)
+        self.match_repo = MatchRepository(db)
+        self.versions = CollectionVersionRepository(db)
+        self.changes = ChangeLogRepository(db)
+    
+    def _fuzzy_min_similarity(self) -> Optional[float]:
+        """
+        Seuil de similarité des mots proches, ou None si la tolérance aux fautes est désactivée
+        """
+        if settings.match_mode == "legacy" or not settings.match_fuzzy:
+            return None
+        return settings.match_fuzzy_min_similarity
+    
+    def _date_window(self) -> Optional[Tuple[int, int]]:
+        """
+        Fenêtre (jours avant, jours après la perte) dans laquelle l'objet doit avoir été trouvé
+        """
+        if settings.match_mode == "legacy":
+            return None
+        return settings.match_window_days_before, settings.match_window_days_after
+    
+    def _date_range(self, item_type: str, item_date: Optional[date]) -> Optional[Tuple[date, date]]:
+        """
+        Période dans laquelle doivent être datés les objets opposés candidats
+        """
+        window = self._date_window()
+        if window is None or item_date is None:
+            return None
+        days_before, days_after = timedelta(days=window[0]), timedelta(days=window[1])
+        if item_type == "found":
+            return item_date - days_after, item_date + days_before
+        return item_date - days_before, item_date + days_after
+    
+    def _compute_matches(
+        self,
+        item_type: str,
+        keywords: Dict[str, set],
+        dates: Dict[str, Optional[date]],
+        other_keywords: Dict[str, set],
+        other_dates: Dict[str, Optional[date]],
+        top_k: Optional[int]
+    ) -> Dict[Tuple[str, str], float]:
+        """
+        Correspondances (trouvé, perdu) entre des objets d'un type et des objets opposés,
+        par le calcul de la reconstruction complète, avec les poids IDF de toute la base
+        """
+        if item_type == "found":
+            found_keywords, found_dates, lost_keywords, lost_dates = keywords, dates, other_keywords, other_dates
+        else:
+            found_keywords, found_dates, lost_keywords, lost_dates = other_keywords, other_dates, keywords, dates
+        
+        tokens = set().union(*keywords.values(), *other_keywords.values())
+        # Au-delà d'un lot, lire toutes les fréquences coûte moins qu'une très longue liste IN
+        if len(tokens) > MatchRepository.LOAD_BATCH_SIZE:
+            corpus_frequencies = self.keyword_index.get_document_frequencies()
+        else:
+            corpus_frequencies = self.keyword_index.get_document_frequencies(tokens)
+        
+        return compute_batch_matches(
+            found_keywords,
+            lost_keywords,
+            mode=settings.match_mode,
+            min_common_keywords=self.MIN_COMMON_KEYWORDS,
+            min_score=settings.match_min_score,
+            top_k=top_k,
+            found_dates=found_dates,
+            lost_dates=lost_dates,
+            date_window=self._date_window(),
+            fuzzy_min_similarity=self._fuzzy_min_similarity(),
+            corpus_frequencies=corpus_frequencies,
+            corpus_size=self.db.query(FoundItem).count() + self.db.query(LostItem).count()
+        )
+    
+    def _candidates(
+        self, item_type: str, keywords: Dict[str, set], dates: Dict[str, Optional[date]]
+    ) -> Tuple[Dict[str, set], Dict[str, Optional[date]]]:
+        """
+        Mots clés et dates des objets opposés pouvant correspondre à au moins un des objets
+        donnés (lus dans l'index inversé, ou tous les objets opposés pour un gros lot)
+        """
+        other_type = "lost" if item_type == "found" else "found"
+        if len(keywords) > self.INDEX_LOOKUP_MAX_ITEMS:
+            return self._keywords_and_dates(other_type)
+        
+        # Mots clés des objets et mots proches du vocabulaire (fautes de frappe)
+        tokens = set().union(*keywords.values())
+        min_similarity = self._fuzzy_min_similarity()
+        if min_similarity is not None:
+            tokens = set(self.trigram_index.expand(tokens, min_similarity))
+        
+        # Période couvrant celles de tous les objets (aucune si l'un d'eux n'est pas daté)
+        date_ranges = [self._date_range(item_type, dates.get(item_id)) for item_id in keywords]
+        date_range = None
+        if date_ranges and all(date_ranges):
+            date_range = min(start for start, _ in date_ranges), max(end for _, end in date_ranges)
+        
+        # Un seul mot partagé suffit pour être candidat : avec les mots proches, le nombre de
+        # mots communs est compté sur l'objet perdu lors du calcul des scores
+        candidate_ids = list(self.keyword_index.find_shared_tokens(other_type, tokens, 1, date_range))
+        if not candidate_ids:
+            return {}, {}
+        return self._keywords_and_dates(other_type, candidate_ids)
+    
+    def _rematch_items(self, item_type: str, item_ids: List[str]) -> int:
+        """
+        Recalcule les correspondances d'objets d'un même type venant d'être écrits, avec la
+        règle de la reconstruction complète : une paire est conservée si elle fait partie du
+        top-K d'au moins un des deux objets. Le top-K des objets opposés dans lequel un objet
+        écrit entre ou dont il sort est donc réévalué, et leurs autres correspondances ajustées.
+        Ne commit pas. Renvoie le nombre de correspondances des objets écrits.
+        """
+        other_type = "lost" if item_type == "found" else "found"
+        item_index, other_index = (0, 1) if item_type == "found" else (1, 0)
+        
+        def make_pair(item_id: str, other_id: str) -> Tuple[str, str]:
+            return (item_id, other_id) if item_type == "found" else (other_id, item_id)
+        
+        keywords, dates = self._keywords_and_dates(item_type, item_ids)
+        candidate_keywords, candidate_dates = self._candidates(item_type, keywords, dates)
+        item_edges = self._compute_matches(
+            item_type, keywords, dates, candidate_keywords, candidate_dates, top_k=None
+        )
+        previous_edges = self.match_repo.get_items_edges(item_type, item_ids)
+        
+        if settings.match_mode == "legacy":
+            # Pas de top-K : les correspondances des autres objets ne changent pas
+            self.match_repo.apply_changes(previous_edges, item_edges)
+            return len(item_edges)
+        
+        top_k = settings.match_top_k
+        written_ids = set(item_ids)
+        written_scores = defaultdict(dict)
+        written_scores_by_other = defaultdict(dict)
+        for pair, score in item_edges.items():
+            written_scores[pair[item_index]][pair[other_index]] = score
+            written_scores_by_other[pair[other_index]][pair[item_index]] = score
+        top_items = {item_id: top_k_ids(written_scores[item_id], top_k) for item_id in item_ids}
+        
+        # Objets opposés concernés : candidats et anciennes correspondances des objets écrits.
+        # Leur ancien top-K fait toujours partie des correspondances enregistrées.
+        other_ids = list(dict.fromkeys(pair[other_index] for pair in list(item_edges) + list(previous_edges)))
+        stored_edges = self.match_repo.get_items_edges(other_type, other_ids)
+        stored_scores = defaultdict(dict)
+        for pair, score in stored_edges.items():
+            stored_scores[pair[other_index]][pair[item_index]] = score
+        
+        scores_by_other = defaultdict(dict)
+        incomplete_ids = []
+        for other_id in other_ids:
+            scores = {item_id: score for item_id, score in stored_scores[other_id].items() if item_id not in written_ids}
+            scores.update(written_scores_by_other[other_id])
+            scores_by_other[other_id] = scores
+            # Seuls les objets de l'ancien top-K sont sûrement enregistrés : si des objets écrits
+            # y avaient des places, il faut que d'autres objets écrits les reprennent devant les
+            # objets enregistrés, sinon tous les candidats sont relus
+            old_top = top_k_ids(stored_scores[other_id], top_k)
+            freed = len(old_top & written_ids)
+            if len(old_top) == top_k and freed:
+                ranks = sorted((-score, item_id) for item_id, score in scores.items() if item_id not in written_ids)
+                last_kept = ranks[top_k - freed - 1] if freed < top_k else None
+                retaken = [
+                    item_id for item_id, score in scores.items()
+                    if item_id in written_ids and last_kept is not None and (-score, item_id) < last_kept
+                ]
+                if len(retaken) < freed:
+                    incomplete_ids.append(other_id)
+        
+        if incomplete_ids:
+            other_keywords, other_dates = self._keywords_and_dates(other_type, incomplete_ids)
+            rival_keywords, rival_dates = self._candidates(other_type, other_keywords, other_dates)
+            rival_keywords.update(keywords)
+            rival_dates.update(dates)
+            scores = self._compute_matches(
+                item_type, rival_keywords, rival_dates, other_keywords, other_dates, top_k=None
+            )
+            for other_id in incomplete_ids:
+                scores_by_other[other_id] = {}
+            for pair, score in scores.items():
+                scores_by_other[pair[other_index]][pair[item_index]] = score
+        
+        # Paires des objets écrits, et paires des objets opposés dont le top-K a changé
+        old_edges = dict(previous_edges)
+        new_edges = {}
+        rival_pairs = []
+        for other_id in other_ids:
+            new_top = top_k_ids(scores_by_other[other_id], top_k)
+            changed = new_top != top_k_ids(stored_scores[other_id], top_k)
+            for item_id, score in scores_by_other[other_id].items():
+                pair = make_pair(item_id, other_id)
+                if item_id in written_ids:
+                    if item_id in new_top or other_id in top_items[item_id]:
+                        new_edges[pair] = score
+                elif changed and pair in stored_edges:
+                    old_edges[pair] = stored_edges[pair]
+                    if item_id in new_top:
+                        new_edges[pair] = score
+                    else:
+                        rival_pairs.append((pair, score))
+                elif changed and item_id in new_top:
+                    new_edges[pair] = score
+        
+        # Une paire sortie du top-K de l'objet opposé reste si elle est dans celui de l'autre objet,
+        # qui n'a pas changé : ses scores avec les objets opposés ne dépendent pas des objets écrits
+        rival_ids = list({pair[item_index] for pair, _ in rival_pairs})
+        rival_scores = defaultdict(dict)
+        for pair, score in self.match_repo.get_items_edges(item_type, rival_ids).items():
+            rival_scores[pair[item_index]][pair[other_index]] = score
+        rival_top = {rival_id: top_k_ids(rival_scores[rival_id], top_k) for rival_id in rival_ids}
+        for pair, score in rival_pairs:
+            if pair[other_index] in rival_top[pair[item_index]]:
+                new_edges[pair] = score
+        
+        self.match_repo.apply_changes(old_edges, new_edges)
+        return sum(1 for pair in new_edges if pair[item_index] in written_ids)
+    
+    def match_found_item(self, item_id: str) -> Optional[FoundItem]:
+        """
+        Recalcule uniquement les correspondances d'un objet trouvé (mode incrémental)
+        """
+        found_item = self.found_repo.get_by_id(item_id)
+        if not found_item:
+            return None
+        
+        self._rematch_items("found", [item_id])
+        if found_item.match_status != MATCH_STATUS_READY:
+            found_item.match_status = MATCH_STATUS_READY
+            self.versions.bump("found")
+            invalidate_items_after_commit(self.db, "found", [item_id])
+            self.changes.record_items("found", [item_id])
+        
+        self.db.commit()
+        return found_item
+    
+    def match_lost_item(self, item_id: str) -> Optional[LostItem]:
+        """
+        Recalcule uniquement les correspondances d'un objet perdu (mode incrémental)
+        """
+        lost_item = self.lost_repo.get_by_id(item_id)
+        if not lost_item:
+            return None
+        
+        self._rematch_items("lost", [item_id])
+        if lost_item.match_status != MATCH_STATUS_READY:
+            lost_item.match_status = MATCH_STATUS_READY
+            self.versions.bump("lost")
+            invalidate_items_after_commit(self.db, "lost", [item_id])
+            self.changes.record_items("lost", [item_id])
+        
+        self.db.commit()
+        return lost_item
     
     def find_matches(self):
         """
-        Trouve des correspondances potentielles entre objets perdus et trouvés
-        basées sur des mots clés dans les descriptions et la proximité des dates
-        """
-        # Récupérer tous les objets
-        found_items = self.found_repo.get_all()
-        lost_items = self.lost_repo.get_all()
-        
-        # Pour chaque objet trouvé, chercher des correspondances
-        for found_item in found_items:
-            # Réinitialiser les correspondances
-            found_item.possible_lost_items = []
-            
-            # Extraire les mots clés de la description (mots de plus de 3 lettres)
-            found_keywords = set([
-                word.lower() for word in found_item.description.split()
-                if len(word) > 3
-            ])
-            
-            # Chercher des correspondances parmi les objets perdus
-            for lost_item in lost_items:
-                # Extraire les mots clés de la description de l'objet perdu
-                lost_keywords = set([
-                    word.lower() for word in lost_item.description.split()
-                    if len(word) > 3
-                ])
-                
-                # Calculer l'intersection des mots clés
-                common_keywords = found_keywords.intersection(lost_keywords)
-                
-                # Si au moins 2 mots clés en commun, considérer comme une correspondance potentielle
-                if len(common_keywords) >= 2:
-                    found_item.possible_lost_items.append(lost_item)
-        
-        # Pour chaque objet perdu, chercher des correspondances
-        for lost_item in lost_items:
-            # Réinitialiser les correspondances
-            lost_item.possible_found_items = []
-            
-            # Extraire les mots clés de la description
-            lost_keywords = set([
-                word.lower() for word in lost_item.description.split()
-                if len(word) > 3
-            ])
-            
-            # Chercher des correspondances parmi les objets trouvés
-            for found_item in found_items:
-                # Extraire les mots clés de la description de l'objet trouvé
-                found_keywords = set([
-                    word.lower() for word in found_item.description.split()
-                    if len(word) > 3
-                ])
-                
-                # Calculer l'intersection des mots clés
-                common_keywords = lost_keywords.intersection(found_keywords)
-                
-                # Si au moins 2 mots clés en commun, considérer comme une correspondance potentielle
-                if len(common_keywords) >= 2:
-                    lost_item.possible_found_items.append(found_item)
+        Reconstruit toutes les correspondances potentielles entre objets perdus et trouvés
+        basées sur des mots clés dans les descriptions (reconstruction complète, réservée aux admins)
+        """
+        # Reconstruire l'index des mots clés
+        self.keyword_index.rebuild()
+        
+        # Lire les mots clés et dates précalculés, sans charger les objets complets
+        found_keywords, found_dates = self._keywords_and_dates("found")
+        lost_keywords, lost_dates = self._keywords_and_dates("lost")
         
+        # Toutes les paires de la même période sont évaluées par produits de matrices creuses
+        edges = compute_batch_matches(
+            found_keywords,
+            lost_keywords,
+            mode=settings.match_mode,
+            min_common_keywords=self.MIN_COMMON_KEYWORDS,
+            min_score=settings.match_min_score,
+            top_k=settings.match_top_k,
+            found_dates=found_dates,
+            lost_dates=lost_dates,
+            date_window=self._date_window(),
+            fuzzy_min_similarity=self._fuzzy_min_similarity()
+        )
+        
+        # N'écrire que les paires ajoutées, retirées ou dont le score a changé
+        self.match_repo.replace_all(edges)
+        for item_type, model in (("found", FoundItem), ("lost", LostItem)):
+            not_ready = or_(model.match_status != MATCH_STATUS_READY, model.match_status.is_(None))
+            updated_ids = [item_id for (item_id,) in self.db.query(model.id).filter(not_ready)]
+            if updated_ids:
+                self.db.query(model).filter(not_ready).update(
+                    {model.match_status: MATCH_STATUS_READY}, synchronize_session=False
+                )
+                self.versions.bump(item_type)
+                self.changes.record_items(item_type, updated_ids)
+        invalidate_after_commit(self.db, item_cache.clear)
         self.db.commit()
+        
+        # Le compteur des objets ayant une correspondance peut dériver quand des transactions
+        # concurrentes modifient les mêmes objets : il est recalculé avec les correspondances
+        self.match_repo.stats.rebuild()
+    
+    def match_items(self, item_type: str, item_ids: List[str]) -> int:
+        """
+        Calcule en une seule passe les correspondances de plusieurs objets d'un même type
+        (objets importés en masse) avec tous les objets opposés. Les poids IDF restent ceux
+        de toute la base. Renvoie le nombre de correspondances enregistrées.
+        """
+        if not item_ids:
+            return 0
+        model = FoundItem if item_type == "found" else LostItem
+        
+        match_count = self._rematch_items(item_type, item_ids)
+        for start in range(0, len(item_ids), MatchRepository.LOAD_BATCH_SIZE):
+            self.db.query(model).filter(
+                model.id.in_(item_ids[start:start + MatchRepository.LOAD_BATCH_SIZE])
+            ).update({model.match_status: MATCH_STATUS_READY}, synchronize_session=False)
+        self.versions.bump(item_type)
+        invalidate_items_after_commit(self.db, item_type, item_ids)
+        self.changes.record_items(item_type, item_ids)
+        self.db.commit()
+        return match_count
+    
+    def _keywords_and_dates(
+        self, item_type: str, item_ids: Optional[List[str]] = None
+    ) -> Tuple[Dict[str, set], Dict[str, Optional[date]]]:
+        """
+        Mots clés et dates précalculés des objets d'un type (tous, ou seulement `item_ids`)
+        """
+        model = FoundItem if item_type == "found" else LostItem
+        date_column = FoundItem.found_on if item_type == "found" else LostItem.lost_on
+        query = self.db.query(model.id, model.tokens, date_column)
+        if item_ids is None:
+            batches = [query]
+        else:
+            batches = [
+                query.filter(model.id.in_(item_ids[start:start + MatchRepository.LOAD_BATCH_SIZE]))
+                for start in range(0, len(item_ids), MatchRepository.LOAD_BATCH_SIZE)
+            ]
+        
+        keywords, dates = {}, {}
+        for batch in batches:
+            for item_id, stored_tokens, item_date in batch:
+                keywords[item_id] = parse_tokens(stored_tokens)
+                dates[item_id] = item_date
+        return keywords, dates
+
+
+class SearchService:
+    """
+    Recherche d'objets par mots clés, classée par pertinence, à partir de l'index inversé
+    """
+    ITEM_TYPES = ("found", "lost")
+    # Longueur minimale d'un mot recherché pour trouver aussi les mots qui le prolongent
+    MIN_PREFIX_LENGTH = 3
+    # Nombre maximal de mots prolongeant un mot recherché
+    MAX_PREFIX_VARIANTS = 50
+    
+    def __init__(self, db: Session):
+        self.db = db
+        self.keyword_index = KeywordIndexRepository(db)
+        self.trigram_index = TrigramIndexRepository(db)
+    
+    def _model(self, item_type: str):
+        return FoundItem if item_type == "found" else LostItem
+    
+    def _filters(
+        self,
+        item_type: str,
+        date_from: Optional[date],
+        date_to: Optional[date],
+        location: Optional[str]
+    ) -> list:
+        """
+        Conditions SQL des filtres de date (date convertie de l'objet) et de lieu
+        """
+        model = self._model(item_type)
+        date_column = FoundItem.found_on if item_type == "found" else LostItem.lost_on
+        conditions = []
+        if date_from is not None:
+            conditions.append(date_column >= date_from)
+        if date_to is not None:
+            conditions.append(date_column <= date_to)
+        if location:
+            conditions.append(func.lower(model.location).contains(location.strip().lower(), autoescape=True))
+        return conditions
+    
+    def _expand_query(self, tokens: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Pour chaque mot recherché, les mots de l'index acceptés à sa place avec leur poids :
+        le mot lui-même, les mots qui le prolongent ("port" -> "portefeuille")
+        et les mots proches (fautes de frappe)
+        """
+        expanded = {}
+        for token in tokens:
+            variants = {token: 1.0}
+            if len(token) >= self.MIN_PREFIX_LENGTH:
+                longer_tokens = self.db.query(KeywordIndex.token).filter(
+                    KeywordIndex.token.startswith(token, autoescape=True)
+                ).distinct().limit(self.MAX_PREFIX_VARIANTS)
+                for (other_token,) in longer_tokens:
+                    variants.setdefault(other_token, len(token) / len(other_token))
+            if settings.match_fuzzy:
+                for other_token, similarity in self.trigram_index.expand(
+                    [token], settings.match_fuzzy_min_similarity
+                ).items():
+                    variants[other_token] = max(variants.get(other_token, 0.0), similarity)
+            expanded[token] = variants
+        return expanded
+    
+    def search(
+        self,
+        query: str,
+        item_type: str = "all",
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        location: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> Tuple[List[Tuple[str, object, Optional[float]]], bool]:
+        """
+        Renvoie une page de résultats (type d'objet, objet, score) classés par pertinence
+        décroissante, et s'il reste des résultats après cette page.
+        Sans mot clé exploitable, les objets filtrés sont renvoyés du plus récent au plus ancien.
+        """
+        item_types = self.ITEM_TYPES if item_type == "all" else (item_type,)
+        tokens = tokenize(query)
+        if not tokens:
+            return self._recent(item_types, date_from, date_to, location, limit, offset)
+        
+        expanded = self._expand_query(tokens)
+        all_variants = set().union(*expanded.values())
+        document_frequencies = self.keyword_index.get_document_frequencies(all_variants)
+        total_documents = self.db.query(FoundItem).count() + self.db.query(LostItem).count()
+        
+        # Chaque mot recherché compte pour sa meilleure variante présente dans l'objet : le
+        # score est agrégé par la base, qui ne renvoie que la page demandée
+        token_scores = [
+            func.max(case(
+                {
+                    variant: weight * inverse_document_frequency(document_frequencies.get(variant, 1), total_documents)
+                    for variant, weight in variants.items()
+                },
+                value=KeywordIndex.token,
+                else_=0.0
+            ))
+            for variants in expanded.values()
+        ]
+        score = sum(token_scores[1:], token_scores[0]).label("score")
+        
+        scored = []
+        for current_type in item_types:
+            model = self._model(current_type)
+            query = select(KeywordIndex.item_type, KeywordIndex.item_id, score).where(
+                KeywordIndex.item_type == current_type,
+                KeywordIndex.token.in_(all_variants)
+            )
+            conditions = self._filters(current_type, date_from, date_to, location)
+            if conditions:
+                query = query.join(model, model.id == KeywordIndex.item_id).where(*conditions)
+            scored.append(query.group_by(KeywordIndex.item_type, KeywordIndex.item_id))
+        scored = (scored[0] if len(scored) == 1 else union_all(*scored)).subquery()
+        
+        rows = self.db.execute(
+            select(scored.c.item_type, scored.c.item_id, scored.c.score)
+            .order_by(scored.c.score.desc(), scored.c.item_type, scored.c.item_id)
+            .limit(limit + 1)
+            .offset(offset)
+        ).all()
+        page = [(row_score, result_type, item_id) for result_type, item_id, row_score in rows[:limit]]
+        
+        items = {}
+        for current_type in item_types:
+            item_ids = [item_id for _, result_type, item_id in page if result_type == current_type]
+            model = self._model(current_type)
+            if item_ids:
+                for item in self.db.query(model).filter(model.id.in_(item_ids)):
+                    items[(current_type, item.id)] = item
+        
+        results = [
+            (result_type, items[(result_type, item_id)], score)
+            for score, result_type, item_id in page if (result_type, item_id) in items
+        ]
+        return results, len(rows) > limit
+    
+    def _recent(
+        self,
+        item_types: Tuple[str, ...],
+        date_from: Optional[date],
+        date_to: Optional[date],
+        location: Optional[str],
+        limit: int,
+        offset: int
+    ) -> Tuple[List[Tuple[str, object, Optional[float]]], bool]:
+        results = []
+        for item_type in item_types:
+            model = self._model(item_type)
+            items = self.db.query(model).filter(
+                *self._filters(item_type, date_from, date_to, location)
+            ).order_by(model.created_at.desc(), model.id.desc()).limit(offset + limit + 1)
+            results += [(item_type, item, None) for item in items]
+        
+        results.sort(key=lambda result: (result[1].created_at, result[1].id), reverse=True)
+        return results[offset:offset + limit], len(results) > offset + limit
@@ -1,30 +1,275 @@
-from fastapi import FastAPI, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import FastAPI, Depends, HTTPException, Path, Query, Request, Response, status, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
-from datetime import timedelta
-from typing import List, Optional
+from datetime import date, timedelta
+import asyncio
+from typing import List, Optional, Union
 import os
 import uuid
 
 from .config import get_settings
 from .database.db import get_db, engine
+from .database.migrations import run_migrations, setup_pg_trgm
 from .database.models import User, FoundItem, LostItem, Base
-from .database.repositories import UserRepository, FoundItemRepository, LostItemRepository, MatchingService
+from .database.repositories import (
+    UserRepository, FoundItemRepository, LostItemRepository, KeywordIndexRepository,
+    TrigramIndexRepository, MatchRepository, MatchingService, SearchService, CollectionVersionRepository,
+    ChangeLogRepository, StatsRepository
+)
 from .services.cloud_storage import cloud_storage_service
+from .services.match_worker import match_worker
+from .services.pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, DEFAULT_CHANGES_PAGE_SIZE, MAX_CHANGES_PAGE_SIZE,
+    encode_cursor, decode_cursor, encode_offset_cursor, decode_offset_cursor, encode_change_cursor, decode_change_cursor
+)
+from .services.cache import item_cache, list_cache
+from .services.bulk_import import import_items
+from .services.compression import CompressionMiddleware, compression_stats
+from .services.events import event_broker, format_sse
+from .services.export import EXPORT_FILE_NAMES, EXPORT_MEDIA_TYPES, stream_export
+from .services.serialization import FastJSONResponse, dumps
+from .services.http_cache import make_etag, validator_headers, is_not_modified
 from .services.auth import create_access_token, get_current_user, get_current_admin
 from .schemas import (
-    FoundItemCreate, FoundItemUpdate, FoundItemResponse,
-    LostItemCreate, LostItemUpdate, LostItemResponse,
-    Token, UserResponse, MessageResponse
+    FoundItemCreate, FoundItemUpdate, FoundItemResponse, FoundItemPage, FoundItemSummary, FoundItemSummaryPage, FoundItemDetail,
+    LostItemCreate, LostItemUpdate, LostItemResponse, LostItemPage, LostItemSummary, LostItemSummaryPage, LostItemDetail,
+    Token, UserResponse, MessageResponse, MatchStatusResponse, SearchPage, ChangesPage, ImportReport, StatsResponse
 )
 
 # Créer les tables dans la base de données
 Base.metadata.create_all(bind=engine)
+run_migrations(engine)
+TrigramIndexRepository.use_pg_trgm = setup_pg_trgm(engine)
 
 # Obtenir les paramètres de configuration
 settings = get_settings()
 
+def ranked_match_ids(match_ids: List[str]) -> List[str]:
+    """
+    Identifiants des correspondances (déjà triées par pertinence), bornés au top-K
+    """
+    if settings.match_mode == "legacy":
+        return match_ids
+    return match_ids[:settings.match_top_k]
+
+def found_item_response(item: FoundItem, match_ids: List[str]) -> dict:
+    """
+    Formate un objet trouvé pour la réponse, avec ses correspondances
+    """
+    # Champs dans l'ordre du schéma FoundItemResponse (ordre du JSON encodé directement)
+    return {
+        "description": item.description,
+        "found_date": item.found_date,
+        "found_time": item.found_time,
+        "location": item.location,
+        "content_info": item.content_info,
+        "id": item.id,
+        "image_url": item.image_url,
+        "image_filename": item.image_filename,
+        "created_at": item.created_at,
+        "updated_at": item.updated_at,
+        "possible_matches": ranked_match_ids(match_ids),
+        "match_status": item.match_status
+    }
+
+def lost_item_response(item: LostItem, match_ids: List[str]) -> dict:
+    """
+    Formate un objet perdu pour la réponse, avec ses correspondances
+    """
+    # Champs dans l'ordre du schéma LostItemResponse (ordre du JSON encodé directement)
+    return {
+        "description": item.description,
+        "lost_date": item.lost_date,
+        "lost_time": item.lost_time,
+        "location": item.location,
+        "content_info": item.content_info,
+        "id": item.id,
+        "created_at": item.created_at,
+        "updated_at": item.updated_at,
+        "possible_matches": ranked_match_ids(match_ids),
+        "match_status": item.match_status
+    }
+
+def summary_match_count(match_count: int) -> int:
+    """
+    Nombre de correspondances affiché, borné au top-K comme les listes d'identifiants
+    """
+    if settings.match_mode == "legacy":
+        return match_count
+    return min(match_count, settings.match_top_k)
+
+def summary_description(row) -> str:
+    return row.description + "…" if row.truncated else row.description
+
+def found_summary_response(row) -> dict:
+    """
+    Formate le résumé d'un objet trouvé (ligne de FoundItemRepository.get_summaries)
+    """
+    # Champs dans l'ordre du schéma FoundItemSummary (ordre du JSON encodé directement)
+    return {
+        "id": row.id,
+        "description": summary_description(row),
+        "found_date": row.found_date,
+        "found_time": row.found_time,
+        "location": row.location,
+        "thumbnail_url": cloud_storage_service.thumbnail_url(row.image_url) if row.image_url else None,
+        "created_at": row.created_at,
+        "match_count": summary_match_count(row.match_count),
+        "match_status": row.match_status
+    }
+
+def lost_summary_response(row) -> dict:
+    """
+    Formate le résumé d'un objet perdu (ligne de LostItemRepository.get_summaries)
+    """
+    # Champs dans l'ordre du schéma LostItemSummary (ordre du JSON encodé directement)
+    return {
+        "id": row.id,
+        "description": summary_description(row),
+        "lost_date": row.lost_date,
+        "lost_time": row.lost_time,
+        "location": row.location,
+        "created_at": row.created_at,
+        "match_count": summary_match_count(row.match_count),
+        "match_status": row.match_status
+    }
+
+def detail_match_limit() -> Optional[int]:
+    """
+    Nombre de correspondances lues pour le détail d'un objet (le top-K, toutes en mode legacy)
+    """
+    if settings.match_mode == "legacy":
+        return None
+    return settings.match_top_k
+
+def found_detail_response(item: FoundItem, match_rows) -> dict:
+    """
+    Formate le détail d'un objet trouvé avec les résumés de ses correspondances
+    (lignes de FoundItemRepository.get_with_matches)
+    """
+    result = found_item_response(item, [row.match_id for row in match_rows])
+    result["matches"] = [
+        {
+            "id": row.match_id,
+            "description": summary_description(row),
+            "lost_date": row.lost_date,
+            "location": row.location,
+            "score": row.score
+        }
+        for row in match_rows
+    ]
+    return result
+
+def lost_detail_response(item: LostItem, match_rows) -> dict:
+    """
+    Formate le détail d'un objet perdu avec les résumés de ses correspondances
+    (lignes de LostItemRepository.get_with_matches)
+    """
+    result = lost_item_response(item, [row.match_id for row in match_rows])
+    result["matches"] = [
+        {
+            "id": row.match_id,
+            "description": summary_description(row),
+            "found_date": row.found_date,
+            "location": row.location,
+            "thumbnail_url": cloud_storage_service.thumbnail_url(row.image_url) if row.image_url else None,
+            "score": row.score
+        }
+        for row in match_rows
+    ]
+    return result
+
+def found_items_response(db: Session, items: List[FoundItem]) -> List[dict]:
+    """
+    Formate une liste d'objets trouvés, en chargeant leurs correspondances en une seule requête
+    """
+    match_ids = MatchRepository(db).get_match_ids("found", [item.id for item in items])
+    return [found_item_response(item, match_ids[item.id]) for item in items]
+
+def lost_items_response(db: Session, items: List[LostItem]) -> List[dict]:
+    """
+    Formate une liste d'objets perdus, en chargeant leurs correspondances en une seule requête
+    """
+    match_ids = MatchRepository(db).get_match_ids("lost", [item.id for item in items])
+    return [lost_item_response(item, match_ids[item.id]) for item in items]
+
+def rebuild_matches(db: Session):
+    """
+    Reconstruit toutes les correspondances puis purge le journal des modifications
+    """
+    MatchingService(db).find_matches()
+    # Une reconstruction complète peut noter beaucoup de modifications d'un coup
+    ChangeLogRepository(db).prune(settings.changes_retention_days)
+
+def cached_item_response(db: Session, item_type: str, item_id: str) -> Optional[dict]:
+    """
+    Réponse formatée d'un objet (avec ses correspondances), lue depuis le cache si possible
+    """
+    cache_key = (item_type, item_id)
+    cached = item_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Relevé avant la lecture : une écriture validée entre-temps invalide la clé, et la
+    # valeur lue (peut-être l'état précédent) n'est alors pas mise en cache
+    generation = item_cache.generation(cache_key)
+    if item_type == "found":
+        item = FoundItemRepository(db).get_by_id(item_id)
+        result = found_items_response(db, [item])[0] if item else None
+    else:
+        item = LostItemRepository(db).get_by_id(item_id)
+        result = lost_items_response(db, [item])[0] if item else None
+    
+    if result is not None:
+        item_cache.set(cache_key, result, generation)
+    return result
+
+def conditional_list_response(
+    request: Request,
+    response: Response,
+    db: Session,
+    collections: List[str]
+) -> Optional[Response]:
+    """
+    Ajoute ETag/Last-Modified d'après les versions des collections ; renvoie une
+    réponse 304 si la copie du client est à jour (sans lire les tables d'objets)
+    """
+    versions = CollectionVersionRepository(db).get_many(collections)
+    etag = make_etag({name: version for name, (version, _) in versions.items()})
+    last_modified = max(updated_at for _, updated_at in versions.values())
+    headers = validator_headers(etag, last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
+
+def list_page_response(page, response: Response):
+    """
+    Réponse d'une page de liste : déjà encodée en JSON (FAST_SERIALIZATION) ou à valider par FastAPI
+    """
+    if isinstance(page, bytes):
+        return FastJSONResponse(page, headers={
+            name: response.headers[name] for name in ("etag", "last-modified", "cache-control")
+        })
+    return page
+
+def decode_page_cursor(cursor: Optional[str]):
+    """
+    Position de départ d'une page, ou erreur 400 si le curseur est invalide
+    """
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Curseur de pagination invalide")
+
+# Durée maximale d'attente d'un client sur le calcul des correspondances (en secondes)
+MAX_MATCH_WAIT_SECONDS = 30
+
 # Créer l'application FastAPI
 app = FastAPI(
     title="API Objets Perdus et Trouvés",
@@ -41,13 +286,49 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compresser les réponses de l'API (listes JSON, exports)
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        min_size=settings.compression_min_size,
+        offload_min_size=settings.compression_offload_min_size,
+        levels={
+            "gzip": settings.compression_gzip_level,
+            "br": settings.compression_brotli_level,
+            "zstd": settings.compression_zstd_level,
+        }
+    )
+
 # Événement de démarrage pour créer un admin par défaut
 @app.on_event("startup")
 async def startup_event():
     db = next(get_db())
     user_repo = UserRepository(db)
     user_repo.create_admin_if_not_exists()
+    CollectionVersionRepository(db).ensure_exists()
+    ChangeLogRepository(db).prune(settings.changes_retention_days)
+    
+    # Construire l'index des mots clés pour les objets créés avant son introduction
+    keyword_index = KeywordIndexRepository(db)
+    if keyword_index.needs_rebuild():
+        keyword_index.rebuild()
+    trigram_index = TrigramIndexRepository(db)
+    if trigram_index.needs_rebuild():
+        trigram_index.rebuild()
+    
+    # Calculer les statistiques des objets créés avant leur introduction
+    stats_repo = StatsRepository(db)
+    if stats_repo.needs_rebuild():
+        stats_repo.rebuild()
     db.close()
+    
+    # Démarrer le calcul des correspondances en arrière-plan
+    event_broker.start()
+    await match_worker.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await match_worker.stop()
 
 # Endpoints d'authentification
 @app.post("/api/login", response_model=Token)
@@ -84,32 +365,66 @@ async def read_users_me(current_user: User = Depends(get_current_user)):
     return current_user
 
 # Endpoints pour les objets trouvés
-@app.get("/api/found", response_model=List[FoundItemResponse])
-async def get_found_items(db: Session = Depends(get_db)):
+@app.get(
+    "/api/found",
+    response_model=Union[FoundItemSummaryPage, FoundItemPage, List[FoundItemSummary], List[FoundItemResponse]]
+)
+async def get_found_items(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    all: bool = False,
+    view: str = Query("full", pattern="^(full|summary)$"),
+    db: Session = Depends(get_db)
+):
     """
-    Obtient la liste des objets trouvés
+    Obtient la liste des objets trouvés, du plus récent au plus ancien, par pages de `limit`.
+    `next_cursor` permet d'obtenir la page suivante ; `all=true` renvoie la liste complète.
+    `view=summary` ne renvoie que les champs des cartes de la liste, avec `match_count`.
+    Répond 304 si la liste n'a pas changé depuis la copie du client (If-None-Match / If-Modified-Since).
     """
+    not_modified = conditional_list_response(request, response, db, ["found"])
+    if not_modified:
+        return not_modified
+    
+    # Les pages en cache sont indexées par l'ETag : une écriture les rend obsolètes
+    cache_key = ("found", response.headers["etag"], limit, cursor, all, view)
+    cached_page = list_cache.get(cache_key)
+    if cached_page is not None:
+        return list_page_response(cached_page, response)
+    
     repo = FoundItemRepository(db)
-    found_items = repo.get_all()
-    
-    # Formater les possible_matches pour la réponse
-    result = []
-    for item in found_items:
-        item_dict = {
-            "id": item.id,
-            "description": item.description,
-            "found_date": item.found_date,
-            "found_time": item.found_time,
-            "location": item.location,
-            "content_info": item.content_info,
-            "image_url": item.image_url,
-            "image_filename": item.image_filename,
-            "created_at": item.created_at,
-            "possible_matches": [match.id for match in item.possible_lost_items]
+    if view == "summary":
+        rows, has_more = repo.get_summaries(None if all else limit, None if all else decode_page_cursor(cursor))
+        items = [found_summary_response(row) for row in rows]
+        if all:
+            page = items
+        else:
+            last_row = rows[-1] if has_more else None
+            page = {
+                "items": items,
+                "next_cursor": encode_cursor(last_row.created_at, last_row.id) if last_row else None
+            }
+    elif all:
+        page = found_items_response(db, repo.get_all())
+    else:
+        found_items, has_more = repo.get_page(limit, decode_page_cursor(cursor))
+        next_cursor = None
+        if has_more:
+            last_item = found_items[-1]
+            next_cursor = encode_cursor(last_item.created_at, last_item.id)
+        page = {
+            "items": found_items_response(db, found_items),
+            "next_cursor": next_cursor
         }
-        result.append(item_dict)
     
-    return result
+    # Encoder une seule fois, sans revalider des données lues en base
+    if settings.fast_serialization:
+        page = dumps(page)
+    
+    list_cache.set(cache_key, page)
+    return list_page_response(page, response)
 
 @app.post("/api/found", response_model=FoundItemResponse)
 async def create_found_item(
@@ -142,28 +457,37 @@ async def create_found_item(
         "image_filename": image_filename
     })
     
-    # Exécuter l'algorithme de correspondance
-    matching_service = MatchingService(db)
-    matching_service.find_matches()
-    
-    # Mettre à jour found_item avec les correspondances
-    found_item = repo.get_by_id(found_item.id)
-    
-    # Formater la réponse
-    response = {
-        "id": found_item.id,
-        "description": found_item.description,
-        "found_date": found_item.found_date,
-        "found_time": found_item.found_time,
-        "location": found_item.location,
-        "content_info": found_item.content_info,
-        "image_url": found_item.image_url,
-        "image_filename": found_item.image_filename,
-        "created_at": found_item.created_at,
-        "possible_matches": [match.id for match in found_item.possible_lost_items]
-    }
+    # Les correspondances sont calculées en arrière-plan
+    match_worker.enqueue("found", found_item.id)
     
-    return response
+    return found_items_response(db, [found_item])[0]
+
+@app.get("/api/found/{item_id}", response_model=FoundItemDetail)
+async def get_found_item(
+    item_id: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db)
+):
+    """
+    Obtient un objet trouvé avec les résumés de ses correspondances, par pertinence décroissante.
+    Répond 304 si les objets n'ont pas changé depuis la copie du client.
+    """
+    not_modified = conditional_list_response(request, response, db, ["found", "lost"])
+    if not_modified:
+        return not_modified
+    
+    # Indexé par l'ETag comme les pages des listes : la modification d'une correspondance le rend obsolète
+    cache_key = ("found_detail", item_id, response.headers["etag"])
+    detail = item_cache.get(cache_key)
+    if detail is None:
+        found_item, match_rows = FoundItemRepository(db).get_with_matches(item_id, detail_match_limit())
+        if not found_item:
+            raise HTTPException(status_code=404, detail="Objet trouvé non trouvé")
+        detail = found_detail_response(found_item, match_rows)
+        item_cache.set(cache_key, detail)
+    
+    return detail
 
 @app.put("/api/found/{item_id}", response_model=FoundItemResponse)
 async def update_found_item(
@@ -209,28 +533,34 @@ async def update_found_item(
     # Mettre à jour l'objet trouvé
     found_item = repo.update(item_id, update_data)
     
-    # Exécuter l'algorithme de correspondance
-    matching_service = MatchingService(db)
-    matching_service.find_matches()
+    # Les correspondances sont recalculées en arrière-plan
+    match_worker.enqueue("found", item_id)
     
-    # Mettre à jour found_item avec les correspondances
-    found_item = repo.get_by_id(item_id)
+    return found_items_response(db, [found_item])[0]
+
+@app.get("/api/found/{item_id}/matches", response_model=MatchStatusResponse)
+async def get_found_item_matches(
+    item_id: str,
+    wait: float = 0,
+    db: Session = Depends(get_db)
+):
+    """
+    Obtient l'état du calcul des correspondances d'un objet trouvé.
+    Avec `wait`, attend jusqu'à `wait` secondes que le calcul soit terminé.
+    """
+    if wait > 0:
+        await match_worker.wait_for("found", item_id, min(wait, MAX_MATCH_WAIT_SECONDS))
     
-    # Formater la réponse
-    response = {
-        "id": found_item.id,
-        "description": found_item.description,
-        "found_date": found_item.found_date,
-        "found_time": found_item.found_time,
-        "location": found_item.location,
-        "content_info": found_item.content_info,
-        "image_url": found_item.image_url,
-        "image_filename": found_item.image_filename,
-        "created_at": found_item.created_at,
-        "possible_matches": [match.id for match in found_item.possible_lost_items]
-    }
+    found_item = cached_item_response(db, "found", item_id)
+    
+    if not found_item:
+        raise HTTPException(status_code=404, detail="Objet trouvé non trouvé")
     
-    return response
+    return {
+        "id": found_item["id"],
+        "match_status": found_item["match_status"],
+        "possible_matches": found_item["possible_matches"]
+    }
 
 @app.delete("/api/found/{item_id}", response_model=MessageResponse)
 async def delete_found_item(
@@ -242,38 +572,79 @@ async def delete_found_item(
     Supprime un objet trouvé existant (admin seulement)
     """
     repo = FoundItemRepository(db)
+    partner_ids = MatchRepository(db).get_match_ids("found", [item_id])[item_id]
     success = repo.delete(item_id)
     
     if not success:
         raise HTTPException(status_code=404, detail="Objet trouvé non trouvé")
     
+    # Les objets qui lui correspondaient peuvent retrouver d'autres correspondances dans leur top-K
+    for partner_id in partner_ids:
+        match_worker.enqueue("lost", partner_id)
+    
     return {"detail": "Objet trouvé supprimé avec succès"}
 
 # Endpoints pour les objets perdus
-@app.get("/api/lost", response_model=List[LostItemResponse])
-async def get_lost_items(db: Session = Depends(get_db)):
+@app.get(
+    "/api/lost",
+    response_model=Union[LostItemSummaryPage, LostItemPage, List[LostItemSummary], List[LostItemResponse]]
+)
+async def get_lost_items(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    all: bool = False,
+    view: str = Query("full", pattern="^(full|summary)$"),
+    db: Session = Depends(get_db)
+):
     """
-    Obtient la liste des objets perdus
+    Obtient la liste des objets perdus, du plus récent au plus ancien, par pages de `limit`.
+    `next_cursor` permet d'obtenir la page suivante ; `all=true` renvoie la liste complète.
+    `view=summary` ne renvoie que les champs des cartes de la liste, avec `match_count`.
+    Répond 304 si la liste n'a pas changé depuis la copie du client (If-None-Match / If-Modified-Since).
     """
+    not_modified = conditional_list_response(request, response, db, ["lost"])
+    if not_modified:
+        return not_modified
+    
+    # Les pages en cache sont indexées par l'ETag : une écriture les rend obsolètes
+    cache_key = ("lost", response.headers["etag"], limit, cursor, all, view)
+    cached_page = list_cache.get(cache_key)
+    if cached_page is not None:
+        return list_page_response(cached_page, response)
+    
     repo = LostItemRepository(db)
-    lost_items = repo.get_all()
-    
-    # Formater les possible_matches pour la réponse
-    result = []
-    for item in lost_items:
-        item_dict = {
-            "id": item.id,
-            "description": item.description,
-            "lost_date": item.lost_date,
-            "lost_time": item.lost_time,
-            "location": item.location,
-            "content_info": item.content_info,
-            "created_at": item.created_at,
-            "possible_matches": [match.id for match in item.possible_found_items]
+    if view == "summary":
+        rows, has_more = repo.get_summaries(None if all else limit, None if all else decode_page_cursor(cursor))
+        items = [lost_summary_response(row) for row in rows]
+        if all:
+            page = items
+        else:
+            last_row = rows[-1] if has_more else None
+            page = {
+                "items": items,
+                "next_cursor": encode_cursor(last_row.created_at, last_row.id) if last_row else None
+            }
+    elif all:
+        page = lost_items_response(db, repo.get_all())
+    else:
+        lost_items, has_more = repo.get_page(limit, decode_page_cursor(cursor))
+        next_cursor = None
+        if has_more:
+            last_item = lost_items[-1]
+            next_cursor = encode_cursor(last_item.created_at, last_item.id)
+        page = {
+            "items": lost_items_response(db, lost_items),
+            "next_cursor": next_cursor
         }
-        result.append(item_dict)
     
-    return result
+    # Encoder une seule fois, sans revalider des données lues en base
+    if settings.fast_serialization:
+        page = dumps(page)
+    
+    list_cache.set(cache_key, page)
+    return list_page_response(page, response)
 
 @app.post("/api/lost", response_model=LostItemResponse)
 async def create_lost_item(
@@ -296,26 +667,37 @@ async def create_lost_item(
         "content_info": content_info
     })
     
-    # Exécuter l'algorithme de correspondance
-    matching_service = MatchingService(db)
-    matching_service.find_matches()
-    
-    # Mettre à jour lost_item avec les correspondances
-    lost_item = repo.get_by_id(lost_item.id)
-    
-    # Formater la réponse
-    response = {
-        "id": lost_item.id,
-        "description": lost_item.description,
-        "lost_date": lost_item.lost_date,
-        "lost_time": lost_item.lost_time,
-        "location": lost_item.location,
-        "content_info": lost_item.content_info,
-        "created_at": lost_item.created_at,
-        "possible_matches": [match.id for match in lost_item.possible_found_items]
-    }
+    # Les correspondances sont calculées en arrière-plan
+    match_worker.enqueue("lost", lost_item.id)
+    
+    return lost_items_response(db, [lost_item])[0]
+
+@app.get("/api/lost/{item_id}", response_model=LostItemDetail)
+async def get_lost_item(
+    item_id: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db)
+):
+    """
+    Obtient un objet perdu avec les résumés de ses correspondances, par pertinence décroissante.
+    Répond 304 si les objets n'ont pas changé depuis la copie du client.
+    """
+    not_modified = conditional_list_response(request, response, db, ["found", "lost"])
+    if not_modified:
+        return not_modified
+    
+    # Indexé par l'ETag comme les pages des listes : la modification d'une correspondance le rend obsolète
+    cache_key = ("lost_detail", item_id, response.headers["etag"])
+    detail = item_cache.get(cache_key)
+    if detail is None:
+        lost_item, match_rows = LostItemRepository(db).get_with_matches(item_id, detail_match_limit())
+        if not lost_item:
+            raise HTTPException(status_code=404, detail="Objet perdu non trouvé")
+        detail = lost_detail_response(lost_item, match_rows)
+        item_cache.set(cache_key, detail)
     
-    return response
+    return detail
 
 @app.put("/api/lost/{item_id}", response_model=LostItemResponse)
 async def update_lost_item(
@@ -353,26 +735,34 @@ async def update_lost_item(
     # Mettre à jour l'objet perdu
     lost_item = repo.update(item_id, update_data)
     
-    # Exécuter l'algorithme de correspondance
-    matching_service = MatchingService(db)
-    matching_service.find_matches()
+    # Les correspondances sont recalculées en arrière-plan
+    match_worker.enqueue("lost", item_id)
     
-    # Mettre à jour lost_item avec les correspondances
-    lost_item = repo.get_by_id(item_id)
+    return lost_items_response(db, [lost_item])[0]
+
+@app.get("/api/lost/{item_id}/matches", response_model=MatchStatusResponse)
+async def get_lost_item_matches(
+    item_id: str,
+    wait: float = 0,
+    db: Session = Depends(get_db)
+):
+    """
+    Obtient l'état du calcul des correspondances d'un objet perdu.
+    Avec `wait`, attend jusqu'à `wait` secondes que le calcul soit terminé.
+    """
+    if wait > 0:
+        await match_worker.wait_for("lost", item_id, min(wait, MAX_MATCH_WAIT_SECONDS))
     
-    # Formater la réponse
-    response = {
-        "id": lost_item.id,
-        "description": lost_item.description,
-        "lost_date": lost_item.lost_date,
-        "lost_time": lost_item.lost_time,
-        "location": lost_item.location,
-        "content_info": lost_item.content_info,
-        "created_at": lost_item.created_at,
-        "possible_matches": [match.id for match in lost_item.possible_found_items]
-    }
+    lost_item = cached_item_response(db, "lost", item_id)
+    
+    if not lost_item:
+        raise HTTPException(status_code=404, detail="Objet perdu non trouvé")
     
-    return response
+    return {
+        "id": lost_item["id"],
+        "match_status": lost_item["match_status"],
+        "possible_matches": lost_item["possible_matches"]
+    }
 
 @app.delete("/api/lost/{item_id}", response_model=MessageResponse)
 async def delete_lost_item(
@@ -384,9 +774,277 @@ async def delete_lost_item(
     Supprime un objet perdu existant (admin seulement)
     """
     repo = LostItemRepository(db)
+    partner_ids = MatchRepository(db).get_match_ids("lost", [item_id])[item_id]
     success = repo.delete(item_id)
     
     if not success:
         raise HTTPException(status_code=404, detail="Objet perdu non trouvé")
     
+    # Les objets qui lui correspondaient peuvent retrouver d'autres correspondances dans leur top-K
+    for partner_id in partner_ids:
+        match_worker.enqueue("found", partner_id)
+    
     return {"detail": "Objet perdu supprimé avec succès"}
+
+# Endpoint de recherche
+@app.get("/api/search", response_model=SearchPage)
+async def search_items(
+    request: Request,
+    response: Response,
+    q: str = "",
+    item_type: str = Query("all", alias="type", pattern="^(all|found|lost)$"),
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    location: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Recherche des objets par mots clés (tolérant aux fautes et aux mots incomplets),
+    filtrés par type, période et lieu, classés par pertinence et paginés
+    """
+    not_modified = conditional_list_response(request, response, db, ["found", "lost"])
+    if not_modified:
+        return not_modified
+    
+    offset = 0
+    if cursor is not None:
+        try:
+            offset = decode_offset_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Curseur de pagination invalide")
+    
+    search_service = SearchService(db)
+    results, has_more = search_service.search(q, item_type, date_from, date_to, location, limit, offset)
+    
+    # Charger les correspondances de tous les résultats en une requête par type
+    match_repo = MatchRepository(db)
+    match_ids = {
+        result_type: match_repo.get_match_ids(
+            result_type, [item.id for current_type, item, _ in results if current_type == result_type]
+        )
+        for result_type in ("found", "lost")
+    }
+    
+    formatted_results = []
+    for result_type, item, score in results:
+        if result_type == "found":
+            result = found_item_response(item, match_ids["found"][item.id])
+        else:
+            result = lost_item_response(item, match_ids["lost"][item.id])
+        result.update({"type": result_type, "score": score})
+        formatted_results.append(result)
+    
+    return {
+        "results": formatted_results,
+        "next_cursor": encode_offset_cursor(offset + limit) if has_more else None
+    }
+
+@app.get("/api/changes", response_model=ChangesPage)
+async def get_changes(
+    since: Optional[str] = Query(None, description="Curseur renvoyé par l'appel précédent"),
+    limit: int = Query(DEFAULT_CHANGES_PAGE_SIZE, ge=1, le=MAX_CHANGES_PAGE_SIZE),
+    db: Session = Depends(get_db)
+):
+    """
+    Objets, correspondances et suppressions postérieurs au curseur `since`, avec le curseur
+    suivant. Sans `since`, renvoie seulement la position actuelle : à appeler avant de charger
+    les listes complètes. Répond 410 si le curseur est plus ancien que le journal conservé.
+    """
+    changes_repo = ChangeLogRepository(db)
+    if since is None:
+        return {"next_cursor": encode_change_cursor(*changes_repo.current_position())}
+    
+    try:
+        position = decode_change_cursor(since)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Curseur de synchronisation invalide")
+    if changes_repo.is_expired(position):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Curseur expiré : rechargez les listes complètes"
+        )
+    
+    rows, position, has_more = changes_repo.get_changes(position, limit)
+    
+    # Seul le dernier état de chaque objet ou correspondance compte
+    latest = {}
+    for row in rows:
+        latest.pop((row.entity, row.item_id, row.other_id), None)
+        latest[(row.entity, row.item_id, row.other_id)] = row.deleted
+    
+    changed = {"found": [], "lost": [], "match": []}
+    deleted = {"found": [], "lost": [], "match": []}
+    for (entity, item_id, other_id), is_deleted in latest.items():
+        (deleted if is_deleted else changed)[entity].append((item_id, other_id) if entity == "match" else item_id)
+    
+    # État actuel des objets modifiés (ceux supprimés depuis figureront au prochain appel)
+    found_items = {item.id: item for item in FoundItemRepository(db).get_by_ids(changed["found"])}
+    lost_items = {item.id: item for item in LostItemRepository(db).get_by_ids(changed["lost"])}
+    scores = MatchRepository(db).get_scores(changed["match"])
+    
+    # Résumés pour les cartes des listes : objets modifiés et objets dont le nombre de
+    # correspondances a pu changer, pour que le client n'ait rien à recharger
+    summary_ids = {"found": set(found_items), "lost": set(lost_items)}
+    for found_id, lost_id in changed["match"] + deleted["match"]:
+        summary_ids["found"].add(found_id)
+        summary_ids["lost"].add(lost_id)
+    found_summaries = FoundItemRepository(db).get_summaries(item_ids=list(summary_ids["found"]))[0] if summary_ids["found"] else []
+    lost_summaries = LostItemRepository(db).get_summaries(item_ids=list(summary_ids["lost"]))[0] if summary_ids["lost"] else []
+    
+    return {
+        "found": found_items_response(db, [found_items[item_id] for item_id in changed["found"] if item_id in found_items]),
+        "lost": lost_items_response(db, [lost_items[item_id] for item_id in changed["lost"] if item_id in lost_items]),
+        "matches": [
+            {"found_id": found_id, "lost_id": lost_id, "score": scores[(found_id, lost_id)]}
+            for found_id, lost_id in changed["match"] if (found_id, lost_id) in scores
+        ],
+        "deleted": {
+            "found": deleted["found"],
+            "lost": deleted["lost"],
+            "matches": [{"found_id": found_id, "lost_id": lost_id} for found_id, lost_id in deleted["match"]]
+        },
+        "summaries": {
+            "found": [found_summary_response(row) for row in found_summaries],
+            "lost": [lost_summary_response(row) for row in lost_summaries]
+        },
+        "next_cursor": encode_change_cursor(*position),
+        "has_more": has_more
+    }
+
+@app.get("/api/events")
+async def stream_events():
+    """
+    Flux Server-Sent Events des objets créés, modifiés ou supprimés et des correspondances.
+    Un événement "resync" signale au client qu'il a pris du retard et doit se resynchroniser
+    avec GET /api/changes.
+    """
+    queue = event_broker.subscribe()
+    if queue is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Trop de connexions en temps réel, réessayez plus tard",
+            headers={"Retry-After": "30"}
+        )
+    
+    async def events():
+        try:
+            # Délai de reconnexion automatique du navigateur (en millisecondes)
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), settings.events_heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    # Commentaire SSE : garde la connexion ouverte à travers les proxys
+                    yield ": ping\n\n"
+                    continue
+                yield format_sse(item)
+        finally:
+            event_broker.unsubscribe(queue)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# Endpoints d'administration
+@app.get("/api/stats", response_model=StatsResponse)
+async def get_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    Statistiques des objets (admin seulement) : nombre par type, jour et lieu, taux de
+    correspondance et délai moyen de restitution, lus dans des compteurs tenus à jour
+    à chaque écriture (coût indépendant du nombre d'objets)
+    """
+    return StatsRepository(db).get_stats()
+
+@app.post("/api/admin/stats/rebuild", response_model=MessageResponse)
+async def rebuild_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    Recalcule les compteurs de statistiques à partir des objets et des correspondances
+    existants (admin seulement) ; l'historique des objets rendus est conservé
+    """
+    # Relecture de tous les objets et correspondances hors de la boucle d'événements
+    await run_in_threadpool(StatsRepository(db).rebuild)
+    
+    return {"detail": "Statistiques recalculées avec succès"}
+
+@app.post("/api/admin/rematch", response_model=MessageResponse)
+async def rematch_all_items(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    Reconstruit toutes les correspondances entre objets perdus et trouvés (admin seulement)
+    """
+    # Reconstruction et purge hors de la boucle d'événements (plusieurs secondes sur un gros catalogue)
+    await run_in_threadpool(rebuild_matches, db)
+    
+    return {"detail": "Correspondances recalculées avec succès"}
+
+@app.get("/api/admin/export/{kind}")
+async def export_items(
+    kind: str = Path(pattern="^(found|lost|matches)$"),
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    Exporte tous les objets trouvés, perdus ou leurs correspondances en NDJSON ou CSV
+    (admin seulement). L'export est lu et envoyé par morceaux, en mémoire constante.
+    """
+    filename = f"{EXPORT_FILE_NAMES[kind]}-{date.today().isoformat()}.{export_format}"
+    return StreamingResponse(
+        stream_export(kind, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@app.post("/api/admin/import/{kind}", response_model=ImportReport)
+async def import_items_file(
+    kind: str = Path(pattern="^(found|lost)$"),
+    import_format: str = Query("csv", alias="format", pattern="^(ndjson|csv)$"),
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    Importe des objets trouvés ou perdus depuis un fichier CSV (avec en-tête) ou NDJSON
+    (admin seulement). Les lignes valides sont insérées par lots et leurs correspondances
+    calculées en une seule passe ; le rapport détaille les lignes rejetées.
+    """
+    content = await file.read()
+    try:
+        # Validation, insertions et calcul des correspondances hors de la boucle d'événements
+        report = await run_in_threadpool(import_items, db, kind, content, import_format)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Le fichier doit être encodé en UTF-8")
+    
+    if report["matching_deferred"]:
+        # Les objets importés restés en attente sont repris par le calcul en arrière-plan
+        await match_worker.enqueue_pending()
+    return report
+
+@app.get("/api/admin/cache")
+async def get_cache_stats(current_user: User = Depends(get_current_admin)):
+    """
+    Statistiques des caches en mémoire de ce processus (admin seulement)
+    """
+    return {
+        "items": item_cache.stats(),
+        "lists": list_cache.stats()
+    }
+
+@app.get("/api/admin/compression")
+async def get_compression_stats(current_user: User = Depends(get_current_admin)):
+    """
+    Statistiques de compression des réponses de ce processus : taux (octets compressés /
+    octets d'origine) et temps passé par encodage (admin seulement)
+    """
+    return compression_stats.stats()
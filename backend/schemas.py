@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Annotated, List, Literal, Optional, Union
 from datetime import datetime
 
 # Schémas pour les utilisateurs
@@ -49,11 +49,43 @@ class FoundItemResponse(FoundItemBase):
     image_url: Optional[str] = None
     image_filename: Optional[str] = None
     created_at: datetime
+    updated_at: Optional[datetime] = None
     possible_matches: List[str] = []
+    match_status: str = "ready"
     
     class Config:
         from_attributes = True
 
+# Page d'objets trouvés (pagination par curseur)
+class FoundItemPage(BaseModel):
+    items: List[FoundItemResponse]
+    next_cursor: Optional[str] = None
+
+# Résumé d'un objet trouvé pour les listes (view=summary)
+class FoundItemSummary(BaseModel):
+    id: str
+    description: str  # Tronquée
+    found_date: str
+    found_time: str
+    location: str
+    thumbnail_url: Optional[str] = None
+    created_at: datetime
+    match_count: int
+    match_status: str = "ready"
+
+class FoundItemSummaryPage(BaseModel):
+    items: List[FoundItemSummary]
+    next_cursor: Optional[str] = None
+
+# Correspondance trouvée affichée dans le détail d'un objet perdu
+class FoundItemMatch(BaseModel):
+    id: str
+    description: str  # Tronquée
+    found_date: str
+    location: str
+    thumbnail_url: Optional[str] = None
+    score: Optional[float] = None
+
 # Schémas pour les objets perdus
 class LostItemBase(BaseModel):
     description: str
@@ -75,11 +107,132 @@ class LostItemUpdate(BaseModel):
 class LostItemResponse(LostItemBase):
     id: str
     created_at: datetime
+    updated_at: Optional[datetime] = None
     possible_matches: List[str] = []
+    match_status: str = "ready"
     
     class Config:
         from_attributes = True
 
+# Page d'objets perdus (pagination par curseur)
+class LostItemPage(BaseModel):
+    items: List[LostItemResponse]
+    next_cursor: Optional[str] = None
+
+# Résumé d'un objet perdu pour les listes (view=summary)
+class LostItemSummary(BaseModel):
+    id: str
+    description: str  # Tronquée
+    lost_date: str
+    lost_time: str
+    location: str
+    created_at: datetime
+    match_count: int
+    match_status: str = "ready"
+
+class LostItemSummaryPage(BaseModel):
+    items: List[LostItemSummary]
+    next_cursor: Optional[str] = None
+
+# Correspondance perdue affichée dans le détail d'un objet trouvé
+class LostItemMatch(BaseModel):
+    id: str
+    description: str  # Tronquée
+    lost_date: str
+    location: str
+    score: Optional[float] = None
+
+# Détail d'un objet avec ses correspondances, par pertinence décroissante
+class FoundItemDetail(FoundItemResponse):
+    matches: List[LostItemMatch] = []
+
+class LostItemDetail(LostItemResponse):
+    matches: List[FoundItemMatch] = []
+
+# Schéma pour l'état du calcul des correspondances d'un objet
+class MatchStatusResponse(BaseModel):
+    id: str
+    match_status: str
+    possible_matches: List[str] = []
+
+# Schémas pour la recherche d'objets
+class FoundItemSearchResult(FoundItemResponse):
+    type: Literal["found"] = "found"
+    score: Optional[float] = None  # Pertinence (absente sans mot clé recherché)
+
+class LostItemSearchResult(LostItemResponse):
+    type: Literal["lost"] = "lost"
+    score: Optional[float] = None
+
+class SearchPage(BaseModel):
+    results: List[Annotated[Union[FoundItemSearchResult, LostItemSearchResult], Field(discriminator="type")]]
+    next_cursor: Optional[str] = None
+
+# Schémas pour la synchronisation incrémentale
+class MatchEdge(BaseModel):
+    found_id: str
+    lost_id: str
+    score: Optional[float] = None  # Absent pour une correspondance supprimée
+
+class DeletedChanges(BaseModel):
+    found: List[str] = []
+    lost: List[str] = []
+    matches: List[MatchEdge] = []
+
+class ChangedSummaries(BaseModel):
+    # Résumés à jour des objets modifiés et de ceux dont les correspondances ont changé
+    found: List[FoundItemSummary] = []
+    lost: List[LostItemSummary] = []
+
+class ChangesPage(BaseModel):
+    found: List[FoundItemResponse] = []  # Objets créés ou modifiés (état actuel)
+    lost: List[LostItemResponse] = []
+    matches: List[MatchEdge] = []  # Correspondances ajoutées ou dont le score a changé
+    deleted: DeletedChanges = DeletedChanges()
+    summaries: ChangedSummaries = ChangedSummaries()
+    next_cursor: str
+    has_more: bool = False
+
+# Schémas pour l'import en masse d'objets
+class ImportRowError(BaseModel):
+    row: int  # Numéro de ligne dans le fichier importé
+    errors: List[str]
+
+class ImportReport(BaseModel):
+    imported: int
+    rejected: int
+    matches: int  # Correspondances trouvées pour les objets importés
+    matching_deferred: bool = False  # Calcul échoué, repris en arrière-plan
+    errors: List[ImportRowError] = []
+
+# Schémas pour les statistiques (admin)
+class TypeCounts(BaseModel):
+    found: int = 0
+    lost: int = 0
+
+class TypeRates(BaseModel):
+    found: Optional[float] = None
+    lost: Optional[float] = None
+
+class DayStats(BaseModel):
+    day: Optional[str] = None  # Absent pour les dates illisibles
+    found: int = 0
+    lost: int = 0
+
+class LocationStats(BaseModel):
+    location: str
+    found: int = 0
+    lost: int = 0
+
+class StatsResponse(BaseModel):
+    totals: TypeCounts
+    per_day: List[DayStats] = []
+    per_location: List[LocationStats] = []
+    matched: TypeCounts  # Objets ayant au moins une correspondance
+    match_rate: TypeRates
+    returned: TypeCounts  # Objets supprimés une fois rendus
+    average_return_hours: TypeRates  # Délai moyen entre la déclaration et la restitution
+
 # Schéma pour les réponses de base
 class MessageResponse(BaseModel):
     detail: str
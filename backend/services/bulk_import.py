@@ -0,0 +1,113 @@
+import csv
+import io
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from ..database.repositories import FoundItemRepository, LostItemRepository, MatchingService
+from ..schemas import FoundItemCreate, LostItemCreate
+
+# Nombre de lignes validées puis insérées par requête INSERT
+IMPORT_BATCH_SIZE = 500
+
+ImportRow = Tuple[int, Optional[Any], Optional[str]]  # (numéro de ligne, données, erreur de lecture)
+
+
+def _csv_rows(text: str) -> Iterator[ImportRow]:
+    # Les tableurs français séparent souvent les colonnes par des points-virgules
+    header = text.split("\n", 1)[0]
+    delimiter = ";" if header.count(";") > header.count(",") else ","
+    reader = csv.DictReader(io.StringIO(text, newline=""), delimiter=delimiter)
+    if reader.fieldnames:
+        reader.fieldnames = [name.strip() for name in reader.fieldnames]
+    for row in reader:
+        if None in row:
+            yield reader.line_num, None, "Trop de colonnes sur cette ligne"
+            continue
+        # Les cellules vides sont des valeurs manquantes
+        yield reader.line_num, {
+            name: value.strip() for name, value in row.items()
+            if value is not None and value.strip()
+        }, None
+
+
+def _ndjson_rows(text: str) -> Iterator[ImportRow]:
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line), None
+        except json.JSONDecodeError as e:
+            yield line_number, None, f"JSON invalide : {e.msg}"
+
+
+def read_rows(content: bytes, import_format: str) -> Iterator[ImportRow]:
+    """
+    Lit les lignes d'un fichier CSV (avec en-tête) ou NDJSON.
+    Lève ValueError si le fichier n'est pas encodé en UTF-8.
+    """
+    text = content.decode("utf-8-sig")
+    if import_format == "csv":
+        return _csv_rows(text)
+    return _ndjson_rows(text)
+
+
+def _batches(rows: Iterator[ImportRow], size: int) -> Iterator[List[ImportRow]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _format_error(error: Dict[str, Any]) -> str:
+    field = ".".join(str(part) for part in error["loc"])
+    return f"{field} : {error['msg']}" if field else error["msg"]
+
+
+def import_items(db: Session, item_type: str, content: bytes, import_format: str) -> Dict[str, Any]:
+    """
+    Importe des objets trouvés ou perdus depuis un fichier CSV ou NDJSON.
+
+    Les lignes sont validées puis insérées par lots, dans une seule transaction ; les lignes
+    invalides sont ignorées et décrites dans le rapport. Les correspondances des objets
+    importés sont ensuite calculées en une seule passe ; si ce calcul échoue, le rapport
+    l'indique (`matching_deferred`) et les objets restent en attente.
+    """
+    schema = FoundItemCreate if item_type == "found" else LostItemCreate
+    repo = FoundItemRepository(db) if item_type == "found" else LostItemRepository(db)
+
+    item_ids, errors = [], []
+    for batch in _batches(read_rows(content, import_format), IMPORT_BATCH_SIZE):
+        items_data = []
+        for line_number, data, read_error in batch:
+            if read_error is not None:
+                errors.append({"row": line_number, "errors": [read_error]})
+                continue
+            try:
+                items_data.append(schema.model_validate(data).model_dump())
+            except ValidationError as e:
+                errors.append({"row": line_number, "errors": [_format_error(error) for error in e.errors()]})
+        item_ids += repo.create_many(items_data)
+    db.commit()
+
+    try:
+        matches, matching_deferred = MatchingService(db).match_items(item_type, item_ids), False
+    except Exception as e:
+        # Les objets sont déjà enregistrés et restent en attente : l'appelant confie leurs
+        # correspondances au calcul en arrière-plan
+        db.rollback()
+        print(f"Erreur lors du calcul des correspondances des objets importés: {e}")
+        matches, matching_deferred = 0, True
+    return {
+        "imported": len(item_ids),
+        "rejected": len(errors),
+        "matches": matches,
+        "matching_deferred": matching_deferred,
+        "errors": errors,
+    }
@@ -0,0 +1,168 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+
+settings = get_settings()
+
+# Compteurs d'invalidation par groupe de clés (table de taille fixe : deux clés qui
+# partagent un compteur ne font que manquer un remplissage du cache)
+GENERATION_SLOTS = 4096
+
+
+class LRUCache:
+    """
+    Cache borné en mémoire : les entrées expirent après `ttl_seconds` et les moins
+    récemment utilisées sont évincées au-delà de `max_entries`. Sûr entre threads.
+
+    Pour ne pas remettre en cache une valeur lue avant une invalidation concurrente,
+    relever `generation(key)` avant la lecture et le passer à `set`.
+    """
+    def __init__(self, name: str, max_entries: int, ttl_seconds: float, enabled: bool = True):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generations = [0] * GENERATION_SLOTS
+        self._clears = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def generation(self, key: Hashable) -> tuple:
+        """
+        Jeton qui change à chaque invalidation de `key`, à relever avant de lire sa valeur
+        """
+        with self._lock:
+            return self._generation(key)
+
+    def _generation(self, key: Hashable) -> tuple:
+        return self._clears, self._generations[hash(key) % GENERATION_SLOTS]
+
+    def set(self, key: Hashable, value: Any, generation: Optional[tuple] = None):
+        """
+        Met en cache `value`, sauf si `key` a été invalidée depuis le relevé de `generation`
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation(key):
+                return
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            # Même absente du cache, la clé peut être en cours de lecture
+            self._generations[hash(key) % GENERATION_SLOTS] += 1
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]):
+        """
+        Supprime les entrées dont la clé vérifie `predicate`
+        """
+        with self._lock:
+            self._clears += 1
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._clears += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+def invalidate_after_commit(db: Session, invalidation: Callable[[], None]):
+    """
+    Programme une invalidation de cache à la validation de la transaction de `db`,
+    pour qu'une lecture concurrente ne remette pas en cache l'état précédent
+    """
+    db.info.setdefault("cache_invalidations", []).append(invalidation)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_invalidations(session: Session):
+    for invalidation in session.info.pop("cache_invalidations", []):
+        invalidation()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_invalidations(session: Session):
+    session.info.pop("cache_invalidations", None)
+
+
+def invalidate_items_after_commit(db: Session, item_type: str, item_ids):
+    """
+    Retire du cache les objets modifiés, à la validation de la transaction
+    """
+    keys = [(item_type, item_id) for item_id in item_ids]
+
+    def invalidate():
+        for key in keys:
+            item_cache.invalidate(key)
+
+    invalidate_after_commit(db, invalidate)
+
+
+def invalidate_lists_after_commit(db: Session, collections):
+    """
+    Retire du cache les pages des collections modifiées, à la validation de la transaction
+    """
+    collections = set(collections)
+    invalidate_after_commit(db, lambda: list_cache.invalidate_where(lambda key: key[0] in collections))
+
+
+# Réponses formatées des objets, par (type d'objet, identifiant)
+item_cache = LRUCache("items", settings.cache_max_items, settings.cache_ttl_seconds, settings.cache_enabled)
+
+# Pages des listes formatées, par (collection, ETag, paramètres de la page)
+list_cache = LRUCache("lists", settings.cache_max_pages, settings.cache_ttl_seconds, settings.cache_enabled)
@@ -61,5 +61,13 @@ class CloudStorageService:
             print(f"Erreur lors de la suppression du fichier Cloudinary: {e}")
             return False
 
+    def thumbnail_url(self, file_url: str, size: int = 300) -> str:
+        """
+        URL d'une miniature carrée de l'image, générée à la demande par Cloudinary
+        """
+        if "/upload/" not in file_url:
+            return file_url
+        return file_url.replace("/upload/", f"/upload/c_fill,w_{size},h_{size},q_auto,f_auto/", 1)
+
 # Créer une instance du service de stockage cloud
 cloud_storage_service = CloudStorageService()
@@ -0,0 +1,263 @@
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config import get_settings
+
+settings = get_settings()
+
+# Compressions optionnelles (pip install brotli zstandard)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Types de contenu compressés (les flux d'événements SSE ne le sont jamais)
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/csv", "text/plain", "text/html")
+
+# Niveaux admis par chaque encodage : les niveaux configurés sont ramenés dans ces bornes
+LEVEL_BOUNDS = {"gzip": (1, 9), "br": (0, 11), "zstd": (1, 19)}
+
+
+class _Compressor:
+    """
+    Compression incrémentale d'un corps de réponse (en un morceau ou en flux)
+    """
+    def __init__(self, encoding: str, level: int):
+        if encoding == "gzip":
+            compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31 : en-tête gzip
+            self.compress, self.flush = compressor.compress, compressor.flush
+        elif encoding == "br":
+            compressor = brotli.Compressor(quality=level)
+            self.compress, self.flush = compressor.process, compressor.finish
+        else:
+            compressor = zstandard.ZstdCompressor(level=level).compressobj()
+            self.compress, self.flush = compressor.compress, compressor.flush
+
+
+class CompressionStats:
+    """
+    Compteurs par encodage : réponses compressées, octets avant/après, temps de compression
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._encodings: Dict[str, Dict[str, float]] = {}
+        self.below_threshold = 0
+
+    def record(self, encoding: str, bytes_in: int, bytes_out: int, seconds: float):
+        with self._lock:
+            counters = self._encodings.setdefault(
+                encoding, {"responses": 0, "bytes_in": 0, "bytes_out": 0, "seconds": 0.0}
+            )
+            counters["responses"] += 1
+            counters["bytes_in"] += bytes_in
+            counters["bytes_out"] += bytes_out
+            counters["seconds"] += seconds
+
+    def record_skipped(self):
+        with self._lock:
+            self.below_threshold += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "below_threshold": self.below_threshold,
+                "encodings": {
+                    encoding: {
+                        "responses": counters["responses"],
+                        "bytes_in": counters["bytes_in"],
+                        "bytes_out": counters["bytes_out"],
+                        "ratio": round(counters["bytes_out"] / counters["bytes_in"], 4) if counters["bytes_in"] else None,
+                        "milliseconds": round(counters["seconds"] * 1000, 2),
+                        "milliseconds_per_mb": (
+                            round(counters["seconds"] * 1000 / (counters["bytes_in"] / 1e6), 2)
+                            if counters["bytes_in"] else None
+                        ),
+                    }
+                    for encoding, counters in self._encodings.items()
+                },
+            }
+
+
+def available_encodings() -> List[str]:
+    """
+    Encodages configurés (par ordre de préférence) dont la bibliothèque est installée
+    """
+    installed = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+    return [
+        encoding.strip() for encoding in settings.compression_encodings.split(",")
+        if installed.get(encoding.strip())
+    ]
+
+
+def _accepted_encodings(accept_encoding: str) -> set:
+    accepted = set()
+    for part in accept_encoding.split(","):
+        encoding, _, params = part.partition(";")
+        name, _, quality = params.partition("=")
+        try:
+            # "gzip;q=0" : encodage explicitement refusé
+            if name.strip() == "q" and float(quality) == 0:
+                continue
+        except ValueError:
+            pass
+        accepted.add(encoding.strip().lower())
+    return accepted
+
+
+class CompressionMiddleware:
+    """
+    Compresse les réponses de l'API (JSON, NDJSON, CSV) dans le meilleur encodage accepté
+    par le client : zstd ou brotli s'ils sont installés, gzip sinon.
+
+    Les corps plus petits que `min_size` sont envoyés tels quels ; la compression des
+    morceaux plus grands que `offload_min_size` est faite hors de la boucle d'événements.
+    Les réponses en flux (exports) sont compressées morceau par morceau, une fois leurs
+    premiers morceaux accumulés jusqu'à `min_size` octets.
+    """
+    def __init__(
+        self,
+        app: ASGIApp,
+        min_size: int,
+        offload_min_size: int,
+        levels: Dict[str, int],
+        path_prefix: str = "/api/"
+    ):
+        self.app = app
+        self.min_size = min_size
+        self.offload_min_size = offload_min_size
+        self.levels = {
+            encoding: min(max(level, LEVEL_BOUNDS[encoding][0]), LEVEL_BOUNDS[encoding][1])
+            for encoding, level in levels.items()
+        }
+        self.path_prefix = path_prefix
+        self.encodings = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        accepted = _accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        encoding = next((encoding for encoding in self.encodings if encoding in accepted), None)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    async def run_compression(self, function: Callable[..., bytes], data: bytes) -> bytes:
+        if len(data) >= self.offload_min_size:
+            return await run_in_threadpool(function, data)
+        return function(data)
+
+
+class _CompressingResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send_downstream = send
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+        self.buffered: List[bytes] = []
+        self.buffered_size = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.seconds = 0.0
+
+    def _is_compressible(self, headers: MutableHeaders) -> bool:
+        content_type = headers.get("content-type", "")
+        return (
+            self.start_message["status"] not in (204, 304)
+            and "content-encoding" not in headers
+            and content_type.startswith(COMPRESSIBLE_TYPES)
+        )
+
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send_downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            if not self._is_compressible(headers):
+                self.passthrough = True
+                await self.send_downstream(self.start_message)
+                await self.send_downstream(message)
+                return
+
+            # Réponse en flux : les premiers morceaux sont retenus jusqu'à `min_size` octets
+            # (ou la fin du flux) pour décider de la compression sur une taille réelle
+            self.buffered.append(body)
+            self.buffered_size += len(body)
+            if more_body and self.buffered_size < self.middleware.min_size:
+                return
+            body = b"".join(self.buffered)
+            self.buffered = []
+
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body and len(body) < self.middleware.min_size:
+                compression_stats.record_skipped()
+                self.passthrough = True
+                await self.send_downstream(self.start_message)
+                await self.send_downstream({"type": "http.response.body", "body": body})
+                return
+
+            self.compressor = _Compressor(self.encoding, self.middleware.levels[self.encoding])
+            headers["Content-Encoding"] = self.encoding
+            if more_body:
+                # Réponse en flux : la taille finale n'est pas connue à l'avance
+                del headers["Content-Length"]
+            else:
+                compressed = await self._compress(body, final=True)
+                headers["Content-Length"] = str(len(compressed))
+                await self.send_downstream(self.start_message)
+                await self.send_downstream({"type": "http.response.body", "body": compressed})
+                self._record()
+                return
+            await self.send_downstream(self.start_message)
+
+        compressed = await self._compress(body, final=not more_body)
+        if compressed or not more_body:
+            await self.send_downstream({"type": "http.response.body", "body": compressed, "more_body": more_body})
+        if not more_body:
+            self._record()
+
+    async def _compress(self, data: bytes, final: bool) -> bytes:
+        compressor = self.compressor
+
+        def compress(chunk: bytes) -> bytes:
+            output = compressor.compress(chunk)
+            return output + compressor.flush() if final else output
+
+        started = time.perf_counter()
+        output = await self.middleware.run_compression(compress, data)
+        self.seconds += time.perf_counter() - started
+        self.bytes_in += len(data)
+        self.bytes_out += len(output)
+        return output
+
+    def _record(self):
+        compression_stats.record(self.encoding, self.bytes_in, self.bytes_out, self.seconds)
+
+
+# Statistiques de compression de ce processus
+compression_stats = CompressionStats()
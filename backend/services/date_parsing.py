@@ -0,0 +1,26 @@
+from datetime import date, datetime
+from typing import Optional
+
+# Formats acceptés pour les dates saisies (le formulaire envoie AAAA-MM-JJ)
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y", "%Y/%m/%d")
+
+
+def parse_item_date(value: Optional[str]) -> Optional[date]:
+    """
+    Convertit la date saisie pour un objet en date, ou None si elle est illisible
+    """
+    value = (value or "").strip()
+    if not value:
+        return None
+
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            pass
+
+    # Dates ISO avec heure ("2024-07-12T10:30:00")
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        return None
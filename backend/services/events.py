@@ -0,0 +1,93 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+
+settings = get_settings()
+
+# Événement envoyé à un client trop lent dont la file a débordé : il doit se resynchroniser
+# (GET /api/changes) car des événements ont été perdus
+RESYNC_EVENT = {"type": "resync"}
+
+
+class EventBroker:
+    """
+    Diffuse les événements (objets créés, modifiés, supprimés, nouvelles correspondances)
+    aux clients connectés de ce processus.
+
+    Chaque client a une file bornée : si elle déborde, elle est vidée et remplacée par un
+    événement "resync", sans jamais bloquer les écritures. Le nombre de connexions est plafonné.
+    """
+    def __init__(self, max_subscribers: int, queue_size: int):
+        self.max_subscribers = max_subscribers
+        self.queue_size = queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+
+    def subscribe(self) -> Optional[asyncio.Queue]:
+        """
+        Nouvelle file d'événements pour un client, ou None si le plafond de connexions est atteint
+        """
+        if len(self._subscribers) >= self.max_subscribers:
+            return None
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    def publish(self, events: List[Dict[str, Any]]):
+        """
+        Diffuse des événements ; peut être appelé depuis n'importe quel thread
+        """
+        if self._loop is None or not events:
+            return
+        self._loop.call_soon_threadsafe(self._dispatch, events)
+
+    def _dispatch(self, events: List[Dict[str, Any]]):
+        for queue in list(self._subscribers):
+            for item in events:
+                try:
+                    queue.put_nowait(item)
+                except asyncio.QueueFull:
+                    # Client trop lent : abandonner son retard plutôt que de le mettre en mémoire
+                    while not queue.empty():
+                        queue.get_nowait()
+                    queue.put_nowait(RESYNC_EVENT)
+                    break
+
+
+def format_sse(item: Dict[str, Any]) -> str:
+    """
+    Formate un événement pour un flux Server-Sent Events
+    """
+    return f"event: {item['type']}\ndata: {json.dumps(item)}\n\n"
+
+
+def publish_after_commit(db: Session, events: List[Dict[str, Any]]):
+    """
+    Diffuse des événements une fois la transaction de `db` validée (jamais en cas d'annulation)
+    """
+    db.info.setdefault("pending_events", []).extend(events)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_events(session: Session):
+    event_broker.publish(session.info.pop("pending_events", []))
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending_events(session: Session):
+    session.info.pop("pending_events", None)
+
+
+# Créer une instance du diffuseur d'événements
+event_broker = EventBroker(settings.events_max_connections, settings.events_queue_size)
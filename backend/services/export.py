@@ -0,0 +1,54 @@
+import csv
+import io
+from typing import Iterator, List
+
+from ..database.db import SessionLocal
+from ..database.repositories import ExportRepository
+from .serialization import dumps
+
+# Types de contenu des formats d'export
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",  # Starlette ajoute "; charset=utf-8"
+}
+
+# Noms des fichiers exportés, par type d'export
+EXPORT_FILE_NAMES = {
+    "found": "objets-trouves",
+    "lost": "objets-perdus",
+    "matches": "correspondances",
+}
+
+# Nombre de lignes lues en base et envoyées au client par morceau
+EXPORT_BATCH_SIZE = 1000
+
+
+def _csv_chunk(rows: List[list]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def stream_export(kind: str, export_format: str) -> Iterator[bytes]:
+    """
+    Produit l'export `kind` au format NDJSON ou CSV, morceau par morceau.
+
+    Utilise sa propre session : le flux est consommé après la fin de l'endpoint,
+    dans un thread séparé (StreamingResponse itère les générateurs synchrones hors
+    de la boucle d'événements).
+    """
+    db = SessionLocal()
+    try:
+        export_repo = ExportRepository(db)
+        field_names = export_repo.field_names(kind)
+        if export_format == "csv":
+            # BOM UTF-8 : les accents s'affichent correctement à l'ouverture dans Excel
+            yield "﻿".encode("utf-8") + _csv_chunk([field_names])
+
+        for rows in export_repo.stream(kind, EXPORT_BATCH_SIZE):
+            if export_format == "csv":
+                yield _csv_chunk([[row[name] for name in field_names] for row in rows])
+            else:
+                yield b"".join(dumps(row) + b"\n" for row in rows)
+    finally:
+        db.close()
@@ -0,0 +1,59 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request
+
+
+def make_etag(versions: Dict[str, int]) -> str:
+    """
+    ETag faible construit à partir des versions des collections dont dépend une réponse
+    """
+    return 'W/"' + "-".join(f"{name}{version}" for name, version in sorted(versions.items())) + '"'
+
+
+def http_date(value: datetime) -> str:
+    """
+    Date au format HTTP (les dates stockées sont en UTC, sans fuseau)
+    """
+    return format_datetime(value.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+
+def validator_headers(etag: str, last_modified: datetime) -> Dict[str, str]:
+    return {
+        "ETag": etag,
+        "Last-Modified": http_date(last_modified),
+        # Le client peut garder la réponse mais doit la revalider à chaque utilisation
+        "Cache-Control": "no-cache",
+    }
+
+
+def _parse_http_date(value: str) -> Optional[datetime]:
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    """
+    Indique si la copie du client est à jour (If-None-Match est prioritaire sur If-Modified-Since)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        weak_etag = etag[2:] if etag.startswith("W/") else etag
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate == "*" or (candidate[2:] if candidate.startswith("W/") else candidate) == weak_etag:
+                return True
+        return False
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        since = _parse_http_date(if_modified_since)
+        if since is not None:
+            return last_modified.replace(tzinfo=timezone.utc, microsecond=0) <= since
+    return False
@@ -0,0 +1,177 @@
+import asyncio
+import time
+from typing import Dict, Optional, Set, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from ..config import get_settings
+from ..database.db import SessionLocal
+from ..database.models import FoundItem, LostItem, MATCH_STATUS_PENDING
+from ..database.repositories import ChangeLogRepository, MatchingService
+
+settings = get_settings()
+
+JobKey = Tuple[str, str]  # (type d'objet, identifiant)
+
+
+class MatchWorker:
+    """
+    Calcule les correspondances en arrière-plan, hors du chemin des requêtes.
+
+    Les demandes successives pour un même objet sont regroupées : le calcul n'est
+    lancé qu'après `debounce_seconds` sans nouvelle demande pour cet objet.
+    Le journal des modifications est aussi purgé toutes les `prune_interval_seconds`.
+    """
+    def __init__(self, debounce_seconds: float, prune_interval_seconds: float):
+        self.debounce_seconds = debounce_seconds
+        self.prune_interval_seconds = prune_interval_seconds
+        self._next_prune = 0.0
+        self._deadlines: Dict[JobKey, float] = {}
+        self._running: Set[JobKey] = set()
+        self._waiters: Dict[JobKey, asyncio.Event] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        self._wakeup = asyncio.Event()
+        # Le journal vient d'être purgé au démarrage de l'application
+        self._next_prune = time.monotonic() + self.prune_interval_seconds
+        self._task = asyncio.create_task(self._run())
+
+        # Reprendre les objets restés en attente (par exemple après un redémarrage)
+        await self.enqueue_pending()
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        # Traiter immédiatement les demandes restantes
+        for key in list(self._deadlines):
+            await self._process(key)
+
+    def enqueue(self, item_type: str, item_id: str):
+        """
+        Demande le recalcul des correspondances d'un objet
+        """
+        self._deadlines[(item_type, item_id)] = time.monotonic() + self.debounce_seconds
+        if self._wakeup:
+            self._wakeup.set()
+
+    async def enqueue_pending(self):
+        """
+        Demande le recalcul des correspondances de tous les objets encore en attente
+        """
+        for item_type, item_id in await run_in_threadpool(self._pending_items):
+            self.enqueue(item_type, item_id)
+
+    def is_pending(self, item_type: str, item_id: str) -> bool:
+        key = (item_type, item_id)
+        return key in self._deadlines or key in self._running
+
+    async def wait_for(self, item_type: str, item_id: str, timeout: float) -> bool:
+        """
+        Attend la fin du calcul des correspondances d'un objet (True si terminé à temps)
+        """
+        key = (item_type, item_id)
+        if not self.is_pending(item_type, item_id):
+            return True
+
+        event = self._waiters.setdefault(key, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _run(self):
+        while True:
+            if time.monotonic() >= self._next_prune:
+                await self._prune()
+                continue
+
+            if not self._deadlines:
+                await self._wait(self._next_prune - time.monotonic())
+                continue
+
+            key, deadline = min(self._deadlines.items(), key=lambda entry: entry[1])
+            delay = min(deadline, self._next_prune) - time.monotonic()
+            if delay > 0:
+                await self._wait(delay)
+                continue
+
+            await self._process(key)
+
+    async def _wait(self, delay: float):
+        """
+        Attend l'échéance, ou une nouvelle demande qui peut la repousser
+        """
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _prune(self):
+        self._next_prune = time.monotonic() + self.prune_interval_seconds
+        try:
+            await run_in_threadpool(self._prune_changes)
+        except Exception as e:
+            print(f"Erreur lors de la purge du journal des modifications: {e}")
+
+    async def _process(self, key: JobKey):
+        self._deadlines.pop(key, None)
+        self._running.add(key)
+        try:
+            await run_in_threadpool(self._rematch, *key)
+        except Exception as e:
+            print(f"Erreur lors du calcul des correspondances de {key[0]}:{key[1]}: {e}")
+        finally:
+            self._running.discard(key)
+
+        # Si l'objet a été redemandé entre-temps, les clients attendent le prochain calcul
+        if key not in self._deadlines:
+            event = self._waiters.pop(key, None)
+            if event:
+                event.set()
+
+    def _rematch(self, item_type: str, item_id: str):
+        db = SessionLocal()
+        try:
+            matching_service = MatchingService(db)
+            if item_type == "found":
+                matching_service.match_found_item(item_id)
+            else:
+                matching_service.match_lost_item(item_id)
+        finally:
+            db.close()
+
+    def _prune_changes(self):
+        db = SessionLocal()
+        try:
+            ChangeLogRepository(db).prune(settings.changes_retention_days)
+        finally:
+            db.close()
+
+    def _pending_items(self):
+        db = SessionLocal()
+        try:
+            pending = [
+                ("found", item_id) for (item_id,) in
+                db.query(FoundItem.id).filter(FoundItem.match_status == MATCH_STATUS_PENDING)
+            ]
+            pending += [
+                ("lost", item_id) for (item_id,) in
+                db.query(LostItem.id).filter(LostItem.match_status == MATCH_STATUS_PENDING)
+            ]
+            return pending
+        finally:
+            db.close()
+
+
+# Créer une instance du worker de correspondance
+match_worker = MatchWorker(settings.match_debounce_seconds, settings.changes_prune_interval_seconds)
@@ -0,0 +1,293 @@
+import math
+from datetime import date
+from typing import Dict, Optional, Set, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from .text_processing import trigrams
+
+# Nombre de lignes (objets trouvés) traitées par produit matriciel lors d'une
+# reconstruction complète, pour borner la mémoire utilisée
+BATCH_ROWS = 5000
+
+# Longueur minimale des mots clés comparés par similarité de trigrammes
+FUZZY_MIN_TOKEN_LENGTH = 4
+
+# Précision des scores : des sommes identiques calculées dans un autre ordre (calcul
+# incrémental, reconstruction complète) donnent le même score et le même classement
+SCORE_DECIMALS = 9
+
+
+def inverse_document_frequency(document_frequency: int, total_documents: int) -> float:
+    """
+    Poids IDF (BM25) d'un mot clé : plus un mot est fréquent dans le corpus, moins il pèse
+    """
+    return math.log(1 + (total_documents - document_frequency + 0.5) / (document_frequency + 0.5))
+
+
+def _document_term_matrix(documents: Dict[str, set], vocabulary: Dict[str, int]) -> sparse.csr_matrix:
+    """
+    Matrice creuse binaire documents x mots clés
+    """
+    indptr = [0]
+    indices = []
+    for keywords in documents.values():
+        indices.extend(vocabulary[token] for token in keywords)
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.float64)
+    return sparse.csr_matrix(
+        (data, np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+        shape=(len(documents), len(vocabulary))
+    )
+
+
+def _similarity_matrix(vocabulary: Dict[str, int], min_similarity: float) -> sparse.csr_matrix:
+    """
+    Matrice creuse mots clés x mots clés des similarités de trigrammes atteignant
+    `min_similarity` (1 sur la diagonale), pour tolérer les fautes de frappe
+    """
+    tokens = list(vocabulary)
+    size = len(tokens)
+    comparable = np.array([len(token) >= FUZZY_MIN_TOKEN_LENGTH for token in tokens])
+
+    trigram_columns = {}
+    indptr, indices = [0], []
+    for token, is_comparable in zip(tokens, comparable):
+        if is_comparable:
+            indices.extend(trigram_columns.setdefault(trigram, len(trigram_columns)) for trigram in trigrams(token))
+        indptr.append(len(indices))
+    trigram_matrix = sparse.csr_matrix(
+        (np.ones(len(indices)), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+        shape=(size, max(len(trigram_columns), 1))
+    )
+    trigram_counts = np.diff(trigram_matrix.indptr)
+    trigram_matrix_t = trigram_matrix.T.tocsr()
+
+    rows, cols, similarities = [np.arange(size)], [np.arange(size)], [np.ones(size)]
+    for start in range(0, size, BATCH_ROWS):
+        # Nombre de trigrammes communs pour chaque paire de mots clés du bloc
+        shared = (trigram_matrix[start:start + BATCH_ROWS] @ trigram_matrix_t).tocoo()
+        block_rows = shared.row + start
+        similarity = shared.data / (trigram_counts[block_rows] + trigram_counts[shared.col] - shared.data)
+        keep = (similarity >= min_similarity) & (block_rows != shared.col)
+        rows.append(block_rows[keep])
+        cols.append(shared.col[keep])
+        similarities.append(similarity[keep])
+
+    return sparse.csr_matrix(
+        (np.concatenate(similarities), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(size, size)
+    )
+
+
+def _day_numbers(dates: Dict[str, Optional[date]], item_ids) -> np.ndarray:
+    """
+    Numéros de jour des objets (-1 si la date est inconnue)
+    """
+    return np.array(
+        [dates[item_id].toordinal() if dates.get(item_id) else -1 for item_id in item_ids],
+        dtype=np.int64
+    )
+
+
+def _id_ranks(item_ids) -> np.ndarray:
+    """
+    Rang de chaque identifiant dans l'ordre alphabétique
+    """
+    return np.argsort(np.argsort(np.array(item_ids, dtype=str), kind="stable"), kind="stable")
+
+
+def _top_k_mask(groups: np.ndarray, scores: np.ndarray, top_k: int, tiebreak: np.ndarray) -> np.ndarray:
+    """
+    Masque des entrées faisant partie des `top_k` meilleurs scores de leur groupe
+    (à score égal, dans l'ordre de `tiebreak`)
+    """
+    order = np.lexsort((tiebreak, -scores, groups))
+    sorted_groups = groups[order]
+    # Rang de chaque entrée dans son groupe : position - début du groupe
+    starts = np.r_[0, np.flatnonzero(np.diff(sorted_groups)) + 1]
+    group_sizes = np.diff(np.r_[starts, len(sorted_groups)])
+    ranks = np.arange(len(sorted_groups)) - np.repeat(starts, group_sizes)
+    mask = np.zeros(len(scores), dtype=bool)
+    mask[order[ranks < top_k]] = True
+    return mask
+
+
+def top_k_ids(scores: Dict[str, float], top_k: int) -> Set[str]:
+    """
+    Identifiants des `top_k` meilleurs scores, dans le même ordre que la reconstruction
+    complète (score décroissant, puis identifiant)
+    """
+    ranked = sorted(scores.items(), key=lambda entry: (-entry[1], entry[0]))
+    return {item_id for item_id, _ in ranked[:top_k]}
+
+
+def compute_batch_matches(
+    found_keywords: Dict[str, set],
+    lost_keywords: Dict[str, set],
+    mode: str,
+    min_common_keywords: int,
+    min_score: float,
+    top_k: Optional[int],
+    found_dates: Optional[Dict[str, Optional[date]]] = None,
+    lost_dates: Optional[Dict[str, Optional[date]]] = None,
+    date_window: Optional[Tuple[int, int]] = None,
+    fuzzy_min_similarity: Optional[float] = None,
+    corpus_frequencies: Optional[Dict[str, int]] = None,
+    corpus_size: Optional[int] = None
+) -> Dict[Tuple[str, str], float]:
+    """
+    Calcule toutes les correspondances (identifiant trouvé, identifiant perdu) -> score
+    par produits de matrices creuses documents x mots clés.
+
+    En mode "legacy", renvoie exactement les paires ayant au moins
+    `min_common_keywords` mots clés communs (score = nombre de mots communs).
+    Sinon, le score est la somme des IDF des mots communs et seules les paires au-dessus
+    de `min_score` faisant partie du top-K d'au moins un des deux objets sont conservées
+    (toutes les paires au-dessus de `min_score` si `top_k` est None).
+
+    Avec `date_window` = (jours avant, jours après), seules les paires dont l'objet a été
+    trouvé entre `jours avant` la perte et `jours après` celle-ci sont évaluées ; les objets
+    sans date lisible sont comparés à tous les autres.
+
+    Avec `fuzzy_min_similarity`, les mots clés des objets trouvés correspondent aussi aux mots
+    proches (similarité de trigrammes), avec un poids égal à leur similarité.
+
+    Quand seule une partie des objets est comparée (import en masse), `corpus_frequencies`
+    et `corpus_size` donnent les fréquences des mots clés et le nombre d'objets de toute
+    la base, pour que les poids IDF restent ceux du corpus complet.
+    """
+    if not found_keywords or not lost_keywords:
+        return {}
+
+    vocabulary = {}
+    for documents in (found_keywords, lost_keywords):
+        for keywords in documents.values():
+            for token in keywords:
+                vocabulary.setdefault(token, len(vocabulary))
+
+    found_matrix = _document_term_matrix(found_keywords, vocabulary)
+    lost_matrix_t = _document_term_matrix(lost_keywords, vocabulary).T.tocsr()
+
+    # Poids IDF de chaque mot clé sur l'ensemble du corpus
+    if corpus_frequencies is not None:
+        total_documents = corpus_size
+        document_frequencies = np.array(
+            [corpus_frequencies.get(token, 1) for token in vocabulary], dtype=np.float64
+        )
+    else:
+        total_documents = len(found_keywords) + len(lost_keywords)
+        document_frequencies = (
+            np.asarray(found_matrix.sum(axis=0)).ravel()
+            + np.asarray(lost_matrix_t.sum(axis=1)).ravel()
+        )
+
+    if fuzzy_min_similarity is not None:
+        # Chaque objet trouvé « contient » aussi les mots proches des siens, pondérés par
+        # leur similarité (plafonnée à 1) ; les comptes de mots communs restent binaires
+        found_matrix = (found_matrix @ _similarity_matrix(vocabulary, fuzzy_min_similarity)).tocsr()
+        found_matrix.data = np.minimum(found_matrix.data, 1.0)
+        binary_found_matrix = found_matrix.copy()
+        binary_found_matrix.data = np.ones_like(binary_found_matrix.data)
+    else:
+        binary_found_matrix = found_matrix
+    idf = np.log(1 + (total_documents - document_frequencies + 0.5) / (document_frequencies + 0.5))
+    weighted_lost_matrix_t = sparse.diags(idf) @ lost_matrix_t
+
+    found_ids = list(found_keywords)
+    lost_ids = list(lost_keywords)
+    all_lost_columns = np.arange(len(lost_ids))
+
+    if date_window:
+        days_before, days_after = date_window
+        found_days = _day_numbers(found_dates or {}, found_ids)
+        lost_days = _day_numbers(lost_dates or {}, lost_ids)
+        # Les objets trouvés sont traités par date croissante (dates inconnues à la fin)
+        # pour que chaque bloc ne soit comparé qu'aux objets perdus de la même période
+        found_order = np.lexsort((found_days, found_days < 0))
+        lost_order = np.argsort(lost_days, kind="stable")
+        sorted_lost_days = lost_days[lost_order]
+        undated_lost_columns = np.flatnonzero(lost_days < 0)
+        lost_matrix_t = lost_matrix_t.tocsc()
+        weighted_lost_matrix_t = weighted_lost_matrix_t.tocsc()
+    else:
+        found_order = np.arange(len(found_ids))
+
+    rows, cols, scores = [], [], []
+    for start in range(0, len(found_ids), BATCH_ROWS):
+        block_found_rows = found_order[start:start + BATCH_ROWS]
+        block = found_matrix[block_found_rows]
+        binary_block = binary_found_matrix[block_found_rows]
+        lost_columns = all_lost_columns
+
+        if date_window and found_days[block_found_rows].min() >= 0:
+            # Objets perdus dont la date est compatible avec celles du bloc (ou inconnue)
+            first_day = found_days[block_found_rows].min() - days_after
+            last_day = found_days[block_found_rows].max() + days_before
+            lo = np.searchsorted(sorted_lost_days, first_day, side="left")
+            hi = np.searchsorted(sorted_lost_days, last_day, side="right")
+            lost_columns = np.sort(np.concatenate([lost_order[lo:hi], undated_lost_columns]))
+            if not len(lost_columns):
+                continue
+
+        if lost_columns is all_lost_columns:
+            block_lost_matrix_t, block_weighted_lost_matrix_t = lost_matrix_t, weighted_lost_matrix_t
+        else:
+            block_lost_matrix_t = lost_matrix_t[:, lost_columns]
+            block_weighted_lost_matrix_t = weighted_lost_matrix_t[:, lost_columns]
+
+        # Nombre de mots clés communs pour chaque paire du bloc
+        common_counts = (binary_block @ block_lost_matrix_t).tocsr()
+        common_counts.sort_indices()
+        block_rows = np.repeat(np.arange(block.shape[0]), np.diff(common_counts.indptr))
+        keep = common_counts.data >= min_common_keywords
+
+        if mode == "legacy":
+            block_scores = common_counts.data
+        else:
+            # Les poids IDF étant strictement positifs, ce produit a exactement
+            # la même structure creuse que celui des nombres de mots communs
+            weighted = (block @ block_weighted_lost_matrix_t).tocsr()
+            weighted.sort_indices()
+            block_scores = weighted.data
+
+        block_rows = block_found_rows[block_rows[keep]]
+        block_cols = lost_columns[common_counts.indices[keep]]
+        block_scores = block_scores[keep]
+
+        if date_window:
+            found_day = found_days[block_rows]
+            lost_day = lost_days[block_cols]
+            in_window = (found_day < 0) | (lost_day < 0) | (
+                (found_day >= lost_day - days_before) & (found_day <= lost_day + days_after)
+            )
+            block_rows, block_cols, block_scores = block_rows[in_window], block_cols[in_window], block_scores[in_window]
+
+        rows.append(block_rows)
+        cols.append(block_cols)
+        scores.append(block_scores)
+
+    if not rows:
+        return {}
+
+    rows = np.concatenate(rows)
+    cols = np.concatenate(cols)
+    scores = np.concatenate(scores).astype(np.float64)
+
+    if mode != "legacy" and len(scores):
+        scores = np.round(scores, SCORE_DECIMALS)
+        above_threshold = scores >= min_score
+        rows, cols, scores = rows[above_threshold], cols[above_threshold], scores[above_threshold]
+        if top_k is not None:
+            found_ranks, lost_ranks = _id_ranks(found_ids), _id_ranks(lost_ids)
+            keep = (
+                _top_k_mask(rows, scores, top_k, lost_ranks[cols])
+                | _top_k_mask(cols, scores, top_k, found_ranks[rows])
+            )
+            rows, cols, scores = rows[keep], cols[keep], scores[keep]
+
+    return {
+        (found_ids[row], lost_ids[col]): float(score)
+        for row, col, score in zip(rows.tolist(), cols.tolist(), scores.tolist())
+    }
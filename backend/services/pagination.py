@@ -0,0 +1,73 @@
+import base64
+from datetime import datetime
+from typing import Tuple
+
+# Taille de page par défaut et maximale des listes d'objets
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Nombre de modifications par défaut et maximal renvoyées par la synchronisation incrémentale
+DEFAULT_CHANGES_PAGE_SIZE = 500
+MAX_CHANGES_PAGE_SIZE = 5000
+
+
+def encode_cursor(created_at: datetime, item_id: str) -> str:
+    """
+    Curseur opaque désignant la position (created_at, id) du dernier objet d'une page
+    """
+    raw = f"{created_at.isoformat()}|{item_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Relit un curseur produit par encode_cursor (ValueError s'il est invalide)
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, item_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), item_id
+    except (UnicodeError, ValueError) as e:
+        raise ValueError(f"Curseur invalide: {cursor}") from e
+
+
+def encode_offset_cursor(offset: int) -> str:
+    """
+    Curseur opaque d'une liste classée par pertinence (position du premier résultat suivant)
+    """
+    return base64.urlsafe_b64encode(f"offset|{offset}".encode("utf-8")).decode("ascii")
+
+
+def decode_offset_cursor(cursor: str) -> int:
+    """
+    Relit un curseur produit par encode_offset_cursor (ValueError s'il est invalide)
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        prefix, offset = raw.split("|", 1)
+        if prefix != "offset" or int(offset) < 0:
+            raise ValueError(cursor)
+        return int(offset)
+    except (UnicodeError, ValueError) as e:
+        raise ValueError(f"Curseur invalide: {cursor}") from e
+
+
+def encode_change_cursor(version: int, change_id: int) -> str:
+    """
+    Curseur opaque désignant une position (version, id) du journal des modifications
+    """
+    return base64.urlsafe_b64encode(f"changes|{version}|{change_id}".encode("utf-8")).decode("ascii")
+
+
+def decode_change_cursor(cursor: str) -> Tuple[int, int]:
+    """
+    Relit un curseur produit par encode_change_cursor (ValueError s'il est invalide)
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        prefix, version, change_id = raw.split("|", 2)
+        if prefix != "changes" or int(version) < 0 or int(change_id) < 0:
+            raise ValueError(cursor)
+        return int(version), int(change_id)
+    except (UnicodeError, ValueError) as e:
+        raise ValueError(f"Curseur invalide: {cursor}") from e
@@ -0,0 +1,39 @@
+from typing import Any
+
+from fastapi import Response
+from pydantic_core import to_json
+
+from ..config import get_settings
+
+settings = get_settings()
+
+# Encodeur JSON optionnel plus rapide (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode en JSON compact (UTF-8, sans espaces), comme JSONResponse, sans repasser
+    par la validation pydantic : le contenu est déjà formaté depuis la base.
+
+    Les dictionnaires doivent suivre l'ordre des champs des schémas de réponse.
+    Réservé aux réponses sans nombres à virgule, dont l'écriture diffère selon l'encodeur.
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return to_json(content)
+
+
+class FastJSONResponse(Response):
+    """
+    Réponse JSON encodée par `dumps` (ou déjà encodée, si le contenu est en octets)
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
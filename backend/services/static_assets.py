@@ -0,0 +1,176 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+
+from .http_cache import http_date, is_not_modified
+
+# Compression brotli optionnelle (pip install brotli)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Durée de cache des fichiers référencés avec leur version (?v=...) : leur contenu ne change jamais
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Types de fichiers compressés à l'avance
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+
+# Références aux feuilles de style et scripts locaux dans les pages HTML
+ASSET_REFERENCE = re.compile(r'(href|src)="((?:css|js)/[^"?#]+)"')
+
+# Intervalle minimal entre deux vérifications des fichiers modifiés (en secondes)
+RELOAD_CHECK_INTERVAL = 1.0
+
+
+class StaticAsset:
+    """
+    Fichier du frontend chargé en mémoire, avec ses variantes compressées à l'avance
+    """
+    def __init__(self, content: bytes, media_type: str, modified_at: datetime):
+        self.media_type = media_type
+        self.last_modified = modified_at
+        self.version = hashlib.sha256(content).hexdigest()[:16]
+        self.variants: Dict[str, bytes] = {"identity": content}
+        if media_type.startswith(COMPRESSIBLE_TYPES):
+            compressed = {"gzip": gzip.compress(content, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                compressed["br"] = brotli.compress(content)
+            # Une variante n'est gardée que si elle est plus petite que l'original
+            self.variants.update({
+                encoding: data for encoding, data in compressed.items() if len(data) < len(content)
+            })
+
+    def etag(self, encoding: str) -> str:
+        suffix = "" if encoding == "identity" else f"-{encoding}"
+        return f'"{self.version}{suffix}"'
+
+
+def _accepted_encodings(request: Request) -> set:
+    accepted = set()
+    for part in request.headers.get("accept-encoding", "").split(","):
+        encoding, _, params = part.partition(";")
+        name, _, quality = params.partition("=")
+        try:
+            # "gzip;q=0" : encodage explicitement refusé
+            if name.strip() == "q" and float(quality) == 0:
+                continue
+        except ValueError:
+            pass
+        accepted.add(encoding.strip().lower())
+    return accepted
+
+
+class StaticAssets:
+    """
+    Sert les fichiers du frontend depuis la mémoire : chargés une fois au démarrage
+    (ou rechargés quand ils changent, avec `reload`), avec ETag calculé sur le contenu
+    et variantes gzip/brotli préparées à l'avance.
+
+    Les pages HTML référencent les CSS et scripts avec leur version (`js/ui.js?v=...`) :
+    ces URL peuvent être gardées en cache un an, une nouvelle version changeant d'URL.
+    """
+    def __init__(self, directory: str, reload: bool = False):
+        self.directory = directory
+        self.reload = reload
+        self._assets: Dict[str, StaticAsset] = {}
+        self._fingerprint: Dict[str, float] = {}
+        self._checked_at = 0.0
+        self.load()
+
+    def _scan(self) -> Dict[str, float]:
+        """
+        Chemins relatifs des fichiers du répertoire et leur date de modification
+        """
+        files = {}
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                full_path = os.path.join(root, name)
+                relative_path = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+                files[relative_path] = os.path.getmtime(full_path)
+        return files
+
+    def load(self):
+        fingerprint = self._scan()
+        contents = {}
+        for path in fingerprint:
+            with open(os.path.join(self.directory, path), "rb") as f:
+                contents[path] = f.read()
+
+        assets = {}
+        for path, content in contents.items():
+            if not path.endswith(".html"):
+                assets[path] = self._make_asset(path, content, fingerprint[path])
+
+        def versioned(match):
+            asset = assets.get(match.group(2))
+            if asset is None:
+                return match.group(0)
+            return f'{match.group(1)}="{match.group(2)}?v={asset.version}"'
+
+        for path, content in contents.items():
+            if path.endswith(".html"):
+                html = ASSET_REFERENCE.sub(versioned, content.decode("utf-8"))
+                assets[path] = self._make_asset(path, html.encode("utf-8"), fingerprint[path])
+
+        self._assets = assets
+        self._fingerprint = fingerprint
+
+    def _make_asset(self, path: str, content: bytes, mtime: float) -> StaticAsset:
+        media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        # Starlette ajoute lui-même "; charset=utf-8" aux types text/*
+        if media_type == "application/javascript":
+            media_type += "; charset=utf-8"
+        return StaticAsset(content, media_type, datetime.utcfromtimestamp(mtime))
+
+    async def refresh(self):
+        """
+        Recharge les fichiers s'ils ont changé (avec `reload`, au plus une fois par intervalle)
+        """
+        if not self.reload or time.monotonic() - self._checked_at < RELOAD_CHECK_INTERVAL:
+            return
+        self._checked_at = time.monotonic()
+        if await run_in_threadpool(self._scan) != self._fingerprint:
+            await run_in_threadpool(self.load)
+
+    def get(self, path: str) -> Optional[StaticAsset]:
+        return self._assets.get(path)
+
+    def response(self, request: Request, asset: StaticAsset, cache_control: str = "no-cache") -> Response:
+        """
+        Réponse pour `asset` dans le meilleur encodage accepté par le client, ou 304
+        si sa copie est à jour
+        """
+        accepted = _accepted_encodings(request)
+        encoding = next(
+            (encoding for encoding in ("br", "gzip") if encoding in accepted and encoding in asset.variants),
+            "identity"
+        )
+        headers = {
+            "ETag": asset.etag(encoding),
+            "Last-Modified": http_date(asset.last_modified),
+            "Cache-Control": cache_control,
+            "Vary": "Accept-Encoding",
+        }
+        if is_not_modified(request, headers["ETag"], asset.last_modified):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(content=asset.variants[encoding], media_type=asset.media_type, headers=headers)
+
+    def versioned_response(self, request: Request, asset: StaticAsset) -> Response:
+        """
+        Réponse d'une feuille de style ou d'un script : en cache longue durée si l'URL
+        contient la version actuelle, sinon à revalider
+        """
+        if request.query_params.get("v") == asset.version:
+            return self.response(request, asset, IMMUTABLE_CACHE_CONTROL)
+        return self.response(request, asset)
@@ -0,0 +1,76 @@
+import re
+import unicodedata
+from typing import Iterable, List, Optional
+
+# Mots vides français (sans accents), ignorés lors de la correspondance et de la recherche
+STOP_WORDS = {
+    "a", "ai", "au", "aux", "avec", "c", "ce", "ces", "cet", "cette", "d", "dans", "de", "des",
+    "du", "elle", "elles", "en", "est", "et", "etait", "ete", "etre", "il", "ils", "j", "je",
+    "l", "la", "le", "les", "leur", "leurs", "lui", "m", "ma", "mais", "me", "mes", "moi", "mon",
+    "n", "ne", "nos", "notre", "nous", "on", "ou", "par", "pas", "peu", "plus", "pour", "qu",
+    "que", "qui", "s", "sa", "sans", "se", "ses", "son", "sont", "sur", "t", "ta", "te", "tes",
+    "ton", "tres", "tu", "un", "une", "vos", "votre", "vous", "y",
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def fold_text(text: Optional[str]) -> str:
+    """
+    Met un texte en minuscules et supprime les accents ("Clés" -> "cles")
+    """
+    decomposed = unicodedata.normalize("NFKD", (text or "").lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def stem(word: str) -> str:
+    """
+    Racinisation légère du français : pluriels et féminins
+    ("chevaux" -> "cheval", "noires" -> "noir", "cles" -> "cle")
+    """
+    if len(word) > 4 and word.endswith("aux"):
+        return word[:-3] + "al"
+    if len(word) > 3 and word[-1] in "sx":
+        word = word[:-1]
+    if len(word) > 3 and word.endswith("e"):
+        word = word[:-1]
+    return word
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Normalise un texte en mots clés uniques et triés : minuscules, accents et
+    ponctuation supprimés, mots vides retirés, racinisation légère
+    """
+    tokens = set()
+    for word in TOKEN_PATTERN.findall(fold_text(text)):
+        if word in STOP_WORDS:
+            continue
+        token = stem(word)
+        if len(token) > 1:
+            tokens.add(token)
+    return sorted(tokens)
+
+
+def serialize_tokens(tokens: Iterable[str]) -> str:
+    """
+    Représentation stockée en base des mots clés d'un objet
+    """
+    return " ".join(tokens)
+
+
+def parse_tokens(stored_tokens: Optional[str]) -> set:
+    """
+    Relit les mots clés stockés en base par serialize_tokens
+    """
+    return set((stored_tokens or "").split())
+
+
+def trigrams(token: str) -> set:
+    """
+    Trigrammes de caractères d'un mot clé, avec les mêmes bordures que pg_trgm
+    ("sac" -> "  s", " sa", "sac", "ac ")
+    """
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
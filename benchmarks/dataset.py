@@ -0,0 +1,100 @@
+"""
+Générateur de données synthétiques de festival : déclarations d'objets perdus et
+trouvés réalistes (descriptions en français, dates, heures, lieux)
+"""
+import random
+from datetime import date, timedelta
+from typing import Dict, List
+
+OBJECTS = [
+    "portefeuille", "sac à dos", "sac à main", "banane", "téléphone", "iPhone", "Samsung",
+    "clés", "trousseau de clés", "veste", "sweat", "k-way", "casquette", "bob", "lunettes de soleil",
+    "lunettes de vue", "gourde", "écouteurs", "AirPods", "montre", "bracelet", "collier",
+    "carte bancaire", "carte d'identité", "permis de conduire", "appareil photo", "batterie externe",
+    "chargeur", "parapluie", "doudou", "peluche", "tente", "duvet", "gilet", "écharpe", "bouteille",
+]
+COLORS = [
+    "noir", "noire", "blanc", "blanche", "rouge", "bleu", "bleue", "vert", "verte", "jaune",
+    "rose", "gris", "grise", "marron", "beige", "doré", "argenté", "kaki", "violet", "orange",
+]
+MATERIALS = ["en cuir", "en tissu", "en plastique", "en métal", "en jean", "en toile", "en laine"]
+BRANDS = ["Nike", "Adidas", "Eastpak", "Ray-Ban", "Apple", "Xiaomi", "Quechua", "Vans", "Carhartt", "Decathlon"]
+DETAILS = [
+    "avec des autocollants", "avec une coque transparente", "rayé", "avec un porte-clés",
+    "avec mes initiales", "un peu abîmé", "neuf", "avec une fermeture éclair cassée",
+    "avec une photo à l'intérieur", "avec un bracelet du festival", "avec des badges",
+]
+LOCATIONS = [
+    "Scène principale", "Scène B", "Chapiteau", "Camping A", "Camping B", "Bar central",
+    "Food court", "Entrée nord", "Entrée sud", "Toilettes", "Parking P1", "Parking P2",
+    "Espace VIP", "Stand merch", "Infirmerie", "Navette",
+]
+CONTENTS = [
+    None, None, "Carte d'identité et carte bancaire", "Environ 20 euros", "Clés et badge",
+    "Chargeur et écouteurs", "Médicaments", "Tickets de boisson",
+]
+
+
+def _typo(word: str, rng: random.Random) -> str:
+    """
+    Introduit une faute de frappe (lettre oubliée ou doublée)
+    """
+    if len(word) < 5:
+        return word
+    position = rng.randrange(1, len(word) - 1)
+    if rng.random() < 0.5:
+        return word[:position] + word[position + 1:]
+    return word[:position] + word[position] + word[position:]
+
+
+def generate_description(rng: random.Random, typo_rate: float = 0.1) -> str:
+    parts = [rng.choice(OBJECTS), rng.choice(COLORS)]
+    if rng.random() < 0.5:
+        parts.append(rng.choice(MATERIALS))
+    if rng.random() < 0.4:
+        parts.append(rng.choice(BRANDS))
+    if rng.random() < 0.4:
+        parts.append(rng.choice(DETAILS))
+    words = " ".join(parts).split()
+    words = [_typo(word, rng) if rng.random() < typo_rate else word for word in words]
+    return " ".join(words).capitalize()
+
+
+def generate_item(rng: random.Random, item_type: str, festival_start: date, festival_days: int) -> Dict:
+    day = festival_start + timedelta(days=rng.randrange(festival_days))
+    item = {
+        "description": generate_description(rng),
+        "location": rng.choice(LOCATIONS),
+        "content_info": rng.choice(CONTENTS),
+    }
+    date_field, time_field = ("found_date", "found_time") if item_type == "found" else ("lost_date", "lost_time")
+    item[date_field] = day.isoformat()
+    item[time_field] = f"{rng.randrange(10, 24):02d}:{rng.randrange(60):02d}"
+    return item
+
+
+def generate_dataset(
+    size: int,
+    seed: int = 42,
+    festival_start: date = date(2024, 7, 11),
+    festival_days: int = 4
+) -> Dict[str, List[Dict]]:
+    """
+    Génère `size` déclarations, réparties à parts égales entre objets trouvés et perdus
+    """
+    rng = random.Random(seed)
+    found_count = size // 2
+    return {
+        "found": [generate_item(rng, "found", festival_start, festival_days) for _ in range(found_count)],
+        "lost": [generate_item(rng, "lost", festival_start, festival_days) for _ in range(size - found_count)],
+    }
+
+
+def parse_scale(value: str) -> int:
+    """
+    Convertit une taille de jeu de données ("1k", "10k", "100k" ou un entier)
+    """
+    value = value.strip().lower()
+    if value.endswith("k"):
+        return int(float(value[:-1]) * 1000)
+    return int(value)
@@ -0,0 +1,296 @@
+"""
+Banc d'essai de la correspondance et de l'API sur un jeu de données synthétique.
+
+Exemples :
+    python -m benchmarks.run --scale 10k
+    python -m benchmarks.run --scale 1k --database-url postgresql://localhost/bench --reset
+    python -m benchmarks.run --scale 10k --compare-to benchmarks/results/<fichier>.json
+
+Les résultats (latences p50/p95/p99, débit, requêtes SQL par appel) sont enregistrés
+dans benchmarks/results/ pour comparer les performances entre commits.
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from .dataset import generate_dataset, parse_scale
+
+RESULTS_DIR = Path(__file__).parent / "results"
+ROOT_DIR = Path(__file__).parent.parent
+
+
+class FakeStorageService:
+    """
+    Remplace Cloudinary : aucune requête réseau, URL déterministe
+    """
+    async def upload_file(self, file) -> str:
+        await file.read()
+        return f"https://res.cloudinary.com/bench/image/upload/v1/festival-objets-perdus/{uuid.uuid4()}.jpg"
+
+    def delete_file(self, file_url: str) -> bool:
+        return True
+
+
+class QueryCounter:
+    """
+    Compte les requêtes SQL exécutées par l'engine
+    """
+    def __init__(self, engine):
+        from sqlalchemy import event
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+
+def summarize(durations: List[float], queries: List[int]) -> Dict:
+    """
+    Statistiques de latence (en millisecondes) et de débit d'une série de mesures
+    """
+    ordered = sorted(durations)
+
+    def percentile(p: float) -> float:
+        index = min(len(ordered) - 1, max(0, int(round(p / 100 * len(ordered))) - 1))
+        return ordered[index] * 1000
+
+    total = sum(durations)
+    return {
+        "runs": len(durations),
+        "p50_ms": round(percentile(50), 3),
+        "p95_ms": round(percentile(95), 3),
+        "p99_ms": round(percentile(99), 3),
+        "mean_ms": round(total / len(durations) * 1000, 3),
+        "throughput_per_s": round(len(durations) / total, 2) if total else None,
+        "queries_per_call": round(sum(queries) / len(queries), 2) if queries else None,
+    }
+
+
+def measure(runs: int, call: Callable, counter: QueryCounter) -> Dict:
+    durations, queries = [], []
+    for _ in range(runs):
+        before = counter.count
+        start = time.perf_counter()
+        call()
+        durations.append(time.perf_counter() - start)
+        queries.append(counter.count - before)
+    return summarize(durations, queries)
+
+
+def seed_database(dataset: Dict[str, List[Dict]]):
+    """
+    Insère le jeu de données par lots, avec les mêmes normalisations que les dépôts
+    """
+    from backend.database.db import SessionLocal
+    from backend.database.models import FoundItem, LostItem, MATCH_STATUS_READY
+    from backend.database.repositories import CollectionVersionRepository, KeywordIndexRepository
+    from backend.services.date_parsing import parse_item_date
+    from backend.services.text_processing import serialize_tokens, tokenize
+
+    db = SessionLocal()
+    try:
+        # Compteurs de versions, créés sinon au démarrage de l'application (après l'insertion)
+        CollectionVersionRepository(db).ensure_exists()
+        for item_type, model, date_field, parsed_field in (
+            ("found", FoundItem, "found_date", "found_on"),
+            ("lost", LostItem, "lost_date", "lost_on"),
+        ):
+            rows = []
+            for item in dataset[item_type]:
+                row = dict(item)
+                row["id"] = str(uuid.uuid4())
+                row["created_at"] = datetime.utcnow()
+                row["tokens"] = serialize_tokens(tokenize(item["description"]))
+                row[parsed_field] = parse_item_date(item[date_field])
+                row["match_status"] = MATCH_STATUS_READY
+                if item_type == "found":
+                    row["image_url"] = f"https://res.cloudinary.com/bench/festival-objets-perdus/{row['id']}.jpg"
+                    row["image_filename"] = f"{row['id']}.jpg"
+                rows.append(row)
+            db.execute(model.__table__.insert(), rows)
+        db.commit()
+        KeywordIndexRepository(db).rebuild()
+    finally:
+        db.close()
+
+
+def run_benchmarks(args) -> Dict:
+    from fastapi.testclient import TestClient
+
+    import backend.services.cloud_storage as cloud_storage
+    fake_storage = FakeStorageService()
+    cloud_storage.cloud_storage_service.upload_file = fake_storage.upload_file
+    cloud_storage.cloud_storage_service.delete_file = fake_storage.delete_file
+
+    from backend.database.db import SessionLocal, engine
+    from backend.database.models import FoundItem, LostItem
+    from backend.database.repositories import MatchingService
+    from backend.main import app
+
+    counter = QueryCounter(engine)
+    rng = random.Random(args.seed)
+    size = parse_scale(args.scale)
+    results = {}
+
+    dataset = generate_dataset(size, seed=args.seed)
+    start = time.perf_counter()
+    seed_database(dataset)
+    seed_seconds = time.perf_counter() - start
+    print(f"Jeu de données : {size} objets insérés en {seed_seconds:.1f} s")
+
+    db = SessionLocal()
+    try:
+        matching_service = MatchingService(db)
+        results["matching.find_matches"] = measure(args.rebuild_runs, matching_service.find_matches, counter)
+
+        found_ids = [item_id for (item_id,) in db.query(FoundItem.id)]
+        lost_ids = [item_id for (item_id,) in db.query(LostItem.id)]
+        results["matching.match_found_item"] = measure(
+            args.requests, lambda: matching_service.match_found_item(rng.choice(found_ids)), counter
+        )
+        results["matching.match_lost_item"] = measure(
+            args.requests, lambda: matching_service.match_lost_item(rng.choice(lost_ids)), counter
+        )
+    finally:
+        db.close()
+
+    extra = generate_dataset(2 * args.requests, seed=args.seed + 1)
+    with TestClient(app) as client:
+        found_items = iter(extra["found"])
+        lost_items = iter(extra["lost"])
+        created = {}
+
+        def post_found():
+            item = {key: value for key, value in next(found_items).items() if value is not None}
+            response = client.post(
+                "/api/found", data=item, files={"image": ("photo.jpg", b"\xff\xd8\xff", "image/jpeg")}
+            )
+            response.raise_for_status()
+            created["found"] = response.json()["id"]
+
+        def post_lost():
+            item = {key: value for key, value in next(lost_items).items() if value is not None}
+            response = client.post("/api/lost", data=item)
+            response.raise_for_status()
+            created["lost"] = response.json()["id"]
+
+        results["api.post_found"] = measure(args.requests, post_found, counter)
+        results["api.post_lost"] = measure(args.requests, post_lost, counter)
+
+        # Attendre la fin des calculs de correspondances en arrière-plan avant les lectures
+        for item_type, item_id in created.items():
+            client.get(f"/api/{item_type}/{item_id}/matches", params={"wait": 30})
+        results["api.get_found"] = measure(
+            args.list_requests, lambda: client.get("/api/found").raise_for_status(), counter
+        )
+        results["api.get_lost"] = measure(
+            args.list_requests, lambda: client.get("/api/lost").raise_for_status(), counter
+        )
+
+        # Rafraîchissement d'une liste inchangée (requête conditionnelle)
+        etag = client.get("/api/found").headers.get("etag", "")
+        results["api.get_found_not_modified"] = measure(
+            args.list_requests, lambda: client.get("/api/found", headers={"If-None-Match": etag}), counter
+        )
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "scale": size,
+        "database": engine.dialect.name,
+        "seed_seconds": round(seed_seconds, 2),
+        "results": results,
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_report(report: Dict, baseline: Dict = None):
+    print(f"\nCommit {report['commit']} - {report['scale']} objets - {report['database']}")
+    header = f"{'mesure':<28}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'débit/s':>10}{'req SQL':>9}"
+    if baseline:
+        header += f"{'p50 avant':>11}{'écart':>9}"
+    print(header)
+    for name, stats in report["results"].items():
+        line = (
+            f"{name:<28}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+            f"{stats['throughput_per_s'] or 0:>10.1f}{stats['queries_per_call'] or 0:>9.1f}"
+        )
+        previous = (baseline or {}).get("results", {}).get(name)
+        if previous:
+            change = (stats["p50_ms"] - previous["p50_ms"]) / previous["p50_ms"] * 100 if previous["p50_ms"] else 0
+            line += f"{previous['p50_ms']:>11.2f}{change:>+8.0f}%"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc d'essai de la correspondance et de l'API")
+    parser.add_argument("--scale", default="1k", help="taille du jeu de données : 1k, 10k, 100k ou un entier")
+    parser.add_argument("--database-url", help="base à utiliser (par défaut : SQLite temporaire)")
+    parser.add_argument("--reset", action="store_true", help="vider la base donnée par --database-url")
+    parser.add_argument("--requests", type=int, default=200, help="appels par mesure d'écriture")
+    parser.add_argument("--list-requests", type=int, default=20, help="appels par mesure de liste")
+    parser.add_argument("--rebuild-runs", type=int, default=3, help="reconstructions complètes mesurées")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--compare-to", help="fichier de résultats précédent à comparer")
+    parser.add_argument("--output", help="fichier de résultats (par défaut : benchmarks/results/)")
+    args = parser.parse_args()
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    else:
+        database_path = Path(tempfile.mkdtemp(prefix="objets-bench-")) / "benchmark.db"
+        os.environ["DATABASE_URL"] = f"sqlite:///{database_path}"
+    # Les correspondances des écritures sont calculées immédiatement par le worker
+    os.environ.setdefault("MATCH_DEBOUNCE_SECONDS", "0")
+
+    sys.path.insert(0, str(ROOT_DIR))
+    from backend.database.db import engine
+    from backend.database.models import Base, FoundItem
+
+    if args.database_url:
+        Base.metadata.create_all(bind=engine)
+        from backend.database.db import SessionLocal
+        db = SessionLocal()
+        has_data = db.query(FoundItem.id).first() is not None
+        db.close()
+        if has_data and not args.reset:
+            parser.error("la base contient déjà des données : utilisez --reset pour la vider")
+        if args.reset:
+            Base.metadata.drop_all(bind=engine)
+
+    report = run_benchmarks(args)
+
+    baseline = None
+    if args.compare_to:
+        with open(args.compare_to, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}-{report['commit']}-{report['scale']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nRésultats enregistrés dans {output}")
+
+
+if __name__ == "__main__":
+    main()
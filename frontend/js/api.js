@@ -2,34 +2,151 @@
  * Module de gestion des appels API
  */
 class Api {
+    /**
+     * Récupère tous les objets d'une liste paginée en suivant les curseurs
+     */
+    static async getAllPages(path, extraParams = {}) {
+        const items = [];
+        let cursor = null;
+        do {
+            const params = new URLSearchParams({ limit: CONFIG.PAGE_SIZE, ...extraParams });
+            if (cursor) {
+                params.set('cursor', cursor);
+            }
+            const response = await fetch(`${CONFIG.API_URL}/${path}?${params}`);
+            if (!response.ok) {
+                throw new Error(`Erreur HTTP: ${response.status}`);
+            }
+            const page = await response.json();
+            items.push(...page.items);
+            cursor = page.next_cursor;
+        } while (cursor);
+        return items;
+    }
+
     /**
      * Récupère tous les objets trouvés
      */
     static async getFoundItems() {
         try {
-            const response = await fetch(`${CONFIG.API_URL}/found`);
+            return await Api.getAllPages('found');
+        } catch (error) {
+            console.error('Erreur lors de la récupération des objets trouvés:', error);
+            throw error;
+        }
+    }
+
+    /**
+     * Récupère tous les objets perdus
+     */
+    static async getLostItems() {
+        try {
+            return await Api.getAllPages('lost');
+        } catch (error) {
+            console.error('Erreur lors de la récupération des objets perdus:', error);
+            throw error;
+        }
+    }
+
+    /**
+     * Récupère les résumés de tous les objets trouvés (champs des cartes de la liste)
+     */
+    static async getFoundSummaries() {
+        try {
+            return await Api.getAllPages('found', { view: 'summary' });
+        } catch (error) {
+            console.error('Erreur lors de la récupération des objets trouvés:', error);
+            throw error;
+        }
+    }
+
+    /**
+     * Récupère les résumés de tous les objets perdus (champs des cartes de la liste)
+     */
+    static async getLostSummaries() {
+        try {
+            return await Api.getAllPages('lost', { view: 'summary' });
+        } catch (error) {
+            console.error('Erreur lors de la récupération des objets perdus:', error);
+            throw error;
+        }
+    }
+
+    /**
+     * Récupère un objet avec les résumés de ses correspondances classées
+     */
+    static async getItem(itemType, itemId) {
+        try {
+            const response = await fetch(`${CONFIG.API_URL}/${itemType}/${encodeURIComponent(itemId)}`);
+            if (response.status === 404) {
+                throw new Error('Objet non trouvé');
+            }
             if (!response.ok) {
                 throw new Error(`Erreur HTTP: ${response.status}`);
             }
             return await response.json();
         } catch (error) {
-            console.error('Erreur lors de la récupération des objets trouvés:', error);
+            console.error('Erreur lors de la récupération de l\'objet:', error);
             throw error;
         }
     }
 
     /**
-     * Récupère tous les objets perdus
+     * Récupère la position actuelle du journal des modifications (à lire avant de charger
+     * les listes complètes)
      */
-    static async getLostItems() {
+    static async getChangesCursor() {
+        try {
+            const response = await fetch(`${CONFIG.API_URL}/changes`);
+            if (!response.ok) {
+                throw new Error(`Erreur HTTP: ${response.status}`);
+            }
+            return (await response.json()).next_cursor;
+        } catch (error) {
+            console.error('Erreur lors de la récupération du curseur de synchronisation:', error);
+            throw error;
+        }
+    }
+
+    /**
+     * Récupère une page des modifications postérieures au curseur, ou null si le curseur
+     * a expiré (les listes doivent alors être rechargées entièrement)
+     */
+    static async getChanges(since) {
         try {
-            const response = await fetch(`${CONFIG.API_URL}/lost`);
+            const params = new URLSearchParams({ since });
+            const response = await fetch(`${CONFIG.API_URL}/changes?${params}`);
+            if (response.status === 410) {
+                return null;
+            }
             if (!response.ok) {
                 throw new Error(`Erreur HTTP: ${response.status}`);
             }
             return await response.json();
         } catch (error) {
-            console.error('Erreur lors de la récupération des objets perdus:', error);
+            console.error('Erreur lors de la récupération des modifications:', error);
+            throw error;
+        }
+    }
+
+    /**
+     * Recherche des objets côté serveur (mots clés, type, période, lieu)
+     */
+    static async searchItems(params) {
+        try {
+            const query = new URLSearchParams({ limit: CONFIG.PAGE_SIZE });
+            Object.entries(params).forEach(([key, value]) => {
+                if (value) {
+                    query.set(key, value);
+                }
+            });
+            const response = await fetch(`${CONFIG.API_URL}/search?${query}`);
+            if (!response.ok) {
+                throw new Error(`Erreur HTTP: ${response.status}`);
+            }
+            return (await response.json()).results;
+        } catch (error) {
+            console.error('Erreur lors de la recherche d\'objets:', error);
             throw error;
         }
     }
@@ -4,6 +4,8 @@
 const CONFIG = {
     API_URL: 'http://localhost:8000/api',
     UPLOADS_URL: 'http://localhost:8000/uploads',
+    PAGE_SIZE: 200, // Objets par page lors du chargement des listes
+    LIVE_REFRESH_DELAY: 2000, // Délai de regroupement des notifications avant rechargement (ms)
     DATE_FORMAT: {
         year: 'numeric',
         month: 'long',
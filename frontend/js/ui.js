@@ -2,6 +2,13 @@
  * Module de gestion de l'interface utilisateur
  */
 class UI {
+    // Position du journal des modifications de la liste complète affichée (null pendant
+    // un chargement ou si des résultats de recherche sont affichés)
+    static changesCursor = null;
+    static loadingItems = false;
+    static applyingChanges = false;
+    static changesPending = false;
+
     /**
      * Initialise l'interface utilisateur
      */
@@ -20,6 +27,48 @@ class UI {
         
         // Charger les objets au démarrage
         UI.loadAllItems();
+        
+        // Rafraîchir la liste lorsque des objets ou des correspondances changent
+        UI.initLiveUpdates();
+    }
+
+    /**
+     * S'abonne aux notifications du serveur (Server-Sent Events) et met à jour la liste
+     * affichée, au plus une fois par intervalle, lorsque des objets ou correspondances changent
+     */
+    static initLiveUpdates() {
+        if (!window.EventSource) {
+            return;
+        }
+        let refreshTimer = null;
+        let resync = false;
+        const scheduleRefresh = (event) => {
+            // Des notifications ont été perdues : seul un rechargement complet est fiable
+            if (event && event.type === 'resync') {
+                resync = true;
+            }
+            if (refreshTimer) {
+                return;
+            }
+            refreshTimer = setTimeout(() => {
+                refreshTimer = null;
+                if (UI.loadingItems) {
+                    // Attendre la fin du chargement en cours pour appliquer les modifications
+                    scheduleRefresh();
+                } else if (resync) {
+                    resync = false;
+                    UI.searchItems();
+                } else {
+                    UI.refreshItems();
+                }
+            }, CONFIG.LIVE_REFRESH_DELAY);
+        };
+        
+        const source = new EventSource(`${CONFIG.API_URL}/events`);
+        [
+            'item_created', 'item_updated', 'item_deleted',
+            'match_created', 'match_updated', 'match_deleted', 'resync'
+        ].forEach(eventType => source.addEventListener(eventType, scheduleRefresh));
     }
 
     /**
@@ -58,8 +107,8 @@ class UI {
                 document.getElementById('imagePreview').innerHTML = '';
                 document.getElementById('foundItemForm').style.display = 'none';
                 
-                // Recharger la liste des objets
-                UI.loadAllItems();
+                // Mettre à jour la liste des objets
+                UI.refreshItems();
                 
                 // Afficher un message de succès
                 UI.showToast('Objet trouvé ajouté avec succès!');
@@ -82,8 +131,8 @@ class UI {
                 e.target.reset();
                 document.getElementById('lostItemForm').style.display = 'none';
                 
-                // Recharger la liste des objets
-                UI.loadAllItems();
+                // Mettre à jour la liste des objets
+                UI.refreshItems();
                 
                 // Afficher un message de succès
                 UI.showToast('Objet perdu ajouté avec succès!');
@@ -110,9 +159,9 @@ class UI {
                 // Envoyer les données
                 const result = await Api.updateItem(itemId, itemType, formData, credentials);
                 
-                // Fermer le modal et recharger les objets
+                // Fermer le modal et mettre à jour les objets
                 UI.closeModal('editItemModal');
-                UI.loadAllItems();
+                UI.refreshItems();
                 
                 // Afficher un message de succès
                 UI.showToast('Objet modifié avec succès!');
@@ -143,24 +192,21 @@ class UI {
             });
         });
         
-        // Filtre de recherche
+        // Recherche côté serveur
         document.getElementById('searchBtn').addEventListener('click', () => {
-            const searchTerm = document.getElementById('searchInput').value.toLowerCase();
-            UI.filterItems('all', searchTerm);
+            UI.searchItems();
         });
         
         // Recherche sur touche "Entrée"
         document.getElementById('searchInput').addEventListener('keyup', (e) => {
             if (e.key === 'Enter') {
-                const searchTerm = document.getElementById('searchInput').value.toLowerCase();
-                UI.filterItems('all', searchTerm);
+                UI.searchItems();
             }
         });
         
         // Filtre par date
-        document.getElementById('dateFilter').addEventListener('change', (e) => {
-            const date = e.target.value;
-            UI.filterItemsByDate(date);
+        document.getElementById('dateFilter').addEventListener('change', () => {
+            UI.searchItems();
         });
     }
 
@@ -264,14 +310,21 @@ class UI {
      * Charge tous les objets (trouvés et perdus)
      */
     static async loadAllItems() {
+        UI.loadingItems = true;
+        UI.changesCursor = null;
         try {
             const itemsContainer = document.getElementById('itemsContainer');
             itemsContainer.innerHTML = '<div class="loading">Chargement des objets...</div>';
             
-            // Récupérer les objets trouvés et perdus
+            // Position du journal avant le chargement : les modifications faites pendant
+            // celui-ci seront appliquées par UI.applyChanges
+            const changesCursor = await Api.getChangesCursor();
+            
+            // Récupérer les résumés des objets trouvés et perdus (l'objet complet est chargé
+            // à l'ouverture de ses détails)
             const [foundItems, lostItems] = await Promise.all([
-                Api.getFoundItems(),
-                Api.getLostItems()
+                Api.getFoundSummaries(),
+                Api.getLostSummaries()
             ]);
             
             // Fusionner et trier les objets par date de création (les plus récents d'abord)
@@ -280,23 +333,8 @@ class UI {
                 ...lostItems.map(item => ({ ...item, type: 'lost' }))
             ].sort((a, b) => new Date(b.created_at) - new Date(a.created_at));
             
-            // Afficher les objets ou un message si aucun objet n'est disponible
-            if (allItems.length === 0) {
-                itemsContainer.innerHTML = '<div class="no-items">Aucun objet à afficher</div>';
-                return;
-            }
-            
-            // Afficher les objets
-            itemsContainer.innerHTML = '';
-            allItems.forEach(item => {
-                const itemElement = UI.createItemElement(item);
-                itemsContainer.appendChild(itemElement);
-            });
-            
-            // Si l'utilisateur est connecté, afficher les boutons d'administration
-            if (Auth.isLoggedIn()) {
-                UI.toggleAdminButtons(true);
-            }
+            UI.renderItems(allItems);
+            UI.changesCursor = changesCursor;
         } catch (error) {
             console.error('Erreur lors du chargement des objets:', error);
             document.getElementById('itemsContainer').innerHTML = `
@@ -304,6 +342,185 @@ class UI {
                     Erreur lors du chargement des objets: ${error.message}
                 </div>
             `;
+        } finally {
+            UI.loadingItems = false;
+        }
+    }
+
+    /**
+     * Met à jour la liste affichée : applique les modifications depuis le dernier chargement
+     * à la liste complète, ou relance la recherche dont les résultats sont classés par le serveur
+     */
+    static async refreshItems() {
+        if (UI.loadingItems) {
+            return;
+        }
+        // Pas de curseur : des résultats de recherche sont affichés, ou le chargement a échoué
+        if (!UI.changesCursor) {
+            UI.searchItems();
+            return;
+        }
+        await UI.applyChanges();
+    }
+
+    /**
+     * Applique à la liste complète les modifications postérieures au curseur du dernier
+     * chargement ; recharge tout si ce curseur a expiré
+     */
+    static async applyChanges() {
+        if (UI.applyingChanges) {
+            // Reprendre après la mise à jour en cours, qui a pu lire le journal trop tôt
+            UI.changesPending = true;
+            return;
+        }
+        UI.applyingChanges = true;
+        try {
+            let page;
+            do {
+                page = await Api.getChanges(UI.changesCursor);
+                if (page === null) {
+                    UI.loadAllItems();
+                    return;
+                }
+                UI.applyChangesPage(page);
+                UI.changesCursor = page.next_cursor;
+            } while (page.has_more);
+        } catch (error) {
+            console.error('Erreur lors de la mise à jour des objets:', error);
+        } finally {
+            UI.applyingChanges = false;
+            if (UI.changesPending) {
+                UI.changesPending = false;
+                UI.refreshItems();
+            }
+        }
+    }
+
+    /**
+     * Applique une page de modifications aux cartes affichées : retire les objets supprimés
+     * et remplace ou insère les cartes des objets dont le résumé a changé
+     */
+    static applyChangesPage(page) {
+        const itemsContainer = document.getElementById('itemsContainer');
+        page.deleted.found.forEach(itemId => UI.removeItemElement(itemId, 'found'));
+        page.deleted.lost.forEach(itemId => UI.removeItemElement(itemId, 'lost'));
+        
+        const items = [
+            ...page.summaries.found.map(item => ({ ...item, type: 'found' })),
+            ...page.summaries.lost.map(item => ({ ...item, type: 'lost' }))
+        ];
+        if (items.length > 0) {
+            // La liste était vide : retirer le message
+            const noItems = itemsContainer.querySelector('.no-items');
+            if (noItems) {
+                noItems.remove();
+            }
+            items.forEach(item => UI.upsertItemElement(item));
+        }
+        
+        if (!itemsContainer.querySelector('.item-card')) {
+            UI.renderItems([]);
+            return;
+        }
+        
+        // Appliquer le filtre de type actif aux nouvelles cartes
+        const activeFilter = document.querySelector('.filter-btn.active');
+        if (activeFilter) {
+            UI.filterItems(activeFilter.dataset.filter);
+        }
+        
+        // Si l'utilisateur est connecté, afficher les boutons d'administration
+        if (Auth.isLoggedIn()) {
+            UI.toggleAdminButtons(true);
+        }
+    }
+
+    /**
+     * Carte affichée d'un objet, ou null
+     */
+    static findItemElement(itemId, itemType) {
+        return document.querySelector(
+            `#itemsContainer .item-card[data-type="${itemType}"][data-id="${CSS.escape(itemId)}"]`
+        );
+    }
+
+    /**
+     * Retire la carte d'un objet supprimé
+     */
+    static removeItemElement(itemId, itemType) {
+        const element = UI.findItemElement(itemId, itemType);
+        if (element) {
+            element.remove();
+        }
+    }
+
+    /**
+     * Remplace la carte d'un objet, ou l'insère à sa place (les plus récents d'abord)
+     */
+    static upsertItemElement(item) {
+        const element = UI.createItemElement(item);
+        const current = UI.findItemElement(item.id, item.type);
+        if (current) {
+            current.replaceWith(element);
+            return;
+        }
+        
+        const createdAt = new Date(item.created_at);
+        const next = Array.from(document.querySelectorAll('#itemsContainer .item-card'))
+            .find(card => new Date(card.dataset.createdAt) < createdAt);
+        document.getElementById('itemsContainer').insertBefore(element, next || null);
+    }
+
+    /**
+     * Affiche une liste d'objets (ou un message si elle est vide)
+     */
+    static renderItems(items) {
+        const itemsContainer = document.getElementById('itemsContainer');
+        if (items.length === 0) {
+            itemsContainer.innerHTML = '<div class="no-items">Aucun objet à afficher</div>';
+            return;
+        }
+        
+        itemsContainer.innerHTML = '';
+        items.forEach(item => {
+            itemsContainer.appendChild(UI.createItemElement(item));
+        });
+        
+        // Appliquer le filtre de type actif
+        const activeFilter = document.querySelector('.filter-btn.active');
+        if (activeFilter) {
+            UI.filterItems(activeFilter.dataset.filter);
+        }
+        
+        // Si l'utilisateur est connecté, afficher les boutons d'administration
+        if (Auth.isLoggedIn()) {
+            UI.toggleAdminButtons(true);
+        }
+    }
+
+    /**
+     * Recherche les objets côté serveur selon le terme et la date saisis
+     */
+    static async searchItems() {
+        const searchTerm = document.getElementById('searchInput').value.trim();
+        const date = document.getElementById('dateFilter').value;
+        if (!searchTerm && !date) {
+            UI.loadAllItems();
+            return;
+        }
+        
+        const itemsContainer = document.getElementById('itemsContainer');
+        UI.changesCursor = null;
+        try {
+            itemsContainer.innerHTML = '<div class="loading">Recherche en cours...</div>';
+            const results = await Api.searchItems({ q: searchTerm, date_from: date, date_to: date });
+            UI.renderItems(results);
+        } catch (error) {
+            itemsContainer.innerHTML = `
+                <div class="error-message">
+                    Erreur lors de la recherche: ${error.message}
+                </div>
+            `;
         }
     }
 
@@ -331,30 +548,6 @@ class UI {
         });
     }
 
-    /**
-     * Filtre les objets par date
-     */
-    static filterItemsByDate(dateString) {
-        if (!dateString) {
-            // Si aucune date n'est sélectionnée, afficher tous les objets
-            UI.filterItems(document.querySelector('.filter-btn.active').dataset.filter);
-            return;
-        }
-        
-        const items = document.querySelectorAll('.item-card');
-        
-        items.forEach(item => {
-            const itemDate = item.dataset.date;
-            const matches = itemDate === dateString;
-            
-            if (matches) {
-                item.style.display = 'flex';
-            } else {
-                item.style.display = 'none';
-            }
-        });
-    }
-
     /**
      * Crée un élément HTML pour un objet
      */
@@ -366,18 +559,26 @@ class UI {
         div.dataset.description = item.description;
         div.dataset.location = item.type === 'found' ? item.location : item.location;
         div.dataset.date = item.type === 'found' ? item.found_date : item.lost_date;
+        div.dataset.createdAt = item.created_at;
+        
+        // Nombre de correspondances (fourni directement par les résumés)
+        const matchCount = item.match_count !== undefined ?
+            item.match_count :
+            (item.possible_matches || []).length;
+        const hasMatches = matchCount > 0;
         
-        // Déterminer si l'objet a des correspondances
-        const hasMatches = item.possible_matches && item.possible_matches.length > 0;
+        // Miniature (résumés) ou image de l'objet
+        const imageUrl = item.thumbnail_url ||
+            (item.image_filename ? `${CONFIG.UPLOADS_URL}/${item.image_filename}` : null);
         
         // Formater la date
         const dateObj = new Date(item.type === 'found' ? item.found_date : item.lost_date);
         const formattedDate = dateObj.toLocaleDateString('fr-FR', CONFIG.DATE_FORMAT);
         
         div.innerHTML = `
-            ${item.type === 'found' && item.image_filename ? `
+            ${item.type === 'found' && imageUrl ? `
                 <div class="item-image">
-                    <img src="${CONFIG.UPLOADS_URL}/${item.image_filename}" alt="${item.description}">
+                    <img src="${imageUrl}" alt="${item.description}" loading="lazy">
                 </div>
             ` : ''}
             <div class="item-content">
@@ -392,7 +593,7 @@ class UI {
                 </div>
                 <div class="item-details">
                     ${item.content_info ? `<p>${item.content_info}</p>` : ''}
-                    ${hasMatches ? `<span class="match-badge"><i class="fas fa-exchange-alt"></i> ${item.possible_matches.length} correspondance(s)</span>` : ''}
+                    ${hasMatches ? `<span class="match-badge"><i class="fas fa-exchange-alt"></i> ${matchCount} correspondance(s)</span>` : ''}
                 </div>
                 <div class="item-actions">
                     <button class="btn btn-primary btn-sm view-details" data-id="${item.id}" data-type="${item.type}">
@@ -437,18 +638,11 @@ class UI {
      */
     static async showItemDetails(itemId, itemType) {
         try {
-            // Récupérer les données de l'objet
-            const items = itemType === 'found' ? 
-                await Api.getFoundItems() : 
-                await Api.getLostItems();
-            
-            const item = items.find(i => i.id === itemId);
-            if (!item) {
-                throw new Error('Objet non trouvé');
-            }
+            // Récupérer l'objet et ses correspondances en une seule requête
+            const item = await Api.getItem(itemType, itemId);
             
             // Déterminer si l'objet a des correspondances
-            const hasMatches = item.possible_matches && item.possible_matches.length > 0;
+            const hasMatches = item.matches && item.matches.length > 0;
             
             // Formater la date
             const dateObj = new Date(itemType === 'found' ? item.found_date : item.lost_date);
@@ -489,9 +683,7 @@ class UI {
                 modalContent += `
                     <div class="item-details-matches">
                         <h3>Correspondances possibles</h3>
-                        <div class="match-list" id="matchList">
-                            <div class="loading">Chargement des correspondances...</div>
-                        </div>
+                        <div class="match-list" id="matchList"></div>
                     </div>
                 `;
             }
@@ -506,28 +698,15 @@ class UI {
             if (hasMatches) {
                 const matchList = document.getElementById('matchList');
                 
-                // Récupérer les objets opposés
-                const oppositeItems = itemType === 'found' ? 
-                    await Api.getLostItems() : 
-                    await Api.getFoundItems();
-                
-                // Filtrer les objets correspondants
-                const matches = oppositeItems.filter(i => item.possible_matches.includes(i.id));
-                
-                if (matches.length === 0) {
-                    matchList.innerHTML = '<div>Aucune correspondance trouvée</div>';
-                    return;
-                }
-                
-                // Afficher les correspondances
-                matchList.innerHTML = '';
-                matches.forEach(match => {
+                // Afficher les correspondances, déjà classées par pertinence
+                item.matches.forEach(match => {
                     const matchDate = new Date(itemType === 'found' ? match.lost_date : match.found_date);
                     const formattedMatchDate = matchDate.toLocaleDateString('fr-FR', CONFIG.DATE_FORMAT);
                     
                     const matchElement = document.createElement('div');
                     matchElement.className = 'match-item';
                     matchElement.innerHTML = `
+                        ${match.thumbnail_url ? `<img src="${match.thumbnail_url}" alt="${match.description}" loading="lazy">` : ''}
                         <h4>${match.description}</h4>
                         <div><strong>Date:</strong> ${formattedMatchDate}</div>
                         <div><strong>Lieu:</strong> ${match.location}</div>
@@ -558,14 +737,7 @@ class UI {
             }
             
             // Récupérer les données de l'objet
-            const items = itemType === 'found' ? 
-                await Api.getFoundItems() : 
-                await Api.getLostItems();
-            
-            const item = items.find(i => i.id === itemId);
-            if (!item) {
-                throw new Error('Objet non trouvé');
-            }
+            const item = await Api.getItem(itemType, itemId);
             
             // Remplir le formulaire
             document.getElementById('editItemId').value = itemId;
@@ -605,18 +777,11 @@ class UI {
      */
     static async showItemDetails(itemId, itemType) {
         try {
-            // Récupérer les données de l'objet
-            const items = itemType === 'found' ? 
-                await Api.getFoundItems() : 
-                await Api.getLostItems();
-            
-            const item = items.find(i => i.id === itemId);
-            if (!item) {
-                throw new Error('Objet non trouvé');
-            }
+            // Récupérer l'objet et ses correspondances en une seule requête
+            const item = await Api.getItem(itemType, itemId);
             
             // Déterminer si l'objet a des correspondances
-            const hasMatches = item.possible_matches && item.possible_matches.length > 0;
+            const hasMatches = item.matches && item.matches.length > 0;
             
             // Formater la date
             const dateObj = new Date(itemType === 'found' ? item.found_date : item.lost_date);
@@ -657,9 +822,7 @@ class UI {
                 modalContent += `
                     <div class="item-details-matches">
                         <h3>Correspondances possibles</h3>
-                        <div class="match-list" id="matchList">
-                            <div class="loading">Chargement des correspondances...</div>
-                        </div>
+                        <div class="match-list" id="matchList"></div>
                     </div>
                 `;
             }
@@ -674,28 +837,15 @@ class UI {
             if (hasMatches) {
                 const matchList = document.getElementById('matchList');
                 
-                // Récupérer les objets opposés
-                const oppositeItems = itemType === 'found' ? 
-                    await Api.getLostItems() : 
-                    await Api.getFoundItems();
-                
-                // Filtrer les objets correspondants
-                const matches = oppositeItems.filter(i => item.possible_matches.includes(i.id));
-                
-                if (matches.length === 0) {
-                    matchList.innerHTML = '<div>Aucune correspondance trouvée</div>';
-                    return;
-                }
-                
-                // Afficher les correspondances
-                matchList.innerHTML = '';
-                matches.forEach(match => {
+                // Afficher les correspondances, déjà classées par pertinence
+                item.matches.forEach(match => {
                     const matchDate = new Date(itemType === 'found' ? match.lost_date : match.found_date);
                     const formattedMatchDate = matchDate.toLocaleDateString('fr-FR', CONFIG.DATE_FORMAT);
                     
                     const matchElement = document.createElement('div');
                     matchElement.className = 'match-item';
                     matchElement.innerHTML = `
+                        ${match.thumbnail_url ? `<img src="${match.thumbnail_url}" alt="${match.description}" loading="lazy">` : ''}
                         <h4>${match.description}</h4>
                         <div><strong>Date:</strong> ${formattedMatchDate}</div>
                         <div><strong>Lieu:</strong> ${match.location}</div>
@@ -726,14 +876,7 @@ class UI {
             }
             
             // Récupérer les données de l'objet
-            const items = itemType === 'found' ? 
-                await Api.getFoundItems() : 
-                await Api.getLostItems();
-            
-            const item = items.find(i => i.id === itemId);
-            if (!item) {
-                throw new Error('Objet non trouvé');
-            }
+            const item = await Api.getItem(itemType, itemId);
             
             // Remplir le formulaire
             document.getElementById('editItemId').value = itemId;
@@ -798,8 +941,8 @@ class UI {
             // Supprimer l'objet
             await Api.deleteItem(itemId, itemType, credentials);
             
-            // Recharger la liste des objets
-            UI.loadAllItems();
+            // Mettre à jour la liste des objets
+            UI.refreshItems();
             
             // Afficher un message de succès
             UI.showToast('Objet supprimé avec succès!');
@@ -0,0 +1,77 @@
+import os
+import sys
+import tempfile
+
+# Base SQLite temporaire : à configurer avant le premier import de l'application
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATABASE_DIR = tempfile.mkdtemp(prefix="objets-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(DATABASE_DIR, 'test.db')}"
+os.environ.setdefault("MATCH_DEBOUNCE_SECONDS", "0")
+sys.path.insert(0, ROOT_DIR)
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from backend.database.db import SessionLocal, engine
+from backend.database.models import Base
+from backend.main import app
+from backend.services.cache import item_cache, list_cache
+
+# Tables conservées entre les tests (administrateur par défaut, compteurs de versions)
+PERSISTENT_TABLES = ("users", "collection_versions")
+
+
+class QueryCounter:
+    """
+    Compte les requêtes SQL exécutées par l'engine dans un bloc `with`
+    """
+    def __init__(self):
+        self.count = 0
+        self.statements = []
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement)
+
+    def __enter__(self):
+        self.count = 0
+        self.statements = []
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(engine, "before_cursor_execute", self._on_execute)
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def db(client):
+    # Chaque test part de tables d'objets vides et de caches vides
+    session = SessionLocal()
+    for table in reversed(Base.metadata.sorted_tables):
+        if table.name not in PERSISTENT_TABLES:
+            session.execute(table.delete())
+    session.commit()
+    item_cache.clear()
+    list_cache.clear()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def query_counter():
+    return QueryCounter()
+
+
+@pytest.fixture
+def admin_headers(client):
+    response = client.post("/api/login", data={"username": "admin", "password": "admin123"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
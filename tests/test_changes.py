@@ -0,0 +1,44 @@
+from backend.database.repositories import FoundItemRepository, LostItemRepository, MatchingService
+
+
+def create_pair(db):
+    """
+    Crée un objet trouvé et une déclaration qui se correspondent
+    """
+    found_item = FoundItemRepository(db).create({
+        "description": "portefeuille cuir noir",
+        "found_date": "2024-07-12",
+        "found_time": "10:00",
+        "location": "Scène A",
+        "content_info": None,
+    })
+    lost_item = LostItemRepository(db).create({
+        "description": "portefeuille noir en cuir",
+        "lost_date": "2024-07-12",
+        "lost_time": "09:30",
+        "location": "Scène A",
+        "content_info": None,
+    })
+    MatchingService(db).match_lost_item(lost_item.id)
+    return found_item.id, lost_item.id
+
+
+def summary_counts(page, item_type):
+    return {item["id"]: item["match_count"] for item in page["summaries"][item_type]}
+
+
+def test_changes_include_summaries_of_items_whose_matches_changed(client, db):
+    cursor = client.get("/api/changes").json()["next_cursor"]
+    found_id, lost_id = create_pair(db)
+
+    page = client.get("/api/changes", params={"since": cursor}).json()
+    assert summary_counts(page, "found") == {found_id: 1}
+    assert summary_counts(page, "lost") == {lost_id: 1}
+
+    # L'objet trouvé n'est pas modifié, mais sa carte doit perdre la correspondance
+    LostItemRepository(db).delete(lost_id)
+    page = client.get("/api/changes", params={"since": page["next_cursor"]}).json()
+    assert page["deleted"]["lost"] == [lost_id]
+    assert page["found"] == []
+    assert summary_counts(page, "found") == {found_id: 0}
+    assert summary_counts(page, "lost") == {}
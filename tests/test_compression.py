@@ -0,0 +1,46 @@
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.services.compression import CompressionMiddleware
+
+MIN_SIZE = 1024
+
+
+def streaming_client(chunks):
+    """
+    Client d'une application qui renvoie `chunks` en flux, derrière le middleware en gzip
+    """
+    app = FastAPI()
+
+    @app.get("/api/export")
+    async def export():
+        async def body():
+            for chunk in chunks:
+                yield chunk
+        return StreamingResponse(body(), media_type="text/csv")
+
+    app.add_middleware(
+        CompressionMiddleware, min_size=MIN_SIZE, offload_min_size=1 << 20, levels={"gzip": 6}
+    )
+    return TestClient(app)
+
+
+def get_export(chunks):
+    response = streaming_client(chunks).get("/api/export", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    return response
+
+
+def test_small_stream_is_not_compressed():
+    chunks = [b"id,description\n"] + [b"%d,sac\n" % i for i in range(12)]
+    response = get_export(chunks)
+    assert "content-encoding" not in response.headers
+    assert response.content == b"".join(chunks)
+
+
+def test_large_stream_is_compressed():
+    chunks = [b"%d,portefeuille cuir noir\n" % i for i in range(200)]
+    response = get_export(chunks)
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == b"".join(chunks)
@@ -0,0 +1,45 @@
+import time
+
+from backend.database.models import FoundItem, MATCH_STATUS_READY
+from backend.database.repositories import MatchingService
+
+CSV_CONTENT = (
+    "description;found_date;found_time;location\n"
+    "portefeuille cuir noir;2024-07-12;10:00;Scène A\n"
+    "sac à dos rouge;2024-07-12;11:00;Scène B\n"
+).encode()
+
+
+def import_found_items(client, headers):
+    response = client.post(
+        "/api/admin/import/found",
+        params={"format": "csv"},
+        files={"file": ("objets.csv", CSV_CONTENT, "text/csv")},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def match_statuses(db):
+    db.expire_all()
+    return {status for (status,) in db.query(FoundItem.match_status)}
+
+
+def test_failed_import_matching_is_resumed_in_background(client, db, admin_headers, monkeypatch):
+    match_items = MatchingService.match_items
+
+    def fail_once(self, item_type, item_ids):
+        monkeypatch.setattr(MatchingService, "match_items", match_items)
+        raise RuntimeError("base indisponible")
+    monkeypatch.setattr(MatchingService, "match_items", fail_once)
+
+    report = import_found_items(client, admin_headers)
+    assert report["imported"] == 2
+    assert report["matching_deferred"]
+
+    # Les objets importés ne restent pas en attente indéfiniment
+    deadline = time.monotonic() + 5
+    while match_statuses(db) != {MATCH_STATUS_READY} and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert match_statuses(db) == {MATCH_STATUS_READY}
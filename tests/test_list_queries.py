@@ -0,0 +1,102 @@
+from backend import main
+from backend.database.db import SessionLocal
+from backend.database.repositories import FoundItemRepository, LostItemRepository, MatchingService
+from backend.services.cache import item_cache, list_cache
+
+ITEM_COUNT = 30
+LIST_PATHS = ("/api/found", "/api/lost")
+LIST_PARAMS = ({"limit": 10}, {"all": "true"})
+
+COLORS = ("noir", "rouge", "bleu", "vert", "blanc")
+OBJECTS = ("portefeuille cuir", "sac dos", "veste pluie", "telephone coque", "casquette toile")
+
+
+def seed_items(db, count):
+    """
+    Crée `count` objets trouvés et perdus qui se correspondent, puis calcule les correspondances
+    """
+    for repo, date_field, time_field in (
+        (FoundItemRepository(db), "found_date", "found_time"),
+        (LostItemRepository(db), "lost_date", "lost_time"),
+    ):
+        repo.create_many([
+            {
+                "description": f"{OBJECTS[i % len(OBJECTS)]} {COLORS[i // len(OBJECTS) % len(COLORS)]} {i}",
+                date_field: "2024-07-12",
+                time_field: "10:00",
+                "location": "Scène A",
+                "content_info": None,
+            }
+            for i in range(count)
+        ])
+    db.commit()
+    MatchingService(db).find_matches()
+
+
+def list_query_counts(client, query_counter):
+    """
+    Nombre de requêtes SQL de chaque liste, calculée sans cache
+    """
+    counts = {}
+    for path in LIST_PATHS:
+        for params in LIST_PARAMS:
+            item_cache.clear()
+            list_cache.clear()
+            with query_counter:
+                response = client.get(path, params=params)
+            assert response.status_code == 200
+            counts[(path, tuple(params.items()))] = query_counter.count
+    return counts
+
+
+def test_list_query_count_does_not_depend_on_item_count(client, db, query_counter):
+    seed_items(db, ITEM_COUNT)
+    counts = list_query_counts(client, query_counter)
+
+    # Les listes contiennent bien des correspondances à charger
+    items = client.get("/api/found", params={"all": "true"}).json()
+    assert len(items) == ITEM_COUNT
+    assert any(item["possible_matches"] for item in items)
+
+    seed_items(db, ITEM_COUNT)
+    items = client.get("/api/lost", params={"all": "true"}).json()
+    assert len(items) == 2 * ITEM_COUNT
+
+    assert list_query_counts(client, query_counter) == counts
+
+
+def test_list_matches_are_loaded_in_one_query(client, db, query_counter):
+    seed_items(db, ITEM_COUNT)
+    for path in LIST_PATHS:
+        with query_counter:
+            client.get(path, params={"all": "true"})
+        match_queries = [
+            statement for statement in query_counter.statements if "possible_matches" in statement
+        ]
+        assert len(match_queries) == 1
+
+
+def test_item_read_before_concurrent_update_is_not_cached(db, monkeypatch):
+    seed_items(db, 1)
+    item_id = FoundItemRepository(db).get_all()[0].id
+    found_items_response = main.found_items_response
+
+    def read_then_update(read_db, items):
+        # La lecture est faite, puis une autre requête valide une modification (et son
+        # invalidation du cache) avant la mise en cache de l'état lu
+        result = found_items_response(read_db, items)
+        writer_db = SessionLocal()
+        try:
+            FoundItemRepository(writer_db).update(item_id, {"description": "sac à dos bleu"})
+        finally:
+            writer_db.close()
+        return result
+    monkeypatch.setattr(main, "found_items_response", read_then_update)
+
+    stale = main.cached_item_response(db, "found", item_id)
+    assert stale["description"] != "sac à dos bleu"
+    assert item_cache.get(("found", item_id)) is None
+
+    monkeypatch.setattr(main, "found_items_response", found_items_response)
+    db.expire_all()
+    assert main.cached_item_response(db, "found", item_id)["description"] == "sac à dos bleu"
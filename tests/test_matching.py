@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+from backend.config import get_settings
+from backend.database import repositories
+from backend.database.repositories import (
+    FoundItemRepository, LostItemRepository, MatchRepository, MatchingService
+)
+from backend.services.matching import compute_batch_matches
+
+settings = get_settings()
+
+WORDS = (
+    "portefeuille", "cuir", "noir", "rouge", "sac", "bandouliere", "veste", "pluie",
+    "telephone", "coque", "casquette", "toile", "cles", "voiture", "lunettes", "soleil",
+)
+DATES = ("2024-07-11", "2024-07-12", "2024-07-13", "2024-07-20")
+
+
+def description(rng):
+    """
+    Description de 3 à 5 mots du vocabulaire, parfois avec une faute de frappe
+    """
+    words = rng.sample(WORDS, rng.randint(3, 5))
+    if rng.random() < 0.3:
+        index = rng.randrange(len(words))
+        word = words[index]
+        position = rng.randrange(1, len(word))
+        words[index] = word[:position] + word[position + 1:]
+    return " ".join(words)
+
+
+def item_data(rng, item_type):
+    return {
+        "description": description(rng),
+        f"{item_type}_date": rng.choice(DATES),
+        f"{item_type}_time": "10:00",
+        "location": "Scène A",
+        "content_info": None,
+    }
+
+
+@pytest.fixture
+def small_top_k(monkeypatch):
+    # Un top-K étroit pour que les objets se disputent les places
+    monkeypatch.setattr(settings, "match_top_k", 2)
+
+
+@pytest.fixture
+def fixed_idf(monkeypatch):
+    # Les poids IDF dépendent de la taille de la base : chaque écriture décale un peu les
+    # scores de toutes les paires, que seule la reconstruction complète recalcule.
+    # Des poids identiques pour tous les mots isolent la règle de sélection des paires.
+    def compute(found_keywords, lost_keywords, **options):
+        options.update(corpus_frequencies={}, corpus_size=1000)
+        return compute_batch_matches(found_keywords, lost_keywords, **options)
+    monkeypatch.setattr(repositories, "compute_batch_matches", compute)
+
+
+def write_items(db, rng):
+    """
+    Import en masse d'objets trouvés, déclarations, modifications et suppressions une par une,
+    chacune suivie du calcul incrémental des correspondances
+    """
+    found_repo, lost_repo = FoundItemRepository(db), LostItemRepository(db)
+    matching_service = MatchingService(db)
+
+    found_ids = found_repo.create_many([item_data(rng, "found") for _ in range(30)])
+    db.commit()
+    matching_service.match_items("found", found_ids)
+    lost_ids = []
+    for _ in range(30):
+        lost_ids.append(lost_repo.create(item_data(rng, "lost")).id)
+        matching_service.match_lost_item(lost_ids[-1])
+    for _ in range(10):
+        found_ids.append(found_repo.create(item_data(rng, "found")).id)
+        matching_service.match_found_item(found_ids[-1])
+
+    # Les anciennes correspondances libèrent des places dans le top-K des autres objets
+    for lost_id in lost_ids[:5]:
+        lost_repo.update(lost_id, {"description": description(rng)})
+        matching_service.match_lost_item(lost_id)
+    for found_id in found_ids[:3]:
+        partner_ids = MatchRepository(db).get_match_ids("found", [found_id])[found_id]
+        found_repo.delete(found_id)
+        for lost_id in partner_ids:
+            matching_service.match_lost_item(lost_id)
+
+
+def test_incremental_matches_equal_rebuild(db, small_top_k, fixed_idf):
+    write_items(db, random.Random(7))
+    incremental_edges = MatchRepository(db).get_edges()
+    assert incremental_edges
+
+    MatchingService(db).find_matches()
+    rebuilt_edges = MatchRepository(db).get_edges()
+
+    assert incremental_edges == pytest.approx(rebuilt_edges)
+
+
+def test_written_item_matches_equal_rebuild(db, small_top_k):
+    rng = random.Random(11)
+    write_items(db, rng)
+    lost_item = LostItemRepository(db).create(item_data(rng, "lost"))
+    MatchingService(db).match_lost_item(lost_item.id)
+    incremental_edges = MatchRepository(db).get_edges("lost", lost_item.id)
+    assert incremental_edges
+
+    # Les paires de l'objet écrit sont calculées avec les poids actuels de toute la base
+    MatchingService(db).find_matches()
+    assert incremental_edges == pytest.approx(MatchRepository(db).get_edges("lost", lost_item.id))